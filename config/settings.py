@@ -3,5 +3,53 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
-BASE_URL = 'https://example.com'
-TIMEOUT = 5000
\ No newline at end of file
+BASE_URL = os.getenv('BASE_URL', 'https://example.com')
+TIMEOUT = 5000
+
+# Per-test deadline shared by all page-object calls (utils/timeout_budget.py); 0 disables it
+TEST_TIMEOUT_BUDGET_MS = float(os.getenv('TEST_TIMEOUT_BUDGET_MS', '60000'))
+
+# Negative checks (utils/settled_dom.py): an element counts as absent once the page is
+# loaded and had no DOM mutation or pending request for this long
+SETTLED_DOM_QUIET_MS = float(os.getenv('SETTLED_DOM_QUIET_MS', '100'))
+
+# Browser context pool (tests/conftest.py)
+VIEWPORT = {"width": 1920, "height": 1080}
+CONTEXT_POOL_SIZE = int(os.getenv('CONTEXT_POOL_SIZE', '4'))
+CONTEXT_POOL_MAX_USES = int(os.getenv('CONTEXT_POOL_MAX_USES', '50'))
+CONTEXT_POOL_CHECKOUT_TIMEOUT = float(os.getenv('CONTEXT_POOL_CHECKOUT_TIMEOUT', '30'))
+
+# Authenticated storage state cache
+AUTH_STATE_DIR = os.getenv('AUTH_STATE_DIR', '.auth')
+AUTH_STATE_TTL = int(os.getenv('AUTH_STATE_TTL', '1800'))
+
+# Network interception (utils/network_policy.py): auto (by suite marker), none, smoke, regression, security
+NETWORK_POLICY = os.getenv('NETWORK_POLICY', 'auto')
+
+# HAR record/replay (utils/har_replay.py): off, record, replay
+HAR_MODE = os.getenv('HAR_MODE', 'off')
+HAR_DIR = os.getenv('HAR_DIR', 'test_data/har')
+
+# Test data (utils/data_provider.py): accounts are split between xdist workers, cases feed parametrize
+USERS_FILE = os.getenv('USERS_FILE', 'test_data/users.json')
+LOGIN_CASES_FILE = os.getenv('LOGIN_CASES_FILE', 'test_data/login_cases.jsonl')
+
+# Local login app (utils/login_app.py): 'local' starts it per test process and points BASE_URL at it
+LOGIN_APP = os.getenv('LOGIN_APP', 'off')
+LOGIN_APP_LATENCY_MS = float(os.getenv('LOGIN_APP_LATENCY_MS', '0'))
+LOGIN_APP_FAILURE_RATE = float(os.getenv('LOGIN_APP_FAILURE_RATE', '0'))
+
+# Browser performance metrics on navigation (utils/page_metrics.py)
+PAGE_METRICS = os.getenv('PAGE_METRICS', 'false').lower() in ('1', 'true', 'yes')
+LOGIN_PAGE_LOAD_BUDGET_MS = float(os.getenv('LOGIN_PAGE_LOAD_BUDGET_MS', '3000'))
+
+# Failure artifacts (utils/failure_artifacts.py): screenshot + DOM captured only on failure
+FAILURE_ARTIFACTS = os.getenv('FAILURE_ARTIFACTS', 'true').lower() in ('1', 'true', 'yes')
+FAILURE_ARTIFACT_DIR = os.getenv('FAILURE_ARTIFACT_DIR', 'reports/failure-artifacts')
+FAILURE_SCREENSHOT_FORMAT = os.getenv('FAILURE_SCREENSHOT_FORMAT', 'webp')
+FAILURE_ARTIFACT_WORKERS = int(os.getenv('FAILURE_ARTIFACT_WORKERS', '2'))
+
+# Playwright tracing (utils/trace_ring.py): off, full (whole test kept on failure), ring (last TRACE_WINDOW_S seconds)
+TRACE_MODE = os.getenv('TRACE_MODE', 'off')
+TRACE_WINDOW_S = float(os.getenv('TRACE_WINDOW_S', '30'))
+TRACE_CHUNK_S = float(os.getenv('TRACE_CHUNK_S', '5'))
@@ -0,0 +1,210 @@
+"""
+Async Base Page Object Model
+asyncio counterpart of BasePage so one process can drive many pages concurrently
+"""
+import time
+from concurrent.futures import Future
+from contextlib import asynccontextmanager
+from typing import Awaitable, Callable, Dict, Iterable, Optional, TypeVar
+
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import Locator
+from pages.page_core import PageCore
+from utils.dom_probe import PROBE_SCRIPT, PageSnapshot, build_snapshot
+from utils.failure_artifacts import artifacts, screenshot_type
+from utils.logger import get_logger
+from utils.page_metrics import NavigationMetrics, capture_async as capture_page_metrics
+from utils.page_metrics import recorder as metrics_recorder
+from utils.readiness import async_wait_until_ready
+from utils.settled_dom import check_visible_async
+from utils.timeout_budget import TimeoutBudgetExceeded
+
+log = get_logger(__name__)
+
+T = TypeVar('T')
+
+
+class AsyncBasePage(PageCore):
+    """Base page with the same method surface as BasePage, built on playwright.async_api"""
+
+    async def _perform(
+        self, selector: str, action: Callable[[Locator, Optional[int]], Awaitable[T]], timeout: int = None
+    ) -> T:
+        """
+        Run an async action on the first matching element, preferring the learned alternative
+
+        A stale learned alternative costs one count() query before the full selector
+        takes over; the action gets the budget-capped timeout (see BasePage._perform).
+        """
+        with self._budget('perform', timeout) as timeout:
+            locator, preferred = self.locators.resolve(selector)
+            if not preferred:
+                return await action(locator.first, timeout)
+
+            # count() answers at once, so a stale alternative costs one query, not the timeout
+            started = time.monotonic()
+            if await locator.count():
+                try:
+                    result = await action(locator.first, timeout)
+                except PlaywrightError:
+                    timeout = self._time_left(timeout, started)
+                    if timeout is None:
+                        raise
+                else:
+                    self.locators.confirm(selector)
+                    return result
+
+            log.debug(f"Preferred alternative failed, retrying full selector: {selector}")
+            result = await action(self.locators.fallback(selector).first, timeout)
+            self.locators.demote(selector)
+            return result
+
+    @asynccontextmanager
+    async def wait_until_ready(self, action: str, timeout: int = 5000):
+        """
+        Async context manager that waits for the declared outcomes of an action
+
+        Example:
+            async with self.wait_until_ready('submit'):
+                await self.page.click(self.submit_button)
+        """
+        label = f"{type(self).__name__}.{action}"
+        with self._budget(f"wait_until_ready({action})", timeout) as timeout:
+            async with async_wait_until_ready(
+                self.page, self.expected_outcomes(action), label=label, timeout=timeout
+            ) as result:
+                yield result
+
+    async def navigate(self, url: str):
+        """Navigate to a URL"""
+        log.info(f"Navigating to: {url}")
+        with self._budget('navigate') as timeout:
+            await self.page.goto(url, wait_until='domcontentloaded', timeout=timeout)
+            if metrics_recorder.enabled:
+                await self.capture_metrics()
+
+    async def capture_metrics(self, load_timeout: int = 5000) -> NavigationMetrics:
+        """Capture browser performance metrics of the current document (see BasePage)"""
+        with self._budget('capture_metrics', load_timeout) as load_timeout:
+            try:
+                await self.page.wait_for_load_state('load', timeout=load_timeout)
+            except PlaywrightError:
+                log.debug(f"Load event not reached within {load_timeout}ms, capturing partial timings")
+            self.last_metrics = await capture_page_metrics(self.page)
+        return self.last_metrics
+
+    async def expect_navigation_under(self, ms: float, metric: str = 'load'):
+        """Assert that the last navigation was faster than a threshold (see BasePage)"""
+        metrics = self.last_metrics or await self.capture_metrics()
+        value = metrics.get(metric)
+        assert value is not None, f"Browser reported no '{metric}' timing for {metrics.url}"
+        assert value <= ms, f"{metric} of {metrics.path} took {value:.0f}ms (limit {ms:.0f}ms)"
+        log.info(f"✓ {metric} {value:.0f}ms within {ms:.0f}ms")
+
+    async def get_title(self) -> str:
+        return await self.page.title()
+
+    def get_url(self) -> str:
+        return self.page.url
+
+    async def wait_for_selector(self, selector: str, timeout: int = 5000):
+        """Wait for element to be visible"""
+        log.debug(f"Waiting for selector: {selector}")
+        with self._budget('wait_for_selector', timeout) as timeout:
+            await self._perform(selector, lambda el, timeout: el.wait_for(state='visible', timeout=timeout), timeout)
+
+    async def click(self, selector: str):
+        log.debug(f"Clicking: {selector}")
+        with self._budget('click'):
+            await self._perform(selector, lambda el, timeout: el.click(timeout=timeout))
+
+    async def fill(self, selector: str, text: str):
+        log.debug(f"Filling {selector} with: {text}")
+        with self._budget('fill'):
+            await self._perform(selector, lambda el, timeout: el.fill(text, timeout=timeout))
+
+    async def get_text(self, selector: str) -> str:
+        with self._budget('get_text'):
+            return await self._perform(selector, lambda el, timeout: el.text_content(timeout=timeout))
+
+    async def is_visible(self, selector: str) -> bool:
+        """
+        Check if element is visible, deciding absence once the page settles (see BasePage)
+
+        Returns:
+            True if visible, False otherwise
+        """
+        try:
+            with self._budget('is_visible', 2000) as timeout:
+                label = f"{type(self).__name__}.is_visible"
+                check = await check_visible_async(self.page, selector, timeout, label=label)
+                if check.state.supported:
+                    if check.visible:
+                        self.locators.learn(selector, check.state.matched)
+                    return check.visible
+
+                # Playwright-only selector syntax: plain locator check
+                locator, preferred = self.locators.resolve(selector)
+                if await locator.first.is_visible(timeout=timeout):
+                    if preferred:
+                        self.locators.confirm(selector)
+                    return True
+                if preferred and await self.locators.fallback(selector).first.is_visible(timeout=timeout):
+                    self.locators.demote(selector)
+                    return True
+                return False
+        except TimeoutBudgetExceeded:
+            raise
+        except Exception:
+            return False
+
+    async def probe(self, selectors: Dict[str, str], attributes: Iterable[str] = ()) -> PageSnapshot:
+        """Read visibility, text and attributes of many elements in one round trip"""
+        args = {'selectors': selectors, 'attributes': list(attributes), 'require': [], 'waitMode': False}
+        snapshot = build_snapshot(await self.page.evaluate(PROBE_SCRIPT, args), selectors)
+        self._learn_from(snapshot)
+
+        # Selectors using Playwright-only syntax fall back to a regular locator query
+        for state in snapshot.elements.values():
+            if not state.supported and not state.visible:
+                locator = self.page.locator(state.selector).first
+                state.visible = await locator.is_visible()
+                if state.visible:
+                    state.found = True
+                    state.text = await locator.text_content()
+
+        return snapshot
+
+    async def wait_for_all_visible(self, selectors: Dict[str, str], timeout: int = 5000) -> PageSnapshot:
+        """Wait until every selector is visible, polling inside the page"""
+        log.debug(f"Waiting for elements: {', '.join(selectors)}")
+        args = {'selectors': selectors, 'attributes': [], 'require': list(selectors), 'waitMode': True}
+        with self._budget('wait_for_all_visible', timeout) as timeout:
+            handle = await self.page.wait_for_function(PROBE_SCRIPT, arg=args, timeout=timeout, polling='raf')
+            snapshot = build_snapshot(await handle.json_value(), selectors)
+        self._learn_from(snapshot)
+        return snapshot
+
+    async def take_screenshot(self, filename: str):
+        log.info(f"Taking screenshot: {filename}")
+        await self.page.screenshot(path=filename)
+
+    async def take_screenshot_in_background(self, filename: str) -> Future:
+        """Take a screenshot; the file is written in the background (see BasePage)"""
+        log.info(f"Taking screenshot in the background: {filename}")
+        return artifacts.save_screenshot(await self.page.screenshot(type=screenshot_type(filename)), filename)
+
+    async def reload(self):
+        log.debug("Reloading page")
+        with self._budget('reload') as timeout:
+            await self.page.reload(timeout=timeout)
+
+    async def go_back(self):
+        log.debug("Navigating back")
+        with self._budget('go_back') as timeout:
+            await self.page.go_back(timeout=timeout)
+
+    async def wait_for_load_state(self, state: str = 'load'):
+        log.debug(f"Waiting for load state: {state}")
+        with self._budget('wait_for_load_state') as timeout:
+            await self.page.wait_for_load_state(state, timeout=timeout)
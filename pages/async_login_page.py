@@ -0,0 +1,220 @@
+"""
+Async Login Page Object Model
+LoginPage for playwright.async_api, plus a helper to log in many users concurrently
+"""
+import asyncio
+import time
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+from playwright.async_api import Browser, Page, expect
+from .async_base_page import AsyncBasePage
+from .login_elements import LoginElements
+from utils.dom_probe import PageSnapshot
+from utils.logger import get_logger, log_test_step
+from utils.settled_dom import check_visible_async
+from utils.timeout_budget import TimeoutBudgetExceeded
+
+log = get_logger(__name__)
+
+
+class AsyncLoginPage(LoginElements, AsyncBasePage):
+    """Login page interactions and verifications (async, same methods as LoginPage)"""
+
+    # ==================== Actions ====================
+
+    @log_test_step("Login with credentials")
+    async def login(self, username: str, password: str):
+        """
+        Perform login action
+
+        Args:
+            username: Username or email
+            password: Password
+        """
+        try:
+            log.info(f"Attempting login for user: {username}")
+
+            with self._budget('login'):
+                await self._perform(self.username_input, lambda el, timeout: el.fill(username, timeout=timeout))
+                await self._perform(self.password_input, lambda el, timeout: el.fill(password, timeout=timeout))
+
+                async with self.wait_until_ready('login', timeout=5000):
+                    await self._perform(self.login_button, lambda el, timeout: el.click(timeout=timeout))
+
+        except Exception as e:
+            log.error(f"Login failed: {str(e)}")
+            raise
+
+    async def check_remember_me(self):
+        """Check the 'Remember Me' checkbox"""
+        log.debug("Checking remember me option")
+        await self._perform(self.remember_me_checkbox, lambda el, timeout: el.check(timeout=timeout))
+
+    async def click_forgot_password(self):
+        """Click forgot password link"""
+        log.debug("Clicking forgot password link")
+        await self.click(self.forgot_password_link)
+
+    # ==================== Verifications ====================
+
+    async def is_logged_in(self) -> bool:
+        """
+        Check if user is logged in successfully
+
+        Returns:
+            True if logged in, False otherwise
+        """
+        try:
+            if self.dashboard_url in self.page.url:
+                return True
+            return await self.is_visible(self.user_menu)
+
+        except TimeoutBudgetExceeded:
+            raise
+        except Exception as e:
+            log.debug(f"Login check failed: {str(e)}")
+            return False
+
+    async def get_error_message(self) -> str | None:
+        """
+        Get error message text if displayed
+
+        Returns:
+            Error message text or None
+        """
+        try:
+            with self._budget('get_error_message', 2000) as timeout:
+                label = "AsyncLoginPage.get_error_message"
+                check = await check_visible_async(self.page, self.error_message, timeout, label=label)
+
+                if check.visible:
+                    message = check.state.text
+                    log.debug(f"Error message found: {message}")
+                    return message
+
+                return None
+
+        except TimeoutBudgetExceeded:
+            raise
+        except Exception as e:
+            log.debug(f"No error message found: {str(e)}")
+            return None
+
+    async def get_login_form_snapshot(self) -> PageSnapshot:
+        """Probe every login form element in a single browser round trip"""
+        return await self.probe(self._login_form_selectors(), attributes=['type', 'autocomplete'])
+
+    async def is_username_visible(self) -> bool:
+        return (await self.probe({'username': self.username_input}))['username'].visible
+
+    async def is_password_visible(self) -> bool:
+        return (await self.probe({'password': self.password_input}))['password'].visible
+
+    async def is_login_button_visible(self) -> bool:
+        return (await self.probe({'login_button': self.login_button}))['login_button'].visible
+
+    async def is_forgot_password_visible(self) -> bool:
+        return (await self.probe({'forgot_password': self.forgot_password_link}))['forgot_password'].visible
+
+    # ==================== Advanced Methods ====================
+
+    @log_test_step("Quick login (direct navigation + login)")
+    async def quick_login(self, username: str, password: str, base_url: str):
+        """
+        Navigate to login page and perform login in one action
+
+        Args:
+            username: Username or email
+            password: Password
+            base_url: Base URL of the application
+        """
+        with self._budget('quick_login'):
+            await self.navigate(f"{base_url}/login")
+            await self.login(username, password)
+
+    async def wait_for_login_page_load(self, timeout: int = 5000) -> PageSnapshot:
+        """Wait for the username, password and login button in one in-page poll"""
+        log.debug("Waiting for login page to load")
+        return await self.wait_for_all_visible(self._required_form_selectors(), timeout=timeout)
+
+    async def get_password_field_type(self) -> str:
+        return await self._perform(self.password_input, lambda el, timeout: el.get_attribute('type', timeout=timeout))
+
+    async def clear_login_form(self):
+        """Clear all login form fields"""
+        log.debug("Clearing login form")
+        await self._perform(self.username_input, lambda el, timeout: el.fill("", timeout=timeout))
+        await self._perform(self.password_input, lambda el, timeout: el.fill("", timeout=timeout))
+
+    # ==================== Playwright Assertions ====================
+
+    async def expect_login_success(self):
+        """Assert that login was successful using Playwright expect"""
+        with self._budget('expect_login_success', 5000) as timeout:
+            await expect(self.page).to_have_url(self.dashboard_url, timeout=timeout)
+        log.info("✓ Login successful - Redirected to dashboard")
+
+    async def expect_login_form_visible(self):
+        """Assert that username, password and login button are visible (one round trip)"""
+        snapshot = await self.get_login_form_snapshot()
+        missing = [name for name in self._required_form_selectors() if not snapshot[name].visible]
+        assert not missing, f"Login form elements not visible: {', '.join(missing)}"
+        log.info("✓ Login form displayed as expected")
+
+    async def expect_error_visible(self):
+        """Assert that error message is visible"""
+        with self._budget('expect_error_visible', 3000) as timeout:
+            await expect(self.locator(self.error_message).first).to_be_visible(timeout=timeout)
+        log.info("✓ Error message displayed as expected")
+
+
+# ==================== Concurrent Flows ====================
+
+
+class LoginAttempt(NamedTuple):
+    """Outcome of one login in a concurrent batch"""
+
+    username: str
+    logged_in: bool
+    error: Optional[str]
+    elapsed_ms: float
+
+
+async def login_concurrently(
+    browser: Browser,
+    base_url: str,
+    credentials: Iterable[Dict[str, str]],
+    concurrency: int = 20,
+) -> List[LoginAttempt]:
+    """
+    Log in many users at once, each in its own browser context
+
+    Args:
+        browser: playwright.async_api Browser
+        base_url: Base URL of the application
+        credentials: Dicts with 'username' and 'password'
+        concurrency: Maximum pages open at the same time
+
+    Returns:
+        One LoginAttempt per credential, in input order
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def attempt(user: Dict[str, str]) -> LoginAttempt:
+        async with semaphore:
+            context = await browser.new_context()
+            try:
+                page: Page = await context.new_page()
+                login_page = AsyncLoginPage(page)
+                started = time.perf_counter()
+                try:
+                    await login_page.quick_login(user['username'], user['password'], base_url)
+                except Exception as e:
+                    log.debug(f"Login attempt for {user['username']} did not settle: {e}")
+                logged_in = await login_page.is_logged_in()
+                error = None if logged_in else await login_page.get_error_message()
+                return LoginAttempt(user['username'], logged_in, error, (time.perf_counter() - started) * 1000)
+            finally:
+                await context.close()
+
+    return list(await asyncio.gather(*(attempt(user) for user in credentials)))
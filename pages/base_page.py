@@ -2,23 +2,84 @@
 Base Page Object Model
 Parent class for all page objects with common methods
 """
-from playwright.sync_api import Page
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Optional, TypeVar
+
+from playwright.sync_api import Error as PlaywrightError
+from playwright.sync_api import Locator
+from pages.page_core import PageCore
+from utils.dom_probe import PROBE_SCRIPT, PageSnapshot, build_snapshot
+from utils.failure_artifacts import artifacts, screenshot_type
 from utils.logger import get_logger
+from utils.page_metrics import NavigationMetrics, capture as capture_page_metrics
+from utils.page_metrics import recorder as metrics_recorder
+from utils.readiness import wait_until_ready
+from utils.settled_dom import check_visible
+from utils.timeout_budget import TimeoutBudgetExceeded
 
 log = get_logger(__name__)
 
+T = TypeVar('T')
+
 
-class BasePage:
+class BasePage(PageCore):
     """Base page with common functionality for all pages"""
 
-    def __init__(self, page: Page):
+    def _perform(self, selector: str, action: Callable[[Locator, Optional[int]], T], timeout: int = None) -> T:
+        """
+        Run an action on the first matching element, preferring the learned alternative
+
+        The learned alternative is only waited on if it matches something right now;
+        otherwise the full comma-separated selector gets the whole timeout, and if
+        the alternative matched but the action failed, the full selector gets what
+        is left of it. The preference is dropped once the full selector succeeds.
+        The action gets the timeout to pass on (e.g. el.click(timeout=timeout)): the
+        requested one capped by the timeout budget, or None for the page default.
+        The page default itself is never changed, so later calls (like the failure
+        screenshot) do not inherit a nearly spent budget.
+        """
+        with self._budget('perform', timeout) as timeout:
+            locator, preferred = self.locators.resolve(selector)
+            if not preferred:
+                return action(locator.first, timeout)
+
+            # count() answers at once, so a stale alternative costs one query, not the timeout
+            started = time.monotonic()
+            if locator.count():
+                try:
+                    result = action(locator.first, timeout)
+                except PlaywrightError:
+                    timeout = self._time_left(timeout, started)
+                    if timeout is None:
+                        raise
+                else:
+                    self.locators.confirm(selector)
+                    return result
+
+            log.debug(f"Preferred alternative failed, retrying full selector: {selector}")
+            result = action(self.locators.fallback(selector).first, timeout)
+            self.locators.demote(selector)
+            return result
+
+    @contextmanager
+    def wait_until_ready(self, action: str, timeout: int = 5000):
         """
-        Initialize base page
+        Context manager that waits for the declared outcomes of an action
 
         Args:
-            page: Playwright Page instance
+            action: Action name passed to expected_outcomes
+            timeout: Maximum wait in milliseconds (capped by the timeout budget)
+
+        Example:
+            with self.wait_until_ready('submit'):
+                self.page.click(self.submit_button)
         """
-        self.page = page
+        label = f"{type(self).__name__}.{action}"
+        with self._budget(f"wait_until_ready({action})", timeout) as timeout:
+            with wait_until_ready(self.page, self.expected_outcomes(action), label=label, timeout=timeout) as result:
+                yield result
 
     def navigate(self, url: str):
         """
@@ -28,7 +89,42 @@ class BasePage:
             url: URL to navigate to
         """
         log.info(f"Navigating to: {url}")
-        self.page.goto(url, wait_until='domcontentloaded')
+        with self._budget('navigate') as timeout:
+            self.page.goto(url, wait_until='domcontentloaded', timeout=timeout)
+            if metrics_recorder.enabled:
+                self.capture_metrics()
+
+    def capture_metrics(self, load_timeout: int = 5000) -> NavigationMetrics:
+        """
+        Capture browser performance metrics of the current document
+
+        Waits (up to load_timeout) for the load event so load timing and paint
+        entries are complete. Called by navigate when capture is enabled.
+
+        Returns:
+            NavigationMetrics, also kept as self.last_metrics
+        """
+        with self._budget('capture_metrics', load_timeout) as load_timeout:
+            try:
+                self.page.wait_for_load_state('load', timeout=load_timeout)
+            except PlaywrightError:
+                log.debug(f"Load event not reached within {load_timeout}ms, capturing partial timings")
+            self.last_metrics = capture_page_metrics(self.page)
+        return self.last_metrics
+
+    def expect_navigation_under(self, ms: float, metric: str = 'load'):
+        """
+        Assert that the last navigation was faster than a threshold
+
+        Args:
+            ms: Maximum allowed milliseconds
+            metric: ttfb, dom_interactive, dom_content_loaded, load, fcp or script
+        """
+        metrics = self.last_metrics or self.capture_metrics()
+        value = metrics.get(metric)
+        assert value is not None, f"Browser reported no '{metric}' timing for {metrics.url}"
+        assert value <= ms, f"{metric} of {metrics.path} took {value:.0f}ms (limit {ms:.0f}ms)"
+        log.info(f"✓ {metric} {value:.0f}ms within {ms:.0f}ms")
 
     def get_title(self) -> str:
         """
@@ -57,7 +153,8 @@ class BasePage:
             timeout: Timeout in milliseconds
         """
         log.debug(f"Waiting for selector: {selector}")
-        self.page.wait_for_selector(selector, state='visible', timeout=timeout)
+        with self._budget('wait_for_selector', timeout) as timeout:
+            self._perform(selector, lambda el, timeout: el.wait_for(state='visible', timeout=timeout), timeout)
 
     def click(self, selector: str):
         """
@@ -67,7 +164,8 @@ class BasePage:
             selector: CSS selector
         """
         log.debug(f"Clicking: {selector}")
-        self.page.click(selector)
+        with self._budget('click'):
+            self._perform(selector, lambda el, timeout: el.click(timeout=timeout))
 
     def fill(self, selector: str, text: str):
         """
@@ -78,7 +176,8 @@ class BasePage:
             text: Text to fill
         """
         log.debug(f"Filling {selector} with: {text}")
-        self.page.fill(selector, text)
+        with self._budget('fill'):
+            self._perform(selector, lambda el, timeout: el.fill(text, timeout=timeout))
 
     def get_text(self, selector: str) -> str:
         """
@@ -90,12 +189,17 @@ class BasePage:
         Returns:
             Text content
         """
-        return self.page.locator(selector).text_content()
+        with self._budget('get_text'):
+            return self._perform(selector, lambda el, timeout: el.text_content(timeout=timeout))
 
     def is_visible(self, selector: str) -> bool:
         """
         Check if element is visible
 
+        Returns as soon as the element shows up, or as soon as the page has
+        settled without it (loaded, no DOM mutation or pending request for a
+        short window), instead of waiting out the full timeout.
+
         Args:
             selector: CSS selector
 
@@ -103,10 +207,75 @@ class BasePage:
             True if visible, False otherwise
         """
         try:
-            return self.page.locator(selector).is_visible(timeout=2000)
+            with self._budget('is_visible', 2000) as timeout:
+                check = check_visible(self.page, selector, timeout, label=f"{type(self).__name__}.is_visible")
+                if check.state.supported:
+                    if check.visible:
+                        self.locators.learn(selector, check.state.matched)
+                    return check.visible
+
+                # Playwright-only selector syntax: plain locator check
+                locator, preferred = self.locators.resolve(selector)
+                if locator.first.is_visible(timeout=timeout):
+                    if preferred:
+                        self.locators.confirm(selector)
+                    return True
+                if preferred and self.locators.fallback(selector).first.is_visible(timeout=timeout):
+                    self.locators.demote(selector)
+                    return True
+                return False
+        except TimeoutBudgetExceeded:
+            raise
         except:
             return False
 
+    def probe(self, selectors: Dict[str, str], attributes: Iterable[str] = ()) -> PageSnapshot:
+        """
+        Read visibility, text and attributes of many elements in one round trip
+
+        Args:
+            selectors: Name -> selector mapping (comma fallbacks and :has-text() supported)
+            attributes: Attribute names to read from each matched element
+
+        Returns:
+            PageSnapshot keyed by the given names
+        """
+        args = {'selectors': selectors, 'attributes': list(attributes), 'require': [], 'waitMode': False}
+        snapshot = build_snapshot(self.page.evaluate(PROBE_SCRIPT, args), selectors)
+        self._learn_from(snapshot)
+
+        # Selectors using Playwright-only syntax fall back to a regular locator query
+        for state in snapshot.elements.values():
+            if not state.supported and not state.visible:
+                locator = self.page.locator(state.selector).first
+                state.visible = locator.is_visible()
+                if state.visible:
+                    state.found = True
+                    state.text = locator.text_content()
+
+        return snapshot
+
+    def wait_for_all_visible(self, selectors: Dict[str, str], timeout: int = 5000) -> PageSnapshot:
+        """
+        Wait until every selector is visible, polling inside the page
+
+        Unlike consecutive wait_for_selector calls this costs a single round trip.
+
+        Args:
+            selectors: Name -> selector mapping that must all be visible
+            timeout: Timeout in milliseconds
+
+        Returns:
+            PageSnapshot taken at the moment all elements were visible
+        """
+        log.debug(f"Waiting for elements: {', '.join(selectors)}")
+        args = {'selectors': selectors, 'attributes': [], 'require': list(selectors), 'waitMode': True}
+        with self._budget('wait_for_all_visible', timeout) as timeout:
+            handle = self.page.wait_for_function(PROBE_SCRIPT, arg=args, timeout=timeout, polling='raf')
+            snapshot = build_snapshot(handle.json_value(), selectors)
+        self._learn_from(snapshot)
+        return snapshot
+
     def take_screenshot(self, filename: str):
         """
         Take screenshot of current page
@@ -117,15 +286,33 @@ class BasePage:
         log.info(f"Taking screenshot: {filename}")
         self.page.screenshot(path=filename)
 
+    def take_screenshot_in_background(self, filename: str) -> Future:
+        """
+        Take screenshot of current page and write it without blocking the test
+
+        The browser round trip happens here; the file is written by the
+        failure-artifact worker pool.
+
+        Args:
+            filename: Screenshot filename (.jpg/.jpeg is saved as JPEG, anything else as PNG)
+
+        Returns:
+            Future resolving to the written path
+        """
+        log.info(f"Taking screenshot in the background: {filename}")
+        return artifacts.save_screenshot(self.page.screenshot(type=screenshot_type(filename)), filename)
+
     def reload(self):
         """Reload current page"""
         log.debug("Reloading page")
-        self.page.reload()
+        with self._budget('reload') as timeout:
+            self.page.reload(timeout=timeout)
 
     def go_back(self):
         """Navigate back"""
         log.debug("Navigating back")
-        self.page.go_back()
+        with self._budget('go_back') as timeout:
+            self.page.go_back(timeout=timeout)
 
     def wait_for_load_state(self, state: str = 'load'):
         """
@@ -135,4 +322,5 @@ class BasePage:
             state: Load state ('load', 'domcontentloaded', 'networkidle')
         """
         log.debug(f"Waiting for load state: {state}")
-        self.page.wait_for_load_state(state)
\ No newline at end of file
+        with self._budget('wait_for_load_state') as timeout:
+            self.page.wait_for_load_state(state, timeout=timeout)
\ No newline at end of file
@@ -0,0 +1,223 @@
+"""
+Locator Registry
+Declarative page-object selectors with lazily built, cached Playwright locators
+"""
+from typing import Dict, List, Optional, Tuple
+
+from playwright.sync_api import Locator, Page
+
+
+class Selector(str):
+    """
+    Marks a page-object class attribute as a named locator
+
+    Behaves exactly like the selector string, so existing code that passes it
+    to page.locator() keeps working.
+
+    Example:
+        class LoginPage(BasePage):
+            login_button = Selector('button[type="submit"], button:has-text("Login")')
+    """
+
+
+def split_alternatives(selector: str) -> List[str]:
+    """
+    Split a comma-separated fallback list, respecting quotes and brackets
+
+    Args:
+        selector: Selector such as 'input[name="a,b"], button:has-text("x")'
+
+    Returns:
+        List of alternative selectors
+    """
+    parts = []
+    depth = 0
+    quote = None
+    current = ''
+
+    for ch in selector:
+        if quote:
+            if ch == quote:
+                quote = None
+        elif ch in ('"', "'"):
+            quote = ch
+        elif ch in '([':
+            depth += 1
+        elif ch in ')]':
+            depth -= 1
+        elif ch == ',' and depth == 0:
+            parts.append(current.strip())
+            current = ''
+            continue
+        current += ch
+
+    if current.strip():
+        parts.append(current.strip())
+    return parts
+
+
+class LocatorStats:
+    """Per-locator counters shared by all instances of a page class"""
+
+    def __init__(self):
+        self.builds = 0  # Locator objects created
+        self.cache_hits = 0  # Cached Locator reused
+        self.preferred_hits = 0  # Learned alternative matched
+        self.preferred_misses = 0  # Learned alternative failed, fell back to the full list
+
+    def as_dict(self) -> Dict[str, int]:
+        return dict(vars(self))
+
+
+class LocatorRegistry:
+    """
+    Builds and caches Locator objects for one page-object instance
+
+    Which alternative of a comma-separated fallback list matched on this app is
+    learned (e.g. from BasePage.probe) and shared process-wide per page class, so
+    later instances query that alternative first and only fall back to the full
+    list when it stops matching.
+    """
+
+    # (page class, locator name) -> index of the alternative that matched
+    _preferred: Dict[Tuple[str, str], int] = {}
+    _stats: Dict[Tuple[str, str], LocatorStats] = {}
+    _compiled: Dict[type, Tuple[Dict[str, str], Dict[str, str], Dict[str, List[str]]]] = {}
+
+    def __init__(self, page: Page, owner: type):
+        """
+        Initialize registry
+
+        Args:
+            page: Playwright Page the locators belong to
+            owner: Page-object class declaring Selector attributes
+        """
+        self.page = page
+        self.owner = owner.__name__
+        self.definitions, self._names, self._alternatives = self._compile(owner)
+        self._cache: Dict[str, Locator] = {}
+
+    @classmethod
+    def _compile(cls, owner: type) -> Tuple[Dict[str, str], Dict[str, str], Dict[str, List[str]]]:
+        """Collect and split the Selector declarations of a page class (once per class)"""
+        compiled = cls._compiled.get(owner)
+        if compiled is None:
+            definitions = {}
+            for klass in reversed(owner.__mro__):
+                for name, value in vars(klass).items():
+                    if isinstance(value, Selector):
+                        definitions[name] = value
+
+            names = {selector: name for name, selector in definitions.items()}
+            alternatives = {name: split_alternatives(selector) for name, selector in definitions.items()}
+            compiled = cls._compiled[owner] = (definitions, names, alternatives)
+        return compiled
+
+    # ==================== Resolution ====================
+
+    def resolve(self, selector: str) -> Tuple[Locator, bool]:
+        """
+        Get the locator to use for a selector
+
+        Args:
+            selector: Declared Selector (or any ad-hoc selector string)
+
+        Returns:
+            (Locator, True if it targets the learned preferred alternative)
+        """
+        name = self._names.get(selector)
+        if name is None:
+            return self._cached(selector), False
+
+        stats = self._stats_for(name)
+        index = self._preferred.get((self.owner, name))
+        if index is None:
+            return self._cached(selector, stats), False
+        return self._cached(self._alternatives[name][index], stats), True
+
+    def get(self, selector: str) -> Locator:
+        """Get the (possibly preferred) locator for a selector"""
+        return self.resolve(selector)[0]
+
+    def fallback(self, selector: str) -> Locator:
+        """
+        Record that the preferred alternative failed and return the full-list locator
+
+        The preference is kept until the full list proves to work (see demote),
+        so a page that is simply not there yet does not unlearn it.
+
+        Args:
+            selector: Declared Selector whose preferred alternative did not match
+
+        Returns:
+            Locator for the complete fallback list
+        """
+        name = self._names.get(selector)
+        if name is not None:
+            self._stats_for(name).preferred_misses += 1
+        return self._cached(selector)
+
+    def demote(self, selector: str):
+        """Forget the preferred alternative of a declared selector (the full list matched without it)"""
+        name = self._names.get(selector)
+        if name is not None:
+            self._preferred.pop((self.owner, name), None)
+
+    def confirm(self, selector: str):
+        """Record that the preferred alternative of a declared selector matched"""
+        name = self._names.get(selector)
+        if name is not None:
+            self._stats_for(name).preferred_hits += 1
+
+    # ==================== Learning ====================
+
+    def learn(self, selector: str, index: Optional[int]):
+        """
+        Remember which alternative of a declared selector matched
+
+        Args:
+            selector: Declared Selector
+            index: Position of the matching alternative in the fallback list
+        """
+        name = self._names.get(selector)
+        if name is None or index is None or len(self._alternatives[name]) < 2:
+            return
+        self._preferred[(self.owner, name)] = index
+
+    # ==================== Internals ====================
+
+    def _cached(self, selector: str, stats: LocatorStats = None) -> Locator:
+        locator = self._cache.get(selector)
+        if locator is None:
+            locator = self._cache[selector] = self.page.locator(selector)
+            if stats:
+                stats.builds += 1
+        elif stats:
+            stats.cache_hits += 1
+        return locator
+
+    def _stats_for(self, name: str) -> LocatorStats:
+        key = (self.owner, name)
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = LocatorStats()
+        return stats
+
+    @classmethod
+    def stats(cls) -> Dict[str, Dict[str, int]]:
+        """
+        Get hit/miss statistics for every declared locator used so far
+
+        Returns:
+            Dict keyed by 'PageClass.locator_name'
+        """
+        return {f"{owner}.{name}": s.as_dict() for (owner, name), s in sorted(cls._stats.items())}
+
+    @classmethod
+    def merge_stats(cls, stats: Dict[str, Dict[str, int]]):
+        """Fold in statistics saved by another process (e.g. an xdist worker), as returned by stats()"""
+        for key, counters in stats.items():
+            owner, name = key.split('.', 1)
+            merged = cls._stats.setdefault((owner, name), LocatorStats())
+            for counter, value in counters.items():
+                setattr(merged, counter, getattr(merged, counter) + value)
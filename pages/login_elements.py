@@ -0,0 +1,65 @@
+"""
+Login Page Elements
+Selectors and readiness outcomes of the login page, shared by LoginPage and AsyncLoginPage
+"""
+from typing import Dict, List
+
+from pages.locators import Selector
+from pages.page_core import PageCore
+from utils.readiness import (
+    ReadinessStrategy,
+    ResponseMatches,
+    SelectorChanged,
+    SelectorVisible,
+    UrlContains,
+)
+
+
+class LoginElements(PageCore):
+    """Declarations of the login page, mixed into the sync and async page objects"""
+
+    # ==================== Locators ====================
+    # Use data-testid for better stability, fallback to other selectors
+    username_input = Selector('input[name="username"], input[name="email"], input[type="email"]')
+    password_input = Selector('input[name="password"], input[type="password"]')
+    login_button = Selector('button[type="submit"], button:has-text("Login"), button:has-text("Sign in")')
+    error_message = Selector('.error-message, .alert-danger, [role="alert"]')
+    forgot_password_link = Selector('a:has-text("Forgot"), a:has-text("Reset")')
+    remember_me_checkbox = Selector('input[type="checkbox"][name*="remember"]')
+
+    # Success indicators
+    dashboard_url = '/dashboard'
+    user_menu = Selector('[data-testid="user-menu"], .user-profile, .avatar')
+
+    # ==================== Readiness ====================
+
+    def expected_outcomes(self, action: str) -> List[ReadinessStrategy]:
+        """Login is done when we land on the dashboard, the user menu shows or a new error shows"""
+        if action == 'login':
+            # An error still showing from a previous attempt only counts once the form post is answered
+            submitted = ResponseMatches(lambda response: response.request.method == 'POST', 'login POST')
+            return [
+                UrlContains(self.dashboard_url),
+                SelectorChanged(self.error_message, after=submitted),
+                SelectorVisible(self.user_menu),
+            ]
+        return super().expected_outcomes(action)
+
+    # ==================== Element Groups ====================
+
+    def _login_form_selectors(self) -> Dict[str, str]:
+        """Name -> selector mapping of the login form elements"""
+        return {
+            'username': self.username_input,
+            'password': self.password_input,
+            'login_button': self.login_button,
+            'forgot_password': self.forgot_password_link,
+        }
+
+    def _required_form_selectors(self) -> Dict[str, str]:
+        """Name -> selector mapping of the fields a usable login form must show"""
+        return {
+            'username': self.username_input,
+            'password': self.password_input,
+            'login_button': self.login_button,
+        }
@@ -1,30 +1,20 @@
 """
 Login Page Object Model
-Contains all locators and methods for login page interactions
+Login page interactions and verifications (locators and outcomes live in pages.login_elements)
 """
-from playwright.sync_api import Page, expect
+from playwright.sync_api import expect
 from .base_page import BasePage
+from .login_elements import LoginElements
+from utils.dom_probe import PageSnapshot
 from utils.logger import get_logger, log_test_step
+from utils.settled_dom import check_visible
+from utils.timeout_budget import TimeoutBudgetExceeded
 
 log = get_logger(__name__)
 
 
-class LoginPage(BasePage):
-    """Login page interactions and verifications"""
-
-    # ==================== Locators ====================
-    # Use data-testid for better stability, fallback to other selectors
-    username_input = 'input[name="username"], input[name="email"], input[type="email"]'
-    password_input = 'input[name="password"], input[type="password"]'
-    login_button = 'button[type="submit"], button:has-text("Login"), button:has-text("Sign in")'
-    error_message = '.error-message, .alert-danger, [role="alert"]'
-    forgot_password_link = 'a:has-text("Forgot"), a:has-text("Reset")'
-    remember_me_checkbox = 'input[type="checkbox"][name*="remember"]'
-
-    # Success indicators
-    dashboard_url = '/dashboard'
-    user_menu = '[data-testid="user-menu"], .user-profile, .avatar'
-
+class LoginPage(LoginElements, BasePage):
+    """Login page interactions and verifications (selectors and outcomes in LoginElements)"""
 
     # ==================== Actions ====================
 
@@ -40,12 +30,13 @@ class LoginPage(BasePage):
         try:
             log.info(f"Attempting login for user: {username}")
 
-            self.page.fill(self.username_input, username)
-            self.page.fill(self.password_input, password)
-            self.page.click(self.login_button)
+            with self._budget('login'):
+                self._perform(self.username_input, lambda el, timeout: el.fill(username, timeout=timeout))
+                self._perform(self.password_input, lambda el, timeout: el.fill(password, timeout=timeout))
 
-            # Wait for navigation or error
-            self.page.wait_for_load_state('networkidle', timeout=5000)
+                # Wait for whichever outcome comes first: dashboard, user menu or a new error
+                with self.wait_until_ready('login', timeout=5000):
+                    self._perform(self.login_button, lambda el, timeout: el.click(timeout=timeout))
 
         except Exception as e:
             log.error(f"Login failed: {str(e)}")
@@ -55,13 +46,13 @@ class LoginPage(BasePage):
     def check_remember_me(self):
         """Check the 'Remember Me' checkbox"""
         log.debug("Checking remember me option")
-        self.page.check(self.remember_me_checkbox)
+        self._perform(self.remember_me_checkbox, lambda el, timeout: el.check(timeout=timeout))
 
 
     def click_forgot_password(self):
         """Click forgot password link"""
         log.debug("Clicking forgot password link")
-        self.page.click(self.forgot_password_link)
+        self.click(self.forgot_password_link)
 
 
     # ==================== Verifications ====================
@@ -76,10 +67,12 @@ class LoginPage(BasePage):
         try:
             # Check multiple indicators
             url_check = self.dashboard_url in self.page.url
-            user_menu_visible = self.page.locator(self.user_menu).is_visible()
+            user_menu_visible = self.is_visible(self.user_menu)
 
             return url_check or user_menu_visible
 
+        except TimeoutBudgetExceeded:
+            raise
         except Exception as e:
             log.debug(f"Login check failed: {str(e)}")
             return False
@@ -89,42 +82,58 @@ class LoginPage(BasePage):
         """
         Get error message text if displayed
 
+        Gives up as soon as the page has settled without an error (see
+        BasePage.is_visible), so "no error shown" checks do not wait out the timeout.
+
         Returns:
             Error message text or None
         """
         try:
-            error_locator = self.page.locator(self.error_message)
+            with self._budget('get_error_message', 2000) as timeout:
+                check = check_visible(self.page, self.error_message, timeout, label="LoginPage.get_error_message")
 
-            if error_locator.is_visible(timeout=2000):
-                message = error_locator.text_content()
-                log.debug(f"Error message found: {message}")
-                return message
+                if check.visible:
+                    message = check.state.text
+                    log.debug(f"Error message found: {message}")
+                    return message
 
-            return None
+                return None
 
+        except TimeoutBudgetExceeded:
+            raise
         except Exception as e:
             log.debug(f"No error message found: {str(e)}")
             return None
 
 
+    def get_login_form_snapshot(self) -> PageSnapshot:
+        """
+        Probe every login form element in a single browser round trip
+
+        Returns:
+            PageSnapshot with 'username', 'password', 'login_button' and 'forgot_password'
+        """
+        return self.probe(self._login_form_selectors(), attributes=['type', 'autocomplete'])
+
+
     def is_username_visible(self) -> bool:
-        """Check if username field is visible"""
-        return self.page.locator(self.username_input).is_visible()
+        """Check if username field is visible (one probe; use get_login_form_snapshot for several fields)"""
+        return self.probe({'username': self.username_input})['username'].visible
 
 
     def is_password_visible(self) -> bool:
-        """Check if password field is visible"""
-        return self.page.locator(self.password_input).is_visible()
+        """Check if password field is visible (one probe; use get_login_form_snapshot for several fields)"""
+        return self.probe({'password': self.password_input})['password'].visible
 
 
     def is_login_button_visible(self) -> bool:
-        """Check if login button is visible"""
-        return self.page.locator(self.login_button).is_visible()
+        """Check if login button is visible (one probe; use get_login_form_snapshot for several fields)"""
+        return self.probe({'login_button': self.login_button})['login_button'].visible
 
 
     def is_forgot_password_visible(self) -> bool:
-        """Check if forgot password link is visible"""
-        return self.page.locator(self.forgot_password_link).is_visible()
+        """Check if forgot password link is visible (one probe; use get_login_form_snapshot for several fields)"""
+        return self.probe({'forgot_password': self.forgot_password_link})['forgot_password'].visible
 
 
     # ==================== Advanced Methods ====================
@@ -139,16 +148,22 @@ class LoginPage(BasePage):
             password: Password
             base_url: Base URL of the application
         """
-        self.navigate(f"{base_url}/login")
-        self.login(username, password)
+        with self._budget('quick_login'):
+            self.navigate(f"{base_url}/login")
+            self.login(username, password)
+
+
+    def wait_for_login_page_load(self, timeout: int = 5000) -> PageSnapshot:
+        """
+        Wait for login page to be fully loaded
 
+        All three form elements are awaited together in one in-page poll.
 
-    def wait_for_login_page_load(self):
-        """Wait for login page to be fully loaded"""
+        Returns:
+            PageSnapshot of the username, password and login button fields
+        """
         log.debug("Waiting for login page to load")
-        self.page.wait_for_selector(self.username_input, state='visible')
-        self.page.wait_for_selector(self.password_input, state='visible')
-        self.page.wait_for_selector(self.login_button, state='visible')
+        return self.wait_for_all_visible(self._required_form_selectors(), timeout=timeout)
 
 
     def get_password_field_type(self) -> str:
@@ -158,25 +173,35 @@ class LoginPage(BasePage):
         Returns:
             Field type (should be 'password' for security)
         """
-        return self.page.locator(self.password_input).get_attribute('type')
+        return self._perform(self.password_input, lambda el, timeout: el.get_attribute('type', timeout=timeout))
 
 
     def clear_login_form(self):
         """Clear all login form fields"""
         log.debug("Clearing login form")
-        self.page.fill(self.username_input, "")
-        self.page.fill(self.password_input, "")
+        self._perform(self.username_input, lambda el, timeout: el.fill("", timeout=timeout))
+        self._perform(self.password_input, lambda el, timeout: el.fill("", timeout=timeout))
 
 
     # ==================== Playwright Assertions ====================
 
     def expect_login_success(self):
         """Assert that login was successful using Playwright expect"""
-        expect(self.page).to_have_url(self.dashboard_url, timeout=5000)
+        with self._budget('expect_login_success', 5000) as timeout:
+            expect(self.page).to_have_url(self.dashboard_url, timeout=timeout)
         log.info("✓ Login successful - Redirected to dashboard")
 
 
+    def expect_login_form_visible(self):
+        """Assert that username, password and login button are visible (one round trip)"""
+        snapshot = self.get_login_form_snapshot()
+        missing = [name for name in self._required_form_selectors() if not snapshot[name].visible]
+        assert not missing, f"Login form elements not visible: {', '.join(missing)}"
+        log.info("✓ Login form displayed as expected")
+
+
     def expect_error_visible(self):
         """Assert that error message is visible"""
-        expect(self.page.locator(self.error_message)).to_be_visible(timeout=3000)
+        with self._budget('expect_error_visible', 3000) as timeout:
+            expect(self.locator(self.error_message).first).to_be_visible(timeout=timeout)
         log.info("✓ Error message displayed as expected")
\ No newline at end of file
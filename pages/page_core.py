@@ -0,0 +1,100 @@
+"""
+Page Core
+Browser-independent parts shared by BasePage and AsyncBasePage
+"""
+import time
+from typing import List, Optional
+
+from config import settings
+from pages.locators import LocatorRegistry
+from utils.dom_probe import PageSnapshot
+from utils.page_metrics import NavigationMetrics
+from utils.readiness import ReadinessStrategy, UrlChanged
+from utils.settled_dom import track_requests
+from utils.timeout_budget import budgeted
+
+
+class PageCore:
+    """
+    Locator registry, timeout budget and readiness declarations of a page object
+
+    Nothing here talks to the browser, so the sync and async page stacks share
+    it and only differ in the methods that await Playwright.
+    """
+
+    def __init__(self, page):
+        """
+        Initialize page object
+
+        Args:
+            page: Playwright Page instance (sync or async API)
+        """
+        self.page = page
+        self.locators = LocatorRegistry(page, type(self))
+        self.last_metrics: Optional[NavigationMetrics] = None
+        track_requests(page)
+
+    def locator(self, selector: str):
+        """
+        Get a cached locator for a declared Selector or any selector string
+
+        Locator creation does not touch the browser, so this is synchronous in both stacks.
+
+        Args:
+            selector: CSS selector
+
+        Returns:
+            Playwright Locator (built once per page instance)
+        """
+        return self.locators.get(selector)
+
+    def _budget(self, operation: str, timeout: Optional[int] = None):
+        """
+        Charge a call of this page object to the running test's timeout budget
+
+        Args:
+            operation: Method name shown in the budget breakdown
+            timeout: Timeout the call would use without a budget (None: the page default)
+
+        Returns:
+            Context manager yielding the timeout to use (see utils.timeout_budget.budgeted)
+        """
+        return budgeted(f"{type(self).__name__}.{operation}", timeout)
+
+    @staticmethod
+    def _time_left(timeout: Optional[int], started: float) -> Optional[int]:
+        """
+        Milliseconds of a timeout still left after part of it was spent
+
+        Args:
+            timeout: Timeout of the whole call (None: settings.TIMEOUT)
+            started: time.monotonic() when the call started
+
+        Returns:
+            Remaining milliseconds, or None once less than 1ms is left
+        """
+        total = settings.TIMEOUT if timeout is None else timeout
+        left = total - (time.monotonic() - started) * 1000
+        return int(left) if left >= 1 else None
+
+    def expected_outcomes(self, action: str) -> List[ReadinessStrategy]:
+        """
+        Declare what signals readiness after an action on this page
+
+        Subclasses override this to describe their own post-action outcomes.
+        The default only waits for any navigation, which a redirect to an
+        error page satisfies too; it is a fallback, not a success signal.
+
+        Args:
+            action: Action name (e.g. 'login', 'submit')
+
+        Returns:
+            Fresh list of readiness strategies polled after the action
+        """
+        return [UrlChanged()]
+
+    def _learn_from(self, snapshot: PageSnapshot):
+        """Teach the locator registry which fallback alternatives matched"""
+        for state in snapshot.elements.values():
+            if state.visible and state.supported:
+                self.locators.learn(state.selector, state.matched)
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Benchmark Async Login
+Compares logins per second of the sync LoginPage (one page at a time) with
+AsyncLoginPage driving many pages concurrently, against the local login app
+"""
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from playwright.async_api import async_playwright
+from playwright.sync_api import sync_playwright
+
+from pages.async_login_page import login_concurrently
+from pages.login_page import LoginPage
+from utils.login_app import LoginAppConfig, LoginAppServer
+
+
+def make_users(count: int) -> list:
+    return [{'username': f'bench_user_{i}@example.com', 'password': f'Pass{i}!'} for i in range(count)]
+
+
+def bench_sync(base_url: str, users: list, headless: bool) -> float:
+    """Sequential logins, a fresh context per user; returns elapsed seconds"""
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=headless)
+        started = time.perf_counter()
+        for user in users:
+            context = browser.new_context()
+            login_page = LoginPage(context.new_page())
+            login_page.quick_login(user['username'], user['password'], base_url)
+            assert login_page.is_logged_in(), f"Sync login failed for {user['username']}"
+            context.close()
+        elapsed = time.perf_counter() - started
+        browser.close()
+    return elapsed
+
+
+async def bench_async(base_url: str, users: list, concurrency: int, headless: bool) -> float:
+    """Concurrent logins, a fresh context per user; returns elapsed seconds"""
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=headless)
+        started = time.perf_counter()
+        attempts = await login_concurrently(browser, base_url, users, concurrency=concurrency)
+        elapsed = time.perf_counter() - started
+        await browser.close()
+
+    failed = [a.username for a in attempts if not a.logged_in]
+    assert not failed, f"Async login failed for {failed}"
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--users', type=int, default=40, help='Number of logins per variant')
+    parser.add_argument('--concurrency', type=int, default=20, help='Pages open at once (async variant)')
+    parser.add_argument('--latency', type=float, default=50, help='Server latency per request (ms)')
+    parser.add_argument('--headed', action='store_true', help='Show the browser')
+    args = parser.parse_args()
+
+    users = make_users(args.users)
+    config = LoginAppConfig(latency_ms=args.latency)
+    config.users.update({u['username']: u['password'] for u in users})
+
+    print(f"🔐 {args.users} logins, {args.latency:.0f}ms server latency")
+    with LoginAppServer(config) as app:
+        sync_s = bench_sync(app.base_url, users, not args.headed)
+        app.reset()
+        async_s = asyncio.run(bench_async(app.base_url, users, args.concurrency, not args.headed))
+
+    sync_rate, async_rate = args.users / sync_s, args.users / async_s
+    print(f"\n{'Variant':<28}{'Seconds':>10}{'Logins/s':>12}")
+    print(f"{'sync (sequential)':<28}{sync_s:>10.2f}{sync_rate:>12.1f}")
+    print(f"{f'async (concurrency {args.concurrency})':<28}{async_s:>10.2f}{async_rate:>12.1f}")
+    print(f"\n✅ Async is {async_rate / sync_rate:.1f}x the sync throughput")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Benchmark Allure Result Ingestion
+Compares the streaming process-pool ingestion with a serial json.load loop
+on a synthetic corpus of Allure result files
+"""
+import argparse
+import json
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.allure_ingest import IngestStats, ResultAggregates, peak_rss_mb, stream_results
+
+STATUSES = ['passed'] * 85 + ['failed'] * 8 + ['skipped'] * 5 + ['broken'] * 2
+
+
+def generate_corpus(target: Path, count: int, seed: int = 42):
+    """Write `count` synthetic *-result.json files shaped like allure-pytest output"""
+    rng = random.Random(seed)
+    target.mkdir(parents=True, exist_ok=True)
+
+    for i in range(count):
+        test_uuid = str(uuid.UUID(int=rng.getrandbits(128)))
+        start = 1765790129337 + i * 1000
+        suite = rng.choice(['test_login_smoke', 'test_login_full', 'test_security'])
+        result = {
+            'uuid': test_uuid,
+            'historyId': f"{i:032x}",
+            'name': f"test_case_{i}[chromium]",
+            'fullName': f"tests.{suite}.TestLogin#test_case_{i}",
+            'status': rng.choice(STATUSES),
+            'start': start,
+            'stop': start + rng.randint(200, 8000),
+            'description': 'Synthetic benchmark result',
+            'labels': [
+                {'name': 'suite', 'value': suite},
+                {'name': 'feature', 'value': 'Authentication'},
+                {'name': 'tag', 'value': rng.choice(['smoke', 'regression', 'security'])},
+                {'name': 'framework', 'value': 'pytest'},
+            ],
+            'steps': [
+                {'name': 'Navigate to login page', 'status': 'passed', 'start': start, 'stop': start + 100},
+                {'name': 'Login with credentials', 'status': 'passed', 'start': start + 100, 'stop': start + 900},
+            ],
+            'attachments': [],
+        }
+        (target / f"{test_uuid}-result.json").write_text(json.dumps(result), encoding='utf-8')
+
+
+def run_serial(results_dir: Path) -> dict:
+    """Baseline: the previous glob + json.load loop"""
+    started = time.perf_counter()
+    totals = {'total': 0, 'tests': []}
+    for result_file in results_dir.glob("*-result.json"):
+        with open(result_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        totals['total'] += 1
+        totals['tests'].append({
+            'name': data.get('name', 'Unknown'),
+            'status': data.get('status', 'unknown'),
+            'duration': data.get('stop', 0) - data.get('start', 0),
+        })
+    elapsed = time.perf_counter() - started
+    return {'files': totals['total'], 'elapsed': elapsed}
+
+
+def run_streaming(results_dir: Path, workers: int) -> IngestStats:
+    """Streaming ingestion with single-pass aggregation"""
+    stats = IngestStats()
+    aggregates = ResultAggregates()
+    for record in stream_results(results_dir, workers=workers, stats=stats):
+        aggregates.add(record)
+    return stats
+
+
+def run_mode(mode: str, corpus: Path, workers: int):
+    """Run one ingestion mode and print its throughput (called in a fresh process)"""
+    if mode == 'serial':
+        result = run_serial(corpus)
+        print(f"   {result['files']} files in {result['elapsed']:.2f}s "
+              f"({result['files'] / result['elapsed']:.0f} files/s, peak RSS {peak_rss_mb() or 0:.1f} MB)")
+    else:
+        print(f"   {run_streaming(corpus, workers).format()}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--files', type=int, default=100_000, help='Number of synthetic result files')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: CPU count)')
+    parser.add_argument('--keep', action='store_true', help='Keep the generated corpus')
+    parser.add_argument('--corpus', type=Path, help=argparse.SUPPRESS)
+    parser.add_argument('--mode', choices=['serial', 'stream'], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        run_mode(args.mode, args.corpus, args.workers)
+        return
+
+    corpus = Path(tempfile.mkdtemp(prefix="allure-bench-"))
+    try:
+        print(f"🏗️  Generating {args.files} synthetic result files in {corpus} ...")
+        generate_corpus(corpus, args.files)
+
+        # Each mode runs in its own process so peak RSS figures are not cumulative
+        for mode, title in (('serial', 'Serial json.load loop'), ('stream', 'Streaming ingestion')):
+            print(f"\n⏱️  {title}")
+            cmd = [sys.executable, __file__, '--mode', mode, '--corpus', str(corpus)]
+            if args.workers:
+                cmd += ['--workers', str(args.workers)]
+            subprocess.run(cmd, check=True)
+    finally:
+        if args.keep:
+            print(f"\n📁 Corpus kept at: {corpus}")
+        else:
+            shutil.rmtree(corpus, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Benchmark Columnar Result Store
+Compares memory and query time of ResultStore with the previous
+list-of-dicts layout used by TestMetricsCalculator
+"""
+import argparse
+import gc
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.result_store import ResultStore
+
+STATUSES = ['passed'] * 85 + ['failed'] * 8 + ['skipped'] * 5 + ['broken'] * 2
+SUITES = ['test_login_smoke', 'test_login_full', 'test_security']
+
+
+def synthetic_rows(count: int, seed: int = 42):
+    """Yield (name, status, duration, full_name, suite, tag) tuples"""
+    rng = random.Random(seed)
+    for i in range(count):
+        suite = rng.choice(SUITES)
+        yield (
+            f"test_case_{i}[chromium]",
+            rng.choice(STATUSES),
+            rng.uniform(0.2, 8.0),
+            f"tests.{suite}.TestLogin#test_case_{i}",
+            suite,
+            rng.choice(['smoke', 'regression', 'security']),
+        )
+
+
+def build_dicts(count: int) -> list:
+    """Previous layout: one dict per test"""
+    return [
+        {'name': name, 'status': status, 'duration': duration, 'fullName': full_name}
+        for name, status, duration, full_name, _, _ in synthetic_rows(count)
+    ]
+
+
+def build_store(count: int) -> ResultStore:
+    store = ResultStore()
+    for name, status, duration, full_name, suite, tag in synthetic_rows(count):
+        store.add(name, status, duration, full_name, suite, 'Authentication', (tag,))
+    return store
+
+
+def measure(builder, count: int):
+    """Build a structure and return (object, bytes retained, seconds)"""
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    obj = builder(count)
+    elapsed = time.perf_counter() - started
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return obj, current, elapsed
+
+
+def timed(func):
+    started = time.perf_counter()
+    func()
+    return (time.perf_counter() - started) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--tests', type=int, default=100_000, help='Number of synthetic test results')
+    args = parser.parse_args()
+
+    print(f"🏗️  Building {args.tests} synthetic results in both layouts ...")
+    dicts, dict_bytes, dict_build = measure(build_dicts, args.tests)
+    store, store_bytes, store_build = measure(build_store, args.tests)
+
+    print("\n💾 Memory retained (tracemalloc)")
+    print(f"   List of dicts:  {dict_bytes / 1024 / 1024:8.1f} MB  (built in {dict_build:.2f}s)")
+    print(f"   ResultStore:    {store_bytes / 1024 / 1024:8.1f} MB  (built in {store_build:.2f}s)")
+    print(f"   Reduction:      {dict_bytes / store_bytes:8.1f}x")
+
+    print("\n⏱️  Queries (ms)")
+    queries = [
+        ('Top 5 slowest',
+         lambda: sorted(dicts, key=lambda x: x['duration'], reverse=True)[:5],
+         lambda: store.top_k_slowest(5)),
+        ('Failed tests',
+         lambda: [t for t in dicts if t['status'] == 'failed'],
+         lambda: store.with_status('failed')),
+        ('Counts by status',
+         lambda: {s: sum(1 for t in dicts if t['status'] == s) for s in ('passed', 'failed', 'skipped', 'broken')},
+         lambda: store.count_by_status()),
+        ('p50/p90/p99',
+         lambda: sorted(t['duration'] for t in dicts),
+         lambda: store.percentiles((50, 90, 99))),
+    ]
+    print(f"   {'Query':<20} {'dicts':>10} {'store':>10}")
+    for title, with_dicts, with_store in queries:
+        print(f"   {title:<20} {timed(with_dicts):>10.1f} {timed(with_store):>10.1f}")
+
+    if store_bytes >= dict_bytes:
+        print("\n❌ ResultStore did not use less memory than the dict layout")
+        sys.exit(1)
+    print("\n✅ ResultStore uses less memory than the dict layout")
+
+
+if __name__ == "__main__":
+    main()
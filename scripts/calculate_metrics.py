@@ -9,14 +9,26 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, List
 
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.allure_index import AllureResultIndex
+from utils.allure_ingest import IngestStats, stream_results
+from utils.history_analytics import HistoryAnalyzer
+from utils.result_store import ResultStore
+
 
 class TestMetricsCalculator:
     """Calculate and display test execution metrics"""
 
-    def __init__(self, project_root: Path = None):
+    def __init__(self, project_root: Path = None, use_index: bool = True):
         self.project_root = project_root or Path.cwd()
         self.allure_results = self.project_root / "reports" / "allure-results"
         self.junit_results = self.project_root / "reports" / "junit.xml"
+        self.results_index = self.project_root / "reports" / "allure-index.sqlite"
+        self.use_index = use_index
+        self.history_file = self.project_root / ".allure" / "history.jsonl"
+        self._history = None
 
     def parse_allure_results(self) -> Dict:
         """Parse Allure test results"""
@@ -24,56 +36,32 @@ class TestMetricsCalculator:
             print(f"⚠️  No Allure results found at: {self.allure_results}")
             return self._get_empty_metrics()
 
-        metrics = {
-            'total': 0,
-            'passed': 0,
-            'failed': 0,
-            'skipped': 0,
-            'broken': 0,
-            'total_duration': 0,
-            'tests': []
-        }
+        metrics = self._get_empty_metrics()
+        store = metrics['tests']
+        stats = IngestStats()
 
-        result_files = list(self.allure_results.glob("*-result.json"))
+        if self.use_index:
+            records = AllureResultIndex(self.results_index, self.allure_results).stream(stats=stats)
+        else:
+            records = stream_results(self.allure_results, stats=stats)
+
+        for record in records:
+            store.add_record(record)
+
+        for name, error in stats.errors:
+            print(f"⚠️  Failed to parse {name}: {error}")
 
-        if not result_files:
+        if stats.files == 0:
             print(f"⚠️  No test result files found in: {self.allure_results}")
             return self._get_empty_metrics()
 
-        print(f"📊 Found {len(result_files)} test result file(s)")
-
-        for result_file in result_files:
-            try:
-                with open(result_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-
-                    metrics['total'] += 1
-                    status = data.get('status', 'unknown')
-
-                    if status == 'passed':
-                        metrics['passed'] += 1
-                    elif status == 'failed':
-                        metrics['failed'] += 1
-                    elif status == 'skipped':
-                        metrics['skipped'] += 1
-                    elif status == 'broken':
-                        metrics['broken'] += 1
-
-                    # Calculate duration
-                    start = data.get('start', 0)
-                    stop = data.get('stop', 0)
-                    duration = (stop - start) / 1000 if stop > start else 0  # Convert to seconds
-                    metrics['total_duration'] += duration
-
-                    metrics['tests'].append({
-                        'name': data.get('name', 'Unknown'),
-                        'status': status,
-                        'duration': duration,
-                        'fullName': data.get('fullName', '')
-                    })
-
-            except Exception as e:
-                print(f"⚠️  Failed to parse {result_file.name}: {e}")
+        print(f"📊 Parsed {stats.format()}")
+
+        counts = store.count_by_status()
+        metrics['total'] = len(store)
+        for status in ('passed', 'failed', 'skipped', 'broken'):
+            metrics[status] = counts.get(status, 0)
+        metrics['total_duration'] = store.total_duration
 
         return metrics
 
@@ -86,7 +74,7 @@ class TestMetricsCalculator:
             'skipped': 0,
             'broken': 0,
             'total_duration': 0,
-            'tests': []
+            'tests': ResultStore()
         }
 
     def calculate_pass_rate(self, metrics: Dict) -> float:
@@ -105,16 +93,31 @@ class TestMetricsCalculator:
 
     def get_slowest_tests(self, metrics: Dict, count: int = 5) -> List[Dict]:
         """Get the slowest tests"""
-        sorted_tests = sorted(
-            metrics['tests'],
-            key=lambda x: x['duration'],
-            reverse=True
-        )
-        return sorted_tests[:count]
+        return metrics['tests'].top_k_slowest(count)
 
     def get_failed_tests(self, metrics: Dict) -> List[Dict]:
         """Get all failed tests"""
-        return [t for t in metrics['tests'] if t['status'] == 'failed']
+        return metrics['tests'].with_status('failed')
+
+    def get_duration_percentiles(self, metrics: Dict) -> Dict[str, float]:
+        """Get p50/p90/p99 test durations in seconds"""
+        return metrics['tests'].percentiles((50, 90, 99))
+
+    def get_breakdown(self, metrics: Dict, field: str = 'suite') -> Dict[str, Dict]:
+        """Get counts and durations grouped by 'suite', 'feature' or 'tag'"""
+        return metrics['tests'].group_by(field)
+
+    def analyze_history(self) -> Dict:
+        """
+        Flaky and slowed-down tests from .allure/history.jsonl (computed once)
+
+        Returns:
+            Dict with 'runs', 'tests_tracked', 'flaky' and 'slower' (empty if there is no history)
+        """
+        if self._history is None:
+            report = HistoryAnalyzer().analyze(self.history_file)
+            self._history = report or {'runs': 0, 'tests_tracked': 0, 'flaky': [], 'slower': []}
+        return self._history
 
     def print_metrics(self, metrics: Dict):
         """Print formatted metrics to console"""
@@ -144,6 +147,9 @@ class TestMetricsCalculator:
         print(f"\n⏱️  Performance:")
         print(f"   Total Duration: {metrics['total_duration']:.2f}s")
         print(f"   Average:        {avg_duration:.2f}s per test")
+        percentiles = self.get_duration_percentiles(metrics)
+        print(f"   Percentiles:    p50 {percentiles['p50']:.2f}s | p90 {percentiles['p90']:.2f}s | "
+              f"p99 {percentiles['p99']:.2f}s")
 
         # Show slowest tests
         slowest = self.get_slowest_tests(metrics, 3)
@@ -223,13 +229,16 @@ test_total_duration {metrics['total_duration']:.2f}
                 "skipped": metrics['skipped'],
                 "pass_rate": self.calculate_pass_rate(metrics),
                 "total_duration": metrics['total_duration'],
-                "avg_duration": self.calculate_avg_duration(metrics)
+                "avg_duration": self.calculate_avg_duration(metrics),
+                "duration_percentiles": self.get_duration_percentiles(metrics)
             },
+            "by_suite": self.get_breakdown(metrics, 'suite'),
             "failed_tests": [t['name'] for t in self.get_failed_tests(metrics)],
             "slowest_tests": [
                 {"name": t['name'], "duration": t['duration']}
                 for t in self.get_slowest_tests(metrics, 5)
-            ]
+            ],
+            "history": self.analyze_history()
         }
 
         with open(filepath, 'w', encoding='utf-8') as f:
@@ -243,6 +252,7 @@ test_total_duration {metrics['total_duration']:.2f}
 
         pass_rate = self.calculate_pass_rate(metrics)
         avg_duration = self.calculate_avg_duration(metrics)
+        percentiles = self.get_duration_percentiles(metrics)
 
         # Status emoji
         if pass_rate == 100:
@@ -271,6 +281,7 @@ test_total_duration {metrics['total_duration']:.2f}
 | **Pass Rate** | **{pass_rate:.1f}%** |
 | Total Duration | {metrics['total_duration']:.1f}s |
 | Avg Duration | {avg_duration:.2f}s |
+| p50 / p90 / p99 | {percentiles['p50']:.2f}s / {percentiles['p90']:.2f}s / {percentiles['p99']:.2f}s |
 
 ### Pass Rate Visualization
 ```
@@ -292,6 +303,23 @@ test_total_duration {metrics['total_duration']:.2f}
             for test in slowest:
                 content += f"- `{test['name']}` - {test['duration']:.2f}s\n"
 
+        # Add findings from run history
+        history = self.analyze_history()
+        if history['flaky']:
+            content += f"\n### 🎲 Flaky Tests (last {history['runs']} runs)\n\n"
+            content += "| Test | Runs | Flip Rate | Fail Rate |\n|------|------|-----------|-----------|\n"
+            for test in history['flaky']:
+                content += (
+                    f"| `{test['name']}` | {test['runs']} | {test['flip_rate']:.0%} | {test['fail_rate']:.0%} |\n"
+                )
+
+        if history['slower']:
+            content += "\n### 📈 Duration Regressions\n\n"
+            content += "| Test | Baseline | Now (EWMA) | Change |\n|------|----------|------------|--------|\n"
+            for test in history['slower']:
+                content += (f"| `{test['name']}` | {test['baseline_ms'] / 1000:.2f}s | "
+                            f"{test['ewma_ms'] / 1000:.2f}s | {test['ratio']:.2f}x |\n")
+
         filepath.write_text(content, encoding='utf-8')
         print(f"💾 Markdown summary saved to: {filepath}")
 
@@ -41,18 +41,10 @@ def main():
 
     # Generate all formats
     print(f"\n📝 Generating reports with template: {report_template}")
-    generator.generate_all_formats(template=report_template)
-
-    # Generate additional formats
-    print("\n📄 Generating additional report variants...")
-
-    # Executive summary
-    results = generator.parse_allure_results()
-    if results:
-        exec_content = generator.generate_markdown_report(results, template="executive")
-        exec_file = generator.save_markdown_report(exec_content, "executive_summary.md")
-        generator.convert_with_pandoc(exec_file, "html")
-        generator.convert_with_pandoc(exec_file, "docx")
+    # Main report and executive summary are converted in one concurrent batch
+    results = generator.generate_all_formats(template=report_template, executive_formats=("html", "docx"))
+    if not results:
+        sys.exit(1)
 
     # Print summary
     print("\n" + "=" * 60)
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Merge Allure Results
+Combines the reports/allure-results of several CI shards (or reruns) into one
+dataset, keeping a single result per test so metrics are not double counted
+"""
+import argparse
+import os
+import shutil
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.allure_ingest import IngestStats, ResultRecord, iter_result_files, parse_paths
+
+
+def pick_latest(inputs: List[Path], stats: IngestStats) -> Tuple[Dict[str, str], List[str]]:
+    """
+    Choose one result file per test across all inputs
+
+    Results are grouped by historyId (uuid when missing); the one that
+    finished last wins, so a retried test counts once with its final status.
+
+    Returns:
+        (historyId -> winning file path, superseded file paths)
+    """
+    best: Dict[str, Tuple[ResultRecord, str]] = {}
+    superseded = []
+    paths = (path for directory in inputs for path in iter_result_files(directory))
+    for path, record in parse_paths(paths, stats=stats):
+        key = record.history_id or record.uuid
+        current = best.get(key)
+        if current is None:
+            best[key] = (record, path)
+        elif (record.stop, record.start) > (current[0].stop, current[0].start):
+            superseded.append(current[1])
+            best[key] = (record, path)
+        else:
+            superseded.append(path)
+    return {key: path for key, (_, path) in best.items()}, superseded
+
+
+def merge(inputs: List[Path], output: Path) -> Dict[str, int]:
+    """
+    Merge result directories into output (output may be one of the inputs)
+
+    Args:
+        inputs: Allure results directories
+        output: Destination directory
+
+    Returns:
+        Dict with counts: results, duplicates, other_files, errors
+    """
+    output.mkdir(parents=True, exist_ok=True)
+    output_resolved = output.resolve()
+    stats = IngestStats()
+    winners, superseded = pick_latest(inputs, stats)
+
+    for path in superseded:
+        target = output / os.path.basename(path)
+        if target.exists() and target.resolve() == Path(path).resolve():
+            target.unlink()
+    for path in winners.values():
+        if Path(path).parent.resolve() != output_resolved:
+            shutil.copy2(path, output / os.path.basename(path))
+
+    # Containers, attachments and environment/executor/categories files
+    other_files = 0
+    for directory in inputs:
+        if directory.resolve() == output_resolved:
+            continue
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_file() and not entry.name.endswith("-result.json"):
+                    target = output / entry.name
+                    if not target.exists():
+                        shutil.copy2(entry.path, target)
+                        other_files += 1
+
+    return {
+        'results': len(winners),
+        'duplicates': len(superseded),
+        'other_files': other_files,
+        'errors': len(stats.errors),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('inputs', nargs='*', type=Path, default=[Path("reports/allure-results")],
+                        help='Allure results directories (default: reports/allure-results)')
+    parser.add_argument('--output', type=Path, default=Path("reports/allure-results"),
+                        help='Merged results directory (may be one of the inputs)')
+    args = parser.parse_args()
+
+    inputs = [d for d in args.inputs if d.is_dir()]
+    if not inputs:
+        print("⚠️  No Allure results directories found")
+        sys.exit(0)
+
+    directories = f"{len(inputs)} director{'y' if len(inputs) == 1 else 'ies'}"
+    print(f"🔀 Merging Allure results from {directories} into {args.output}")
+    counts = merge(inputs, args.output)
+    print(f"✅ {counts['results']} unique results, {counts['duplicates']} duplicates dropped, "
+          f"{counts['other_files']} other files copied")
+    if counts['errors']:
+        print(f"⚠️  {counts['errors']} result file(s) could not be parsed and were left as they are")
+
+
+if __name__ == "__main__":
+    main()
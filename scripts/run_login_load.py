@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Run Login Load Test
+Drives the LoginPage flow with many concurrent browser contexts and writes
+reports/load/login_load.json and .md (picked up by TestReportGenerator)
+"""
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from playwright.async_api import async_playwright
+
+from config import settings
+from utils.load_runner import LoadProfile, LoginLoadRunner, save_result
+from utils.login_app import DEFAULT_USERS, LoginAppConfig, LoginAppServer
+
+
+def load_credentials(path: Path) -> list:
+    """Credentials from a JSON list of {'username', 'password'} (or {'users': [...]})"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    users = data.get('users', []) if isinstance(data, dict) else data
+    return [{'username': u['username'], 'password': u['password']} for u in users if 'password' in u]
+
+
+async def run(base_url: str, credentials: list, profile: LoadProfile, headless: bool):
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=headless)
+        try:
+            runner = LoginLoadRunner(browser, base_url, credentials, {"viewport": settings.VIEWPORT})
+            return await runner.run(profile)
+        finally:
+            await browser.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--attempts', type=int, default=100, help='Total login attempts')
+    parser.add_argument('--rate', type=float, default=5.0, help='Attempts started per second after ramp-up')
+    parser.add_argument('--ramp-up', type=float, default=10.0, help='Seconds to ramp from 0 to --rate')
+    parser.add_argument('--concurrency', type=int, default=20, help='Browser contexts open at once')
+    parser.add_argument('--timeout', type=int, default=10000, help='Per-attempt timeout (ms)')
+    parser.add_argument('--users-file', type=Path, help='JSON credentials file (default: built-in test users)')
+    parser.add_argument('--local', action='store_true', help='Run against the local login app instead of BASE_URL')
+    parser.add_argument('--latency', type=float, default=0, help='Local app latency per request (ms)')
+    parser.add_argument('--output', type=Path, default=Path("reports/load"), help='Output directory')
+    parser.add_argument('--max-error-rate', type=float, default=0.05, help='Exit 1 above this error rate')
+    parser.add_argument('--headed', action='store_true', help='Show the browser')
+    args = parser.parse_args()
+
+    credentials = load_credentials(args.users_file) if args.users_file else [
+        {'username': username, 'password': password} for username, password in DEFAULT_USERS.items()
+    ]
+    if not credentials:
+        print("❌ No credentials to log in with")
+        sys.exit(1)
+
+    profile = LoadProfile(
+        attempts=args.attempts,
+        arrival_rate=args.rate,
+        ramp_up_s=args.ramp_up,
+        max_concurrency=args.concurrency,
+        timeout_ms=args.timeout,
+    )
+
+    app = None
+    base_url = settings.BASE_URL
+    if args.local:
+        app = LoginAppServer(LoginAppConfig(latency_ms=args.latency)).start()
+        base_url = app.base_url
+
+    print(f"🏋️ Login load: {args.attempts} attempts, {args.rate:g}/s, {args.concurrency} contexts → {base_url}")
+    try:
+        result = asyncio.run(run(base_url, credentials, profile, not args.headed))
+    finally:
+        if app is not None:
+            app.stop()
+
+    paths = save_result(result, args.output)
+    data = result.to_dict()
+    print(f"\n✅ {data['attempts']} attempts in {data['elapsed_s']:.1f}s ({data['throughput_per_s']:.1f}/s)")
+    print("   Outcomes: " + ", ".join(f"{k} {v}" for k, v in data['outcomes'].items()))
+    p = data['latency']['percentiles_ms']
+    print(f"   Latency: p50 {p['p50']:.0f}ms, p95 {p['p95']:.0f}ms, p99 {p['p99']:.0f}ms")
+    print(f"📄 {paths['json']}\n📄 {paths['markdown']}")
+
+    sys.exit(1 if data['error_rate'] > args.max_error_rate else 0)
+
+
+if __name__ == "__main__":
+    main()
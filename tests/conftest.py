@@ -1,25 +1,685 @@
+import asyncio
+import copy
+import json
+import os
+from pathlib import Path
+
+import allure
 import pytest
-from playwright.sync_api import Page
+from playwright.sync_api import Browser, BrowserContext, Page
+
+from config import settings
+from pages.async_login_page import AsyncLoginPage
+from pages.locators import LocatorRegistry
+from pages.login_page import LoginPage
+from utils.async_runner import AsyncBrowserSession, AsyncRunner
+from utils.auth_state import StorageStateCache
+from utils.context_pool import BrowserContextPool, format_usage, merge_usage
+from utils.data_provider import AccountPool, worker_partition
+from utils.duration_scheduler import build_plugin as build_history_scheduler
+from utils.duration_scheduler import load_estimates
+from utils.failure_artifacts import artifacts as failure_artifacts
+from utils.failure_artifacts import capture_step_failure
+from utils.har_replay import HarRecorder, HarReplayer, har_path, replay_index_for
+from utils.logger import on_step_failure, on_step_start, shutdown_logging
+from utils.login_app import DEFAULT_USERS, LoginAppConfig, LoginAppServer
+from utils.network_policy import NetworkInterceptor, NetworkStats, resolve_policy
+from utils.network_policy import session_stats as network_session_stats
+from utils.page_metrics import recorder as page_metrics_recorder
+from utils.readiness import recorder as readiness_recorder
+from utils.settled_dom import recorder as negative_check_recorder
+from utils.sharding import SHARD_MODES, ShardingPlugin
+from utils.step_timing import StepProfile, begin_test, end_test
+from utils.step_timing import profile as step_profile
+from utils.timeout_budget import start_budget, stop_budget
+from utils.trace_ring import tracer
+
+context_pool_key = pytest.StashKey[BrowserContextPool]()
+login_app_key = pytest.StashKey[LoginAppServer]()
+har_unmatched = []
+
+STEP_PROFILE_DIR = Path("reports/step-profile")
+SESSION_STATS_DIR = Path("reports/session-stats")
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--schedule-by-history",
+        action="store_true",
+        default=False,
+        help="Order tests and pack xdist workers by durations from earlier runs (recent failures first)",
+    )
+    parser.addoption("--shard-index", type=int, default=1, help="Shard to run, 1-based (e.g. $CI_NODE_INDEX)")
+    parser.addoption("--shard-total", type=int, default=1, help="Number of shards (e.g. $CI_NODE_TOTAL)")
+    parser.addoption(
+        "--shard-mode",
+        choices=SHARD_MODES,
+        default="hash",
+        help="hash: a test never changes shard; duration: balance shards by predicted duration "
+             "(every job must read the same history, e.g. the committed .allure/history.jsonl)",
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    """Load duration history before allure-pytest cleans the results directory"""
+    if config.getoption("--schedule-by-history") and not hasattr(config, "workerinput"):
+        config.pluginmanager.register(build_history_scheduler(config.rootpath), "history-scheduler")
+
+    index, total = config.getoption("--shard-index"), config.getoption("--shard-total")
+    if total > 1:
+        if not 1 <= index <= total:
+            raise pytest.UsageError(f"--shard-index must be between 1 and {total}, got {index}")
+        mode = config.getoption("--shard-mode")
+        # Every job and xdist worker must compute the same split, so estimate from the
+        # committed history only, not from this machine's results directory or index
+        estimates = load_estimates(config.rootpath, scan_results=False) if mode == "duration" else None
+        config.pluginmanager.register(ShardingPlugin(index, total, mode, estimates), "sharding")
+
+    page_metrics_recorder.enabled = settings.PAGE_METRICS
+    negative_check_recorder.configure(quiet_ms=settings.SETTLED_DOM_QUIET_MS)
+    failure_artifacts.configure(
+        Path(settings.FAILURE_ARTIFACT_DIR),
+        image_format=settings.FAILURE_SCREENSHOT_FORMAT,
+        workers=settings.FAILURE_ARTIFACT_WORKERS,
+        enabled=settings.FAILURE_ARTIFACTS,
+    )
+    on_step_failure(capture_step_failure)
+    tracer.configure(settings.TRACE_MODE, window_s=settings.TRACE_WINDOW_S, chunk_s=settings.TRACE_CHUNK_S)
+    on_step_start(tracer.maybe_rotate)
+
+    # Per-worker step profiles and statistics of the previous run must not be merged into this one
+    if not hasattr(config, "workerinput"):
+        for stale in [*STEP_PROFILE_DIR.glob("*.json"), *SESSION_STATS_DIR.glob("*.json")]:
+            stale.unlink()
+
+    # The xdist controller runs no tests; every worker starts its own app
+    if settings.LOGIN_APP == "local" and not (getattr(config.option, "numprocesses", None)
+                                              and not hasattr(config, "workerinput")):
+        app = _start_login_app()
+        config.stash[login_app_key] = app
+        # Set before test modules are imported, so `from config.settings import BASE_URL` sees it too
+        settings.BASE_URL = app.base_url
+
+
+def pytest_unconfigure(config):
+    app = config.stash.get(login_app_key, None)
+    if app is not None:
+        app.stop()
+
+
+def _start_login_app() -> LoginAppServer:
+    # The app knows every 'local' account of the users dataset
+    accounts = AccountPool(settings.USERS_FILE)
+    config = LoginAppConfig(
+        users={**DEFAULT_USERS, **accounts.credentials('standard', tags=['local'])},
+        locked_users=set(accounts.credentials('locked', tags=['local'])),
+        latency_ms=settings.LOGIN_APP_LATENCY_MS,
+        failure_rate=settings.LOGIN_APP_FAILURE_RATE,
+    )
+    return LoginAppServer(config).start()
+
+
+@pytest.fixture(scope="session")
+def login_app_server(pytestconfig):
+    """
+    Local login application for this test process
+
+    Reuses the app started for LOGIN_APP=local, otherwise starts one on a
+    free port for the session.
+
+    Yields:
+        LoginAppServer (use .base_url)
+    """
+    app = pytestconfig.stash.get(login_app_key, None)
+    if app is not None:
+        yield app
+        return
+
+    app = _start_login_app()
+    yield app
+    app.stop()
+
+
+@pytest.fixture(scope="session")
+def user_accounts(pytestconfig) -> AccountPool:
+    """
+    Accounts of settings.USERS_FILE, sliced for this xdist worker and CI shard
+
+    Parallel workers never log in with the same account, so server-side
+    sessions and lockout counters do not collide. Use .take(role, tags=[...]).
+    """
+    slot, slots = worker_partition(pytestconfig.getoption("--shard-index"), pytestconfig.getoption("--shard-total"))
+    return AccountPool(settings.USERS_FILE, slot, slots)
+
+
+@pytest.fixture(scope="function")
+def login_app(login_app_server: LoginAppServer):
+    """
+    Local login application with sessions, failed attempts and lockouts reset for this test
+
+    Changes a test makes to login_app.config (latency, failure rate, lockout
+    threshold, users and locked users, also when mutated in place) are undone afterwards.
+    """
+    saved = copy.deepcopy(vars(login_app_server.config))
+    login_app_server.reset()
+    yield login_app_server
+    vars(login_app_server.config).update(saved)
+
+
+@pytest.fixture(scope="function", autouse=True)
+def step_timings(request):
+    """
+    Collect the test's log_test_step tree and attach it to the Allure result
+
+    Yields:
+        Root StepNode of the test (children are the timed page-object steps)
+    """
+    root, token, started = begin_test(request.node.nodeid)
+    yield root
+    end_test(root, token, started)
+
+    if root.children:
+        allure.attach(
+            json.dumps(root.to_dict(), indent=2),
+            name="Step timings",
+            attachment_type=allure.attachment_type.JSON,
+        )
+
+
+@pytest.fixture(scope="function", autouse=True)
+def timeout_budget(request):
+    """
+    Cap the test's page-object calls by one deadline (settings.TEST_TIMEOUT_BUDGET_MS)
+
+    Every page-object timeout is taken from what is left, so a broken page
+    fails the test once the budget is spent instead of after the sum of all
+    timeouts. The breakdown of an exhausted budget is attached to the Allure result.
+
+    Yields:
+        TimeoutBudget, or None when budgeting is disabled
+    """
+    if settings.TEST_TIMEOUT_BUDGET_MS <= 0:
+        yield None
+        return
+
+    budget, token = start_budget(
+        settings.TEST_TIMEOUT_BUDGET_MS, default_ms=settings.TIMEOUT, label=request.node.nodeid
+    )
+    yield budget
+    stop_budget(token)
+
+    if budget.exhausted:
+        allure.attach(
+            json.dumps(budget.to_dict(), indent=2),
+            name="Timeout budget",
+            attachment_type=allure.attachment_type.JSON,
+        )
+
+
+@pytest.fixture(scope="function", autouse=True)
+def negative_checks():
+    """
+    Count the test's settled-DOM visibility checks and the wait time they saved
+
+    Yields:
+        NegativeCheckRecorder; the test's counters are attached to the Allure result
+    """
+    negative_check_recorder.begin_test()
+    yield negative_check_recorder
+    counters = negative_check_recorder.end_test()
+
+    if counters.get('checks'):
+        allure.attach(
+            json.dumps({name: round(value, 1) for name, value in counters.items()}, indent=2),
+            name="Negative checks",
+            attachment_type=allure.attachment_type.JSON,
+        )
+
+
+@pytest.fixture(scope="function", autouse=True)
+def page_metrics():
+    """
+    Collect browser performance metrics of the test's navigations (settings.PAGE_METRICS)
+
+    Yields:
+        PageMetricsRecorder; the captured navigations are attached to the Allure result
+    """
+    page_metrics_recorder.begin_test()
+    yield page_metrics_recorder
+    captured = page_metrics_recorder.end_test()
+
+    if captured:
+        allure.attach(
+            json.dumps([metrics.to_dict() for metrics in captured], indent=2),
+            name="Page performance metrics",
+            attachment_type=allure.attachment_type.JSON,
+        )
+
+
+@pytest.fixture(scope="session")
+def context_pool(pytestconfig, browser: Browser, browser_context_args: dict):
+    """
+    Session-wide pool of pre-warmed browser contexts
+
+    Args:
+        browser: Playwright browser instance
+        browser_context_args: Context options from pytest-playwright
+
+    Yields:
+        BrowserContextPool shared by all tests in this worker
+    """
+    pool = BrowserContextPool(
+        browser,
+        max_size=settings.CONTEXT_POOL_SIZE,
+        max_uses=settings.CONTEXT_POOL_MAX_USES,
+        context_options={**browser_context_args, "viewport": settings.VIEWPORT},
+        default_timeout=settings.TIMEOUT,
+        checkout_timeout=settings.CONTEXT_POOL_CHECKOUT_TIMEOUT,
+    )
+    pytestconfig.stash[context_pool_key] = pool
+
+    yield pool
+
+    pool.close()
 
 
 @pytest.fixture(scope="function")
-def setup(page: Page):
+def network_interceptor(request):
+    """
+    Per-test network policy chosen from the suite marker (settings.NETWORK_POLICY)
+
+    Blocked/stubbed request counts are attached to the Allure result (the
+    bytes-saved estimate is only reported as a session total).
+
+    Yields:
+        NetworkInterceptor (attaches nothing for unmarked tests)
+    """
+    interceptor = NetworkInterceptor(resolve_policy(request.node, settings.NETWORK_POLICY), settings.BASE_URL)
+
+    yield interceptor
+
+    stats = interceptor.stats
+    network_session_stats.add(stats)
+    if stats.blocked or stats.stubbed:
+        allure.attach(
+            json.dumps({"policy": interceptor.policy.name, **stats.counts()}, indent=2),
+            name="Network policy",
+            attachment_type=allure.attachment_type.JSON,
+        )
+
+
+@pytest.fixture(scope="function")
+def har_traffic(request):
+    """
+    HAR recorder or replayer for this test (settings.HAR_MODE)
+
+    record: traffic is written to HAR_DIR/<test id>.har at teardown.
+    replay: requests are served from that file (or from every recording in
+    HAR_DIR when the test has none); unmatched requests get a 404 and are
+    attached to the Allure result.
+
+    Yields:
+        HarRecorder, HarReplayer or None when HAR_MODE is 'off'
+    """
+    path = har_path(Path(settings.HAR_DIR), request.node.nodeid)
+    if settings.HAR_MODE == "record":
+        handler = HarRecorder()
+    elif settings.HAR_MODE == "replay":
+        handler = HarReplayer(replay_index_for(path, Path(settings.HAR_DIR)))
+    else:
+        handler = None
+
+    yield handler
+
+    if isinstance(handler, HarRecorder):
+        handler.save(path)
+    elif isinstance(handler, HarReplayer) and handler.unmatched:
+        har_unmatched.extend((request.node.nodeid, entry) for entry in handler.unmatched)
+        allure.attach(
+            "\n".join(handler.unmatched),
+            name="Requests missing from HAR archive",
+            attachment_type=allure.attachment_type.TEXT,
+        )
+
+
+@pytest.fixture(scope="function")
+def instrument_context(request, har_traffic, network_interceptor: NetworkInterceptor):
+    """
+    Callable that installs HAR record/replay, the network policy and tracing (settings.TRACE_MODE) on a context
+
+    The policy route is added last so it runs first: blocked resources are
+    neither recorded nor looked up in the archive.
+    """
+    def _instrument(context: BrowserContext):
+        if har_traffic is not None:
+            har_traffic.attach(context)
+        network_interceptor.attach(context)
+        tracer.attach(context, request.node.nodeid)
+
+    return _instrument
+
+
+@pytest.fixture(scope="function")
+def context(context: BrowserContext, instrument_context):
+    """pytest-playwright context with HAR record/replay and the test's network policy installed"""
+    instrument_context(context)
+    yield context
+
+
+@pytest.fixture(scope="function")
+def setup(context_pool: BrowserContextPool, instrument_context):
     """
     Setup fixture for each test
 
     Args:
-        page: Playwright page instance
+        context_pool: Pool of pre-warmed browser contexts
+        instrument_context: Installs HAR record/replay and the network policy
+
+    Yields:
+        Page from a pooled context (viewport and default timeout already set)
+    """
+    with context_pool.lease() as page:
+        # The pool drops all routes on check-in, so they are installed per lease
+        instrument_context(page.context)
+        yield page
+
+
+@pytest.fixture(scope="session")
+def auth_state_cache() -> StorageStateCache:
+    """Session-level cache of authenticated storage states shared across xdist workers"""
+    return StorageStateCache(Path(settings.AUTH_STATE_DIR), ttl=settings.AUTH_STATE_TTL)
+
+
+@pytest.fixture(scope="function")
+def logged_in_page(
+    browser: Browser,
+    browser_context_args: dict,
+    auth_state_cache: StorageStateCache,
+    instrument_context,
+):
+    """
+    Factory fixture returning a LoginPage already authenticated as the given user
+
+    The first request per user performs a real UI login; later requests inject the
+    cached storage state into a new context. A cached state that no longer passes
+    LoginPage.is_logged_in is invalidated and refreshed once.
+
+    Yields:
+        Callable (username, password, base_url=BASE_URL) -> LoginPage
+    """
+    context_options = {**browser_context_args, "viewport": settings.VIEWPORT}
+    contexts = []
+
+    def _open(username: str, password: str, base_url: str = settings.BASE_URL) -> LoginPage:
+        for _ in range(2):
+            state = auth_state_cache.get_or_login(
+                browser, base_url, username, password, context_options, prepare_context=instrument_context
+            )
+            context = browser.new_context(**context_options, storage_state=str(state))
+            context.set_default_timeout(settings.TIMEOUT)
+            instrument_context(context)
+            contexts.append(context)
+
+            login_page = LoginPage(context.new_page())
+            login_page.navigate(f"{base_url}{LoginPage.dashboard_url}")
+            if login_page.is_logged_in():
+                return login_page
+
+            auth_state_cache.invalidate(base_url, username)
+
+        raise AssertionError(f"Could not restore an authenticated session for user {username}")
+
+    yield _open
+
+    for context in contexts:
+        context.close()
+
+
+@pytest.fixture(scope="session")
+def async_runner() -> AsyncRunner:
+    """Background event loop for async page objects (see utils.async_runner)"""
+    runner = AsyncRunner()
+    yield runner
+    runner.close()
+
+
+@pytest.fixture(scope="session")
+def async_browser(async_runner: AsyncRunner, browser_name: str, browser_type_launch_args: dict):
+    """
+    playwright.async_api browser launched with the same options as pytest-playwright's
 
     Yields:
-        Configured page object
+        async Browser; drive it through async_runner.run(...)
     """
-    # Setup code here
-    page.set_viewport_size({"width": 1920, "height": 1080})
-    page.set_default_timeout(5000)
+    session = AsyncBrowserSession(async_runner, browser_name, browser_type_launch_args).start()
+    yield session.browser
+    session.stop()
+
+
+@pytest.fixture(scope="function")
+def async_login_pages(async_runner: AsyncRunner, async_browser, browser_context_args: dict):
+    """
+    Factory fixture opening N AsyncLoginPage objects, each in its own context
+
+    HAR record/replay and network policies are not installed: their route
+    handlers are written for the sync API.
+
+    Yields:
+        Callable (count) -> list of AsyncLoginPage
+    """
+    context_options = {**browser_context_args, "viewport": settings.VIEWPORT}
+    contexts = []
+
+    async def _new_page() -> AsyncLoginPage:
+        context = await async_browser.new_context(**context_options)
+        context.set_default_timeout(settings.TIMEOUT)
+        contexts.append(context)
+        return AsyncLoginPage(await context.new_page())
+
+    async def _open_many(count: int):
+        return list(await asyncio.gather(*(_new_page() for _ in range(count))))
+
+    yield lambda count: async_runner.run(_open_many(count))
+
+    async def _close_all():
+        await asyncio.gather(*(context.close() for context in contexts), return_exceptions=True)
+
+    async_runner.run(_close_all())
+
+
+def _pages_of(item) -> list:
+    """Open pages reachable from a test's fixtures (Page or page-object values)"""
+    pages = []
+    for value in item.funcargs.values():
+        page = value if isinstance(value, Page) else getattr(value, "page", None)
+        if isinstance(page, Page) and not page.is_closed() and page not in pages:
+            pages.append(page)
+    return pages
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """
+    Capture failure artifacts while the test's pages are still open
+
+    call: a failing test gets a screenshot and DOM of each of its pages
+    (unless a failing log_test_step already captured them) and keeps the
+    buffered part of its trace; a passing test's trace is discarded.
+    teardown: the encoded artifacts are attached to the Allure result.
+    """
+    if call.when == "teardown":
+        _finish_traces(item, failed=False)  # traces left running by a setup error
+        for artifact in failure_artifacts.collect():
+            allure.attach.file(
+                str(artifact.path), name=artifact.name,
+                attachment_type=artifact.mime_type, extension=artifact.extension,
+            )
+
+    outcome = yield
+    report = outcome.get_result()
+
+    if report.when == "call":
+        error = call.excinfo.value if call.excinfo else None
+        if failure_artifacts.enabled and report.failed and not getattr(error, "_failure_artifacts", False):
+            for page in _pages_of(item):
+                failure_artifacts.capture(page, item.nodeid)
+        _finish_traces(item, failed=report.failed)
+
+
+def _finish_traces(item, failed: bool):
+    for part, chunk in enumerate(tracer.finish(failed), 1):
+        failure_artifacts.queue_trace(chunk, item.nodeid, part)
+
+
+def _save_worker_stats(config, path: Path):
+    """Save this worker's recorder statistics for the controller's terminal summary"""
+    pool = config.stash.get(context_pool_key, None)
+    data = {
+        "pool": pool.usage() if pool else None,
+        "network": network_session_stats.to_dict(),
+        "har_unmatched": har_unmatched,
+        "readiness": readiness_recorder.to_dict(),
+        "negative_checks": negative_check_recorder.to_dict(),
+        "page_metrics": page_metrics_recorder.to_dict(),
+        "artifacts": failure_artifacts.stats,
+        "tracing": tracer.to_dict(),
+        "locators": LocatorRegistry.stats(),
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(data), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _merge_worker_stats(paths) -> list:
+    """
+    Fold statistics saved by xdist workers into this process's recorders
+
+    Returns:
+        Context pool usages of the workers (each worker has its own pool)
+    """
+    pool_usages = []
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data["pool"]:
+            pool_usages.append(data["pool"])
+        network_session_stats.add(NetworkStats.from_dict(data["network"]))
+        har_unmatched.extend(tuple(item) for item in data["har_unmatched"])
+        readiness_recorder.merge_dict(data["readiness"])
+        negative_check_recorder.merge_dict(data["negative_checks"])
+        page_metrics_recorder.merge_dict(data["page_metrics"])
+        for counter, value in data["artifacts"].items():
+            failure_artifacts.stats[counter] += value
+        tracer.merge_dict(data["tracing"])
+        LocatorRegistry.merge_stats(data["locators"])
+    return pool_usages
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Report pool, network, HAR, readiness, negative-check, page-timing, artifact, tracing and locator statistics"""
+    pool = config.stash.get(context_pool_key, None)
+    pool_usages = [pool.usage()] if pool else []
+    # Under xdist the tests ran on workers, which saved their statistics in pytest_sessionfinish
+    if not hasattr(config, "workerinput"):
+        pool_usages.extend(_merge_worker_stats(sorted(SESSION_STATS_DIR.glob("*.json"))))
+    summary = format_usage(merge_usage(pool_usages)) if pool_usages else None
+    if summary:
+        terminalreporter.write_sep("-", "browser context pool")
+        terminalreporter.write_line(summary)
+
+    network = network_session_stats
+    if network.blocked or network.stubbed:
+        terminalreporter.write_sep("-", "network policy")
+        terminalreporter.write_line(
+            f"{network.blocked} blocked, {network.stubbed} stubbed of {network.requests} requests, "
+            f"~{network.estimated_bytes_saved / 1024 / 1024:.1f} MB saved (rough estimate from typical sizes)"
+        )
+
+    if har_unmatched:
+        terminalreporter.write_sep("-", "HAR replay")
+        terminalreporter.write_line(f"{len(har_unmatched)} request(s) not found in the recorded archives:")
+        for nodeid, entry in har_unmatched[:20]:
+            terminalreporter.write_line(f"  {nodeid}: {entry}")
+
+    readiness = readiness_recorder.summary()
+    if readiness['waits']:
+        wins = ", ".join(f"{name}: {count}" for name, count in sorted(readiness['wins'].items()))
+        terminalreporter.write_sep("-", "readiness waits")
+        terminalreporter.write_line(
+            f"{readiness['waits']} waits, avg {readiness['avg_ms']:.0f}ms, max {readiness['max_ms']:.0f}ms, "
+            f"{readiness['slow']} slow | wins: {wins}"
+        )
+
+    # Workers saved their profiles in pytest_sessionfinish; the controller merges them
+    if not hasattr(config, "workerinput"):
+        profile = StepProfile.load_all(sorted(STEP_PROFILE_DIR.glob("*.json")))
+        table = profile.format_table()
+        if table:
+            terminalreporter.write_sep("-", "page-object step profile")
+            terminalreporter.write_line(table)
+            with open(STEP_PROFILE_DIR.parent / "step_profile.json", "w", encoding="utf-8") as f:
+                json.dump({"steps": profile.rows()}, f, indent=2)
+
+    checks = negative_check_recorder.summary()
+    if checks['checks']:
+        terminalreporter.write_sep("-", "negative checks")
+        terminalreporter.write_line(
+            f"{checks['checks']} visibility checks: {checks['visible']} visible, {checks['settled']} absent on a "
+            f"settled page, {checks['timed_out']} timed out | saved {checks['saved_ms'] / 1000:.1f}s, "
+            f"avg {checks['avg_saved_per_test_ms']:.0f}ms / max {checks['max_saved_per_test_ms']:.0f}ms per test"
+        )
+
+    page_summary = page_metrics_recorder.summary()
+    if page_summary:
+        terminalreporter.write_sep("-", "page performance (median / max ms)")
+        for path, row in sorted(page_summary.items()):
+            timings = ", ".join(
+                f"{name} {row[name]['median_ms']:.0f}/{row[name]['max_ms']:.0f}"
+                for name in ('ttfb', 'dom_content_loaded', 'load', 'fcp') if name in row
+            )
+            terminalreporter.write_line(f"{path} ({row['navigations']}x): {timings}")
+
+    artifact_stats = failure_artifacts.stats
+    if artifact_stats['captures']:
+        terminalreporter.write_sep("-", "failure artifacts")
+        terminalreporter.write_line(
+            f"{artifact_stats['captures']} captures, {artifact_stats['deduplicated']} deduplicated, "
+            f"{artifact_stats['bytes_written'] / 1024:.0f} KB written to {failure_artifacts.output_dir}"
+        )
+
+    trace = tracer.summary()
+    if trace['tests']:
+        overhead = trace['overhead_ms']
+        terminalreporter.write_sep("-", f"tracing ({trace['mode']})")
+        terminalreporter.write_line(
+            f"{trace['tests']} traced tests, {trace['discarded']} discarded without writing, "
+            f"{trace['persisted_mb']:.1f} MB kept | overhead per test: mean {overhead['mean_ms']:.0f}ms, "
+            f"p95 {overhead['percentiles_ms']['p95']:.0f}ms, max {overhead['max_ms']:.0f}ms"
+        )
+
+    locator_stats = LocatorRegistry.stats()
+    if locator_stats:
+        terminalreporter.write_sep("-", "page-object locators")
+        for name, s in locator_stats.items():
+            terminalreporter.write_line(
+                f"{name}: {s['builds']} built, {s['cache_hits']} cache hits, "
+                f"preferred alternative {s['preferred_hits']} hits / {s['preferred_misses']} misses"
+            )
 
-    yield page
 
-    # page.context.clear_cookies()  # If needed
+@pytest.hookimpl(trylast=True)
+def pytest_sessionfinish(session, exitstatus):
+    """Save this process's step profile and statistics, then flush the shared logging pipeline (every process)"""
+    failure_artifacts.shutdown()
+    tracer.close()
+    worker = getattr(session.config, "workerinput", {}).get("workerid", "main")
+    if step_profile.histograms:
+        step_profile.save(STEP_PROFILE_DIR / f"{worker}.json")
+    if hasattr(session.config, "workerinput"):
+        _save_worker_stats(session.config, SESSION_STATS_DIR / f"{worker}.json")
+    shutdown_logging()
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -31,4 +691,4 @@ def verify_imports():
         print("✅ All imports working correctly!")
     except ImportError as e:
         print(f"❌ Import error: {e}")
-        raise
\ No newline at end of file
+        raise
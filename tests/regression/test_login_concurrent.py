@@ -0,0 +1,56 @@
+"""
+Regression Tests - Concurrent multi-user login
+Drives many async pages at once against the local stand-in application
+"""
+import asyncio
+
+import pytest
+import allure
+
+from pages.async_login_page import AsyncLoginPage, login_concurrently
+
+CONCURRENT_USERS = 20
+
+
+@allure.feature('Authentication')
+@allure.story('Login - Concurrent Users')
+@pytest.mark.regression
+class TestLoginConcurrent:
+
+    @allure.title('Many users log in at the same time')
+    @allure.severity(allure.severity_level.CRITICAL)
+    def test_concurrent_logins(self, login_app, async_runner, async_browser):
+        users = [{'username': f'load_user_{i}@example.com', 'password': f'Pass{i}!'} for i in range(CONCURRENT_USERS)]
+        login_app.config.users.update({u['username']: u['password'] for u in users})
+
+        attempts = async_runner.run(login_concurrently(async_browser, login_app.base_url, users))
+
+        failed = [a.username for a in attempts if not a.logged_in]
+        assert not failed, f'Users not logged in: {failed}'
+        allure.attach(
+            "\n".join(f"{a.username}: {a.elapsed_ms:.0f}ms" for a in attempts),
+            name='Login durations',
+            attachment_type=allure.attachment_type.TEXT,
+        )
+
+    @allure.title('Concurrent wrong passwords lock the account')
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_concurrent_attempts_trigger_lockout(self, login_app, async_login_pages, async_runner):
+        threshold = login_app.config.lockout_threshold
+        pages = async_login_pages(threshold + 2)
+
+        async def attempt(login_page: AsyncLoginPage, password: str):
+            await login_page.quick_login('testuser@example.com', password, login_app.base_url)
+            return await login_page.get_error_message()
+
+        async def attempt_all(password: str):
+            return await asyncio.gather(*(attempt(p, password) for p in pages))
+
+        with allure.step(f'{len(pages)} simultaneous attempts with a wrong password'):
+            errors = async_runner.run(attempt_all('WrongPassword'))
+            locked = [e for e in errors if e and 'locked' in e.lower()]
+            assert locked, f'No attempt reported a lockout: {errors}'
+
+        with allure.step('Correct password is rejected while locked'):
+            assert async_runner.run(attempt(pages[0], 'ValidPass123!'))
+            assert not async_runner.run(pages[0].is_logged_in())
@@ -196,14 +196,15 @@ class TestLoginFull:
     @allure.title('Check navigate error message')
     @allure.severity(allure.severity_level.NORMAL)
     # แก้ไข: เติม self เป็น argument ตัวแรก
-    def test_regression_login_locked_out(self, page: Page):
+    def test_regression_login_locked_out(self, page: Page, user_accounts):
+        account = user_accounts.take('locked', tags=['saucedemo'])
         with allure.step("Open login page"):
             page.goto("https://www.saucedemo.com/")
 
         with allure.step("Login with locked_out user"):
             # ใช้ User ที่ถูกล็อค
-            page.fill("#user-name", "locked_out_user")
-            page.fill("#password", "secret_sauce")
+            page.fill("#user-name", account.username)
+            page.fill("#password", account.password)
             page.click("#login-button")
         with allure.step("Verify error message"):
             # ต้องเจอ Error Message สีแดง
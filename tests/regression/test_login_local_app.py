@@ -0,0 +1,110 @@
+"""
+Regression Tests - Login against the local stand-in application
+Hermetic: no network access needed, safe to run with -n auto
+"""
+import pytest
+import allure
+from playwright.sync_api import Page, expect
+
+from config import settings
+from pages.login_page import LoginPage
+from utils import data_provider
+
+
+@allure.feature('Authentication')
+@allure.story('Login - Local App')
+@pytest.mark.regression
+class TestLoginLocalApp:
+
+    @allure.title('Login with valid credentials reaches the dashboard')
+    @allure.severity(allure.severity_level.CRITICAL)
+    def test_login_valid_credentials(self, page: Page, login_app, user_accounts):
+        account = user_accounts.take('standard', tags=['local'])
+        login_page = LoginPage(page)
+        login_page.quick_login(account.username, account.password, login_app.base_url)
+
+        assert login_page.is_logged_in()
+        expect(page).to_have_url(f'{login_app.base_url}{LoginPage.dashboard_url}')
+
+    @allure.title('Login with empty credentials')
+    @allure.severity(allure.severity_level.NORMAL)
+    @data_provider.parametrize('username,password,expected_error', settings.LOGIN_CASES_FILE, tags=['empty_fields'])
+    def test_login_empty_fields(self, page: Page, login_app, username, password, expected_error):
+        login_page = LoginPage(page)
+        login_page.quick_login(username, password, login_app.base_url)
+
+        error_msg = login_page.get_error_message()
+        assert error_msg is not None
+        assert expected_error.lower() in error_msg.lower()
+
+    @allure.title('Login with SQL injection attempt')
+    @allure.severity(allure.severity_level.CRITICAL)
+    @pytest.mark.security
+    @data_provider.parametrize('payload', settings.LOGIN_CASES_FILE, tags=['sql_injection'])
+    def test_login_sql_injection(self, page: Page, login_app, payload):
+        login_page = LoginPage(page)
+        login_page.quick_login(payload, payload, login_app.base_url)
+        assert not login_page.is_logged_in(), f'Should not login with SQL injection: {payload}'
+
+    @allure.title('Account locks after repeated failed attempts')
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_login_rate_limiting(self, page: Page, login_app, user_accounts):
+        account = user_accounts.take('standard', tags=['local'])
+        login_page = LoginPage(page)
+        login_page.navigate(f'{login_app.base_url}/login')
+
+        for i in range(login_app.config.lockout_threshold - 1):
+            with allure.step(f'Failed login attempt {i + 1}'):
+                login_page.login(account.username, 'WrongPassword')
+
+        with allure.step('Verify account lockout'):
+            login_page.login(account.username, 'WrongPassword')
+            error = login_page.get_error_message()
+            assert 'locked' in error.lower() or 'many attempts' in error.lower()
+
+        with allure.step('Correct password is rejected while locked'):
+            login_page.login(account.username, account.password)
+            assert not login_page.is_logged_in()
+
+    @allure.title('Locked out user sees an error')
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_login_locked_out_user(self, page: Page, login_app, user_accounts):
+        account = user_accounts.take('locked', tags=['local'])
+        login_page = LoginPage(page)
+        login_page.quick_login(account.username, account.password, login_app.base_url)
+        assert 'locked out' in login_page.get_error_message()
+
+    @allure.title('Forgot password link opens the reset page')
+    @allure.severity(allure.severity_level.MINOR)
+    def test_forgot_password_link(self, page: Page, login_app):
+        login_page = LoginPage(page)
+        login_page.navigate(f'{login_app.base_url}/login')
+
+        assert login_page.is_forgot_password_visible()
+        login_page.click_forgot_password()
+        expect(page).to_have_url(f'{login_app.base_url}/forgot-password')
+
+    @allure.title('Password field should mask input')
+    @allure.severity(allure.severity_level.MINOR)
+    def test_password_field_masked(self, page: Page, login_app):
+        login_page = LoginPage(page)
+        login_page.navigate(f'{login_app.base_url}/login')
+        assert login_page.get_password_field_type() == 'password'
+
+    @allure.title('Login page survives injected server latency')
+    @allure.severity(allure.severity_level.MINOR)
+    def test_login_with_latency(self, page: Page, login_app, user_accounts):
+        account = user_accounts.take('standard', tags=['local'])
+        login_app.config.latency_ms = 300
+        login_page = LoginPage(page)
+        login_page.quick_login(account.username, account.password, login_app.base_url)
+        assert login_page.is_logged_in()
+
+    @allure.title('Login page loads within the performance budget')
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_login_page_load_budget(self, page: Page, login_app):
+        login_page = LoginPage(page)
+        login_page.navigate(f'{login_app.base_url}/login')
+
+        login_page.expect_navigation_under(settings.LOGIN_PAGE_LOAD_BUDGET_MS, metric='load')
+        login_page.expect_navigation_under(settings.LOGIN_PAGE_LOAD_BUDGET_MS, metric='fcp')
@@ -82,9 +82,8 @@
 #             assert 'Login' in page.title(), 'Page title should contain "Login"'
 #
 #         with allure.step('Verify form elements are visible'):
-#             assert login_page.is_username_visible(), 'Username field should be visible'
-#             assert login_page.is_password_visible(), 'Password field should be visible'
-#             assert login_page.is_login_button_visible(), 'Login button should be visible'
+#             # One probe round trip for all three fields
+#             login_page.expect_login_form_visible()
 
 
 from playwright.sync_api import Page, expect
@@ -100,14 +99,15 @@ class TestLoginSmoke:
     @allure.title('Verify login page loads correctly')
     @allure.severity(allure.severity_level.CRITICAL)
     # จุดที่แก้: ต้องมี self เป็นตัวแรกเมื่ออยู่ใน Class
-    def test_smoke_login_success(self, page: Page):
+    def test_smoke_login_success(self, page: Page, user_accounts):
+        account = user_accounts.take('standard', tags=['saucedemo'])
         # เพิ่ม allure.step เพื่อให้ Report อ่านง่ายขึ้น (Optional)
         with allure.step("Navigate to login page"):
             page.goto("https://www.saucedemo.com/")
 
         with allure.step("Input valid credentials"):
-            page.fill("#user-name", "standard_user")
-            page.fill("#password", "secret_sauce")
+            page.fill("#user-name", account.username)
+            page.fill("#password", account.password)
 
         with allure.step("Click login button"):
             page.click("#login-button")
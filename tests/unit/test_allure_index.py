@@ -0,0 +1,132 @@
+"""
+Unit Tests - Incremental Allure results index
+Refreshes must re-parse only changed files and rebuild an index they cannot trust
+"""
+import json
+import os
+import sqlite3
+
+import pytest
+
+from utils.allure_index import AllureResultIndex
+from utils.allure_ingest import IngestStats, stream_results
+
+
+def _write(results_dir, uuid, status="passed", stop=100):
+    path = results_dir / f"{uuid}-result.json"
+    result = {"uuid": uuid, "name": f"test_{uuid}", "fullName": f"pkg#test_{uuid}",
+              "status": status, "start": 0, "stop": stop}
+    path.write_text(json.dumps(result), encoding="utf-8")
+    return path
+
+
+def _refresh(index):
+    stats = IngestStats()
+    records = {record.uuid: record for record in index.stream(workers=1, stats=stats)}
+    return records, stats
+
+
+@pytest.fixture
+def results_dir(tmp_path):
+    results = tmp_path / "allure-results"
+    results.mkdir()
+    for i in range(5):
+        _write(results, f"u{i}", stop=100 * (i + 1))
+    return results
+
+
+@pytest.fixture
+def index(tmp_path, results_dir):
+    return AllureResultIndex(tmp_path / "index.sqlite", results_dir)
+
+
+def test_first_refresh_parses_everything(index, results_dir):
+    records, stats = _refresh(index)
+
+    assert records == {record.uuid: record for record in stream_results(results_dir, workers=1)}
+    assert stats.files == 5
+    assert stats.from_index == 0
+    assert not index.rebuilt
+
+
+def test_unchanged_files_are_served_from_the_index(index):
+    first, _ = _refresh(index)
+    second, stats = _refresh(index)
+
+    assert second == first
+    assert stats.from_index == 5
+
+
+def test_changed_added_and_removed_files(index, results_dir):
+    _refresh(index)
+    _write(results_dir, "u1", status="failed", stop=123456)  # different size, so re-parsed
+    _write(results_dir, "u9")
+    (results_dir / "u3-result.json").unlink()
+
+    records, stats = _refresh(index)
+
+    assert sorted(records) == ["u0", "u1", "u2", "u4", "u9"]
+    assert records["u1"].status == "failed"
+    assert records["u1"].duration_ms == 123456
+    assert stats.from_index == 3
+
+
+def test_touched_file_with_same_size_is_reparsed(index, results_dir):
+    _refresh(index)
+    size = (results_dir / "u2-result.json").stat().st_size
+    path = _write(results_dir, "u2", status="broken", stop=300)  # same length as "passed"
+    os.utime(path, ns=(1, 1))
+    assert path.stat().st_size == size
+
+    records, stats = _refresh(index)
+
+    assert records["u2"].status == "broken"
+    assert stats.from_index == 4
+
+
+def test_file_that_stops_parsing_loses_its_row(index, results_dir):
+    _refresh(index)
+    (results_dir / "u0-result.json").write_text("{not json", encoding="utf-8")
+
+    records, stats = _refresh(index)
+
+    assert "u0" not in records
+    assert [name for name, _ in stats.errors] == ["u0-result.json"]
+    assert "u0" not in {record.uuid for record in index.cached_records()}
+
+
+def test_corrupted_database_is_rebuilt(index, results_dir, capsys):
+    expected, _ = _refresh(index)
+    index.db_path.write_bytes(b"this is not a sqlite database" * 100)
+
+    records, stats = _refresh(index)
+
+    assert index.rebuilt
+    assert records == expected
+    assert stats.from_index == 0
+    assert "Rebuilding results index" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("key, value", [("schema", "0"), ("results_dir", "/elsewhere")])
+def test_stale_metadata_triggers_a_rebuild(index, key, value):
+    expected, _ = _refresh(index)
+    with sqlite3.connect(index.db_path) as conn:
+        conn.execute("UPDATE meta SET value = ? WHERE key = ?", (value, key))
+    conn.close()
+
+    records, _ = _refresh(index)
+
+    assert index.rebuilt
+    assert records == expected
+
+
+def test_cached_records_survive_a_cleaned_results_directory(index, results_dir):
+    expected, _ = _refresh(index)
+    for path in results_dir.iterdir():
+        path.unlink()
+
+    assert {record.uuid: record for record in index.cached_records()} == expected
+
+
+def test_cached_records_without_an_index_is_empty(tmp_path, results_dir):
+    assert list(AllureResultIndex(tmp_path / "missing.sqlite", results_dir).cached_records()) == []
@@ -0,0 +1,173 @@
+"""
+Unit Tests - Authenticated storage state cache
+TTL expiry, atomic writes and the per-user login lock shared by xdist workers
+"""
+import json
+import os
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("playwright.sync_api")
+
+from utils import auth_state  # noqa: E402
+from utils.auth_state import StorageStateCache  # noqa: E402
+
+BASE_URL = "https://app.example.com"
+STATE = {"cookies": [{"name": "session", "value": "abc"}], "origins": []}
+
+
+class FakeContext:
+    def __init__(self, browser):
+        self.browser = browser
+
+    def new_page(self):
+        return self
+
+    def storage_state(self):
+        return STATE
+
+    def close(self):
+        self.browser.closed += 1
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts = 0
+        self.closed = 0
+
+    def new_context(self, **options):
+        self.contexts += 1
+        return FakeContext(self)
+
+
+class FakeLoginPage:
+    logins = []
+    logged_in = True
+
+    def __init__(self, page):
+        self.page = page
+
+    def quick_login(self, username, password, base_url):
+        time.sleep(0.05)  # long enough for a concurrent miss to queue on the lock
+        self.logins.append(username)
+
+    def is_logged_in(self):
+        return self.logged_in
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return StorageStateCache(tmp_path / ".auth", ttl=60, lock_timeout=5)
+
+
+@pytest.fixture
+def login_page(monkeypatch):
+    monkeypatch.setattr(auth_state, "LoginPage", FakeLoginPage)
+    monkeypatch.setattr(FakeLoginPage, "logins", [])
+    return FakeLoginPage
+
+
+def _age(path, seconds):
+    stamp = time.time() - seconds
+    os.utime(path, (stamp, stamp))
+
+
+def test_store_and_get_round_trip(cache):
+    path = cache.store(BASE_URL, "alice", STATE)
+
+    assert cache.get(BASE_URL + "/", "alice") == path
+    assert json.loads(path.read_text(encoding="utf-8")) == STATE
+    assert cache.get(BASE_URL, "bob") is None
+    assert [p.name for p in cache.cache_dir.iterdir()] == [path.name]  # no temp files left behind
+
+
+def test_expired_state_is_a_miss(cache):
+    path = cache.store(BASE_URL, "alice", STATE)
+
+    _age(path, 59)
+    assert cache.get(BASE_URL, "alice") == path
+    _age(path, 61)
+    assert cache.get(BASE_URL, "alice") is None
+
+
+def test_hit_does_not_open_a_browser(cache, login_page):
+    cache.store(BASE_URL, "alice", STATE)
+
+    assert cache.get_or_login(None, BASE_URL, "alice", "secret") == cache.path_for(BASE_URL, "alice")
+    assert (cache.hits, cache.misses, login_page.logins) == (1, 0, [])
+
+
+def test_miss_logs_in_once_and_caches(cache, login_page):
+    browser = FakeBrowser()
+
+    first = cache.get_or_login(browser, BASE_URL, "alice", "secret")
+    second = cache.get_or_login(browser, BASE_URL, "alice", "secret")
+
+    assert first == second
+    assert (cache.hits, cache.misses, login_page.logins) == (1, 1, ["alice"])
+    assert browser.contexts == browser.closed == 1
+
+
+def test_failed_login_is_not_cached(cache, login_page, monkeypatch):
+    monkeypatch.setattr(FakeLoginPage, "logged_in", False)
+    browser = FakeBrowser()
+
+    with pytest.raises(AssertionError, match="Login failed"):
+        cache.get_or_login(browser, BASE_URL, "alice", "secret")
+
+    assert cache.get(BASE_URL, "alice") is None
+    assert browser.closed == 1
+    assert not cache.path_for(BASE_URL, "alice").with_suffix(".lock").exists()
+
+
+def test_concurrent_misses_share_one_login(cache, login_page):
+    browser = FakeBrowser()
+    paths = []
+    workers = [threading.Thread(target=lambda: paths.append(cache.get_or_login(browser, BASE_URL, "alice", "s")))
+               for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert len(set(paths)) == 1 and len(paths) == 4
+    assert login_page.logins == ["alice"]
+
+
+def test_abandoned_lock_is_broken_by_its_age(cache):
+    lock = cache.path_for(BASE_URL, "alice").with_suffix(".lock")
+    cache.cache_dir.mkdir(parents=True)
+    lock.write_text("crashed-worker", encoding="ascii")
+    _age(lock, 10)
+
+    with cache._locked(cache.path_for(BASE_URL, "alice")):
+        assert lock.read_text(encoding="ascii") != "crashed-worker"
+    assert not lock.exists()
+
+
+def test_fresh_lock_is_waited_for(cache, monkeypatch):
+    monkeypatch.setattr(auth_state, "LOCK_POLL_S", 0.01)
+    path = cache.path_for(BASE_URL, "alice")
+    lock = path.with_suffix(".lock")
+    cache.cache_dir.mkdir(parents=True)
+    lock.write_text("other-worker", encoding="ascii")
+    threading.Timer(0.1, lock.unlink).start()
+
+    started = time.monotonic()
+    with cache._locked(path):
+        waited = time.monotonic() - started
+
+    assert waited >= 0.1
+
+
+def test_lock_taken_over_by_another_worker_is_not_removed(cache):
+    path = cache.path_for(BASE_URL, "alice")
+    lock = path.with_suffix(".lock")
+
+    with cache._locked(path):
+        # Our lock was judged abandoned and another worker now holds the file
+        lock.write_text("successor", encoding="ascii")
+
+    assert lock.read_text(encoding="ascii") == "successor"
@@ -0,0 +1,177 @@
+"""
+Unit Tests - History-driven scheduling
+LPT packing and the xdist scheduler that feeds workers their planned bins
+"""
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from utils.duration_scheduler import SchedulePlan, lpt_pack, make_xdist_scheduler
+
+
+class FakeEstimates:
+    """Duration encoded in the node id ('tests/test_x.py::test_<seconds>_<n>'), chosen ids failed last run"""
+
+    def __init__(self, failed=()):
+        self.failed = set(failed)
+
+    def estimate(self, nodeid):
+        return float(nodeid.split("::test_")[1].split("_")[0]), True
+
+    def recently_failed(self, nodeid):
+        return nodeid in self.failed
+
+
+def _nodeids(durations):
+    return [f"tests/test_x.py::test_{seconds}_{i}" for i, seconds in enumerate(durations)]
+
+
+# ==================== lpt_pack ====================
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("workers", [1, 2, 3, 8])
+def test_lpt_pack_places_every_test_once(seed, workers):
+    rng = random.Random(seed)
+    durations = [rng.uniform(0.1, 30) for _ in range(50)]
+
+    bins, loads = lpt_pack(durations, workers)
+
+    assert sorted(i for b in bins for i in b) == list(range(len(durations)))
+    assert loads == pytest.approx([sum(durations[i] for i in b) for b in bins])
+    # LPT guarantee: no bin exceeds the average load by more than one test
+    assert max(loads) <= sum(durations) / workers + max(durations)
+    for b in bins:
+        assert [durations[i] for i in b] == sorted((durations[i] for i in b), reverse=True)
+
+
+def test_lpt_pack_balances_a_known_case():
+    bins, loads = lpt_pack([7, 6, 5, 4, 3, 2], 2)
+
+    assert sorted(loads) == [13, 14]
+    assert bins[0][0] == 0 and bins[1][0] == 1
+
+
+def test_lpt_pack_with_more_workers_than_tests():
+    bins, loads = lpt_pack([2.0, 1.0], 4)
+
+    assert sorted(map(len, bins)) == [0, 0, 1, 1]
+    assert sorted(loads) == [0.0, 0.0, 1.0, 2.0]
+
+
+def test_plan_runs_recently_failed_first_within_each_bin():
+    nodeids = _nodeids([5, 4, 3, 2, 1, 1])
+    plan = SchedulePlan(FakeEstimates(failed={nodeids[3]}))
+
+    bins = plan.pack(nodeids, ["gw0", "gw1"])
+
+    owner = next(b for b in bins if 3 in b)
+    assert owner[0] == 3
+    assert plan.failed_first == 1
+    assert sum(plan.predicted.values()) == pytest.approx(16)
+
+
+# ==================== HistoryLoadScheduling ====================
+
+class FakeConfig:
+    def __init__(self, workers):
+        self.workers = workers
+
+    def getoption(self, name, default=None):
+        return {"dist": "load", "maxschedchunk": None}.get(name, default)
+
+    def getvalue(self, name):
+        return [f"{self.workers}*popen"] if name == "tx" else None
+
+
+class FakeNode:
+    def __init__(self, index):
+        self.gateway = SimpleNamespace(id=f"gw{index}")
+        self.shutting_down = False
+        self.sent = []
+
+    def send_runtest_some(self, indices):
+        self.sent.extend(indices)
+
+    def shutdown(self):
+        self.shutting_down = True
+
+
+def _scheduler(durations, workers=3):
+    pytest.importorskip("xdist.scheduler")
+    nodeids = _nodeids(durations)
+    plan = SchedulePlan(FakeEstimates())
+    scheduler = make_xdist_scheduler(FakeConfig(workers), None, plan)
+    nodes = [FakeNode(i) for i in range(workers)]
+    for node in nodes:
+        scheduler.add_node(node)
+        scheduler.add_node_collection(node, nodeids)
+    scheduler.schedule()
+    return scheduler, nodes, plan
+
+
+def _run_to_completion(scheduler, nodes, rng):
+    """Complete tests on random busy nodes until nothing is in flight"""
+    while any(scheduler.node2pending[node] for node in nodes):
+        node = rng.choice([n for n in nodes if scheduler.node2pending[n]])
+        scheduler.mark_test_complete(node, scheduler.node2pending[node][0])
+
+
+def test_scheduler_is_skipped_for_other_dist_modes():
+    config = FakeConfig(2)
+    config.getoption = lambda name, default=None: "loadfile" if name == "dist" else default
+
+    assert make_xdist_scheduler(config, None, SchedulePlan(FakeEstimates())) is None
+
+
+def test_scheduler_sends_each_bin_in_lpt_order_a_few_at_a_time():
+    rng = random.Random(1)
+    durations = [rng.randint(1, 20) for _ in range(30)]
+    scheduler, nodes, plan = _scheduler(durations)
+    bins = plan.pack(_nodeids(durations), [node.gateway.id for node in nodes])
+
+    for node, planned in zip(nodes, bins):
+        assert node.sent == planned[:scheduler.IN_FLIGHT]
+
+    _run_to_completion(scheduler, nodes, random.Random(2))
+
+    sent = [index for node in nodes for index in node.sent]
+    assert sorted(sent) == list(range(len(durations)))
+    assert scheduler.pending == []
+    assert all(node.shutting_down for node in nodes)
+
+
+def test_idle_worker_steals_from_the_fullest_bin():
+    durations = [6, 6, 5, 5, 4, 4, 3, 3, 2, 2, 1, 1]
+    scheduler, nodes, plan = _scheduler(durations, workers=2)
+    busy, idle = nodes
+    busy_bin = plan.pack(_nodeids(durations), ["gw0", "gw1"])[0]
+
+    # The busy worker never finishes its first test; the idle one drains everything else
+    while scheduler.node2pending[idle]:
+        scheduler.mark_test_complete(idle, scheduler.node2pending[idle][0])
+
+    assert busy.sent == busy_bin[:scheduler.IN_FLIGHT]
+    stolen = [index for index in idle.sent if index in busy_bin]
+    assert stolen == list(reversed(busy_bin[scheduler.IN_FLIGHT:]))  # shortest first
+    assert sorted(idle.sent + busy.sent) == list(range(len(durations)))
+    assert scheduler.pending == []
+
+
+def test_tests_of_a_crashed_worker_are_sent_to_the_others():
+    rng = random.Random(3)
+    durations = [rng.randint(1, 20) for _ in range(40)]
+    scheduler, nodes, _ = _scheduler(durations)
+    crashed = nodes[2]
+    completed = scheduler.node2pending[crashed][0]
+    scheduler.mark_test_complete(crashed, completed)
+    crashed_in = scheduler.collection.index(scheduler.remove_node(crashed))
+
+    alive = nodes[:2]
+    _run_to_completion(scheduler, alive, random.Random(4))
+
+    # Everything but the finished test and the one it crashed in is run elsewhere, once
+    sent_to_alive = [index for node in alive for index in node.sent]
+    assert len(sent_to_alive) == len(set(sent_to_alive))
+    assert sorted(sent_to_alive + [completed, crashed_in]) == list(range(len(durations)))
+    assert all(node.shutting_down for node in alive)
@@ -0,0 +1,128 @@
+"""
+Unit Tests - HAR record/replay matching
+Requests must find their recorded responses by method, URL and body
+"""
+import base64
+import json
+
+import pytest
+
+pytest.importorskip("playwright.sync_api")
+
+from utils.har_replay import HarIndex, HarRecorder, HarReplayer, request_key  # noqa: E402
+
+
+class FakeResponse:
+    def __init__(self, status, headers, body):
+        self.status, self.status_text, self.headers, self._body = status, "OK", headers, body
+
+    def body(self):
+        return self._body
+
+
+class FakeRequest:
+    def __init__(self, method, url, body=None, response=None):
+        self.method, self.url, self.post_data_buffer = method, url, body
+        self.headers = {"content-type": "application/octet-stream"}
+        self.timing = {"responseEnd": 12.5}
+        self._response = response
+
+    def response(self):
+        return self._response
+
+
+class FakeRoute:
+    def __init__(self):
+        self.fulfilled = None
+
+    def fulfill(self, **kwargs):
+        self.fulfilled = kwargs
+
+
+def _entry(method, url, status=200, text="", post=None, headers=()):
+    request = {"method": method, "url": url}
+    if post is not None:
+        request["postData"] = {"text": base64.b64encode(post).decode("ascii"), "encoding": "base64"}
+    response = {"status": status, "headers": [{"name": k, "value": v} for k, v in headers],
+                "content": {"text": text}}
+    return {"request": request, "response": response}
+
+
+def _har(path, *entries):
+    path.write_text(json.dumps({"log": {"entries": list(entries)}}), encoding="utf-8")
+    return path
+
+
+def _serve(replayer, method, url, body=None):
+    route = FakeRoute()
+    replayer._handle(route, FakeRequest(method, url, body))
+    return route.fulfilled
+
+
+def test_request_key_normalizes_method_fragment_and_empty_body():
+    assert request_key("get", "https://app/x#top", None) == request_key("GET", "https://app/x", b"")
+    assert request_key("POST", "https://app/x", b"a") != request_key("POST", "https://app/x", b"b")
+    assert request_key("GET", "https://app/x?a=1", None) != request_key("GET", "https://app/x?a=2", None)
+
+
+def test_index_keeps_recording_order_and_drops_encoding_headers(tmp_path):
+    headers = [("Content-Type", "text/html"), ("Content-Encoding", "gzip"), ("Content-Length", "3")]
+    first = _har(tmp_path / "a.har", _entry("GET", "https://app/", text="one", headers=headers))
+    second = _har(tmp_path / "b.har", _entry("GET", "https://app/", text="two"))
+
+    index = HarIndex.load([first, second])
+
+    responses = index.entries[request_key("GET", "https://app/", None)]
+    assert [r.body for r in responses] == [b"one", b"two"]
+    assert responses[0].headers == {"Content-Type": "text/html"}
+    assert (len(index), index.files) == (2, 2)
+
+
+def test_replay_matches_post_bodies(tmp_path):
+    har = _har(tmp_path / "login.har",
+               _entry("POST", "https://app/login", 302, post=b"user=a", headers=[("Location", "/dashboard")]),
+               _entry("POST", "https://app/login", 401, post=b"user=b"))
+    replayer = HarReplayer(HarIndex.load([har]))
+
+    assert _serve(replayer, "POST", "https://app/login", b"user=b")["status"] == 401
+    assert _serve(replayer, "POST", "https://app/login", b"user=a")["headers"] == {"Location": "/dashboard"}
+
+
+def test_replay_serves_repeats_in_order_then_repeats_the_last(tmp_path):
+    har = _har(tmp_path / "poll.har",
+               _entry("GET", "https://app/status", text="pending"),
+               _entry("GET", "https://app/status", text="done"))
+    replayer = HarReplayer(HarIndex.load([har]))
+
+    bodies = [_serve(replayer, "GET", "https://app/status")["body"] for _ in range(3)]
+
+    assert bodies == [b"pending", b"done", b"done"]
+    assert replayer.served == 3
+
+
+def test_unmatched_requests_get_404_and_are_listed(tmp_path):
+    replayer = HarReplayer(HarIndex.load([_har(tmp_path / "a.har", _entry("GET", "https://app/"))]))
+
+    assert _serve(replayer, "GET", "https://app/missing")["status"] == 404
+    assert _serve(replayer, "POST", "https://app/")["status"] == 404
+    assert replayer.unmatched == ["GET https://app/missing", "POST https://app/"]
+
+
+def test_recorded_archive_replays_binary_bodies(tmp_path):
+    recorder = HarRecorder()
+    png = bytes(range(256))
+    upload = b"\x00\xffbinary form"
+    recorder._on_finished(FakeRequest("GET", "https://app/logo.png",
+                                      response=FakeResponse(200, {"content-type": "image/png"}, png)))
+    recorder._on_finished(FakeRequest("POST", "https://app/upload", upload,
+                                      response=FakeResponse(201, {"content-type": "application/json"}, b"{}")))
+    recorder._on_finished(FakeRequest("GET", "https://app/old",
+                                      response=FakeResponse(301, {"location": "/new"}, None)))
+    path = recorder.save(tmp_path / "recorded.har")
+
+    replayer = HarReplayer(HarIndex.load([path]))
+
+    assert _serve(replayer, "GET", "https://app/logo.png")["body"] == png
+    assert _serve(replayer, "POST", "https://app/upload", upload)["status"] == 201
+    assert _serve(replayer, "GET", "https://app/old") == {"status": 301, "headers": {"location": "/new"}, "body": b""}
+    assert replayer.unmatched == []
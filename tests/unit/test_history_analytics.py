@@ -0,0 +1,108 @@
+"""
+Unit Tests - Allure history analytics
+Flip rate, duration EWMA and Page-Hinkley slowdown detection on synthetic runs
+"""
+import json
+
+import pytest
+
+from utils.history_analytics import HistoryAnalyzer
+
+
+def _feed(analyzer, runs):
+    """runs: list of (status, duration_ms) for a single test, oldest first"""
+    for timestamp, (status, duration) in enumerate(runs, start=1):
+        analyzer.add_run(timestamp, {"h1": {"name": "test_a", "fullName": "pkg#test_a",
+                                            "status": status, "duration": duration}})
+    return analyzer.tests["h1"]
+
+
+@pytest.mark.parametrize("statuses, expected", [
+    (["passed"] * 6, 0.0),
+    (["passed", "failed"] * 3, 1.0),
+    (["passed"] * 3 + ["failed"] * 3, 0.2),
+    (["passed"], 0.0),
+])
+def test_flip_rate(statuses, expected):
+    test = _feed(HistoryAnalyzer(), [(status, 100) for status in statuses])
+
+    assert test.flip_rate == pytest.approx(expected)
+
+
+def test_flip_rate_only_looks_at_the_window():
+    test = _feed(HistoryAnalyzer(window=4), [(s, 100) for s in ["passed", "failed"] * 5 + ["passed"] * 4])
+
+    assert test.flip_rate == 0.0
+    assert test.fail_rate == pytest.approx(5 / 14)
+
+
+def test_skipped_runs_are_ignored():
+    test = _feed(HistoryAnalyzer(), [("passed", 100), ("skipped", 0), ("passed", 100)])
+
+    assert test.runs == 2
+    assert test.flip_rate == 0.0
+
+
+@pytest.mark.parametrize("min_runs, flagged", [(4, ["h1"]), (5, [])])
+def test_flaky_tests_need_min_runs(min_runs, flagged):
+    analyzer = HistoryAnalyzer(min_runs=min_runs)
+    _feed(analyzer, [(s, 100) for s in ["passed", "failed"] * 2])
+
+    assert [t["historyId"] for t in analyzer.flaky_tests()] == flagged
+
+
+def test_ewma_weights_recent_durations():
+    test = _feed(HistoryAnalyzer(ewma_alpha=0.3), [("passed", 100), ("passed", 200), ("passed", 200)])
+
+    assert test.ewma == pytest.approx(0.3 * 200 + 0.7 * (0.3 * 200 + 0.7 * 100))
+
+
+def test_duration_falls_back_to_start_and_stop():
+    analyzer = HistoryAnalyzer()
+    analyzer.add_run(1, {"h1": {"status": "passed", "start": 1000, "stop": 1250}})
+
+    assert analyzer.tests["h1"].ewma == 250
+
+
+def test_page_hinkley_flags_a_lasting_slowdown():
+    analyzer = HistoryAnalyzer()
+    test = _feed(analyzer, [("passed", 1000 + (i % 3) * 20) for i in range(10)] + [("passed", 2000)] * 6)
+
+    assert test.changed_at is not None and test.changed_at > 10
+    # The first slow runs before the alarm still count towards the old regime
+    assert 1000 <= test.baseline < 1200
+    [slower] = analyzer.slower_tests()
+    assert slower["historyId"] == "h1"
+    assert slower["ratio"] == pytest.approx(2000 / test.baseline, abs=0.01)
+
+
+def test_page_hinkley_ignores_noise():
+    analyzer = HistoryAnalyzer()
+    test = _feed(analyzer, [("passed", 1000 + (i % 5) * 40) for i in range(30)])
+
+    assert test.changed_at is None
+    assert analyzer.slower_tests() == []
+
+
+def test_single_spike_is_not_reported_as_slower():
+    durations = [1000 + (i % 5) * 40 for i in range(30)]
+    durations[15] = 3000
+    analyzer = HistoryAnalyzer()
+    _feed(analyzer, [("passed", d) for d in durations])
+
+    # A big enough spike may restart the regime, but the EWMA returns to the old level
+    assert analyzer.slower_tests() == []
+
+
+def test_analyze_streams_history_file_and_skips_bad_lines(tmp_path):
+    history = tmp_path / "history.jsonl"
+    runs = [{"timestamp": t, "testResults": {"h1": {"name": "test_a", "status": "passed", "duration": 100}}}
+            for t in range(3)]
+    history.write_text("\n".join([json.dumps(runs[0]), "not json", "", json.dumps(runs[1]),
+                                  json.dumps(["no", "results"]), json.dumps(runs[2])]), encoding="utf-8")
+
+    report = HistoryAnalyzer().analyze(history)
+
+    assert report["runs"] == 3
+    assert report["tests_tracked"] == 1
+    assert HistoryAnalyzer().analyze(tmp_path / "missing.jsonl") is None
@@ -0,0 +1,106 @@
+"""
+Unit Tests - Columnar result store
+Aggregations must match a plain sort/loop over the same rows
+"""
+import math
+import random
+
+import pytest
+
+from utils.result_store import ResultStore, _select_ranks
+
+
+def _nearest_rank(values, p):
+    ordered = sorted(values)
+    return ordered[min(max(1, math.ceil(p * len(ordered) / 100)), len(ordered)) - 1]
+
+
+def _store(rows):
+    store = ResultStore()
+    for name, status, duration, suite, feature, tags in rows:
+        store.add(name, status, duration, f"pkg.{name}", suite, feature, tags)
+    return store
+
+
+ROWS = [
+    ("test_login", "passed", 1.5, "smoke", "auth", ("smoke",)),
+    ("test_logout", "failed", 0.5, "smoke", "auth", ("smoke", "flaky")),
+    ("test_search", "passed", 4.0, "regression", "search", ()),
+    ("test_filter", "skipped", 0.0, "regression", "search", ("flaky",)),
+    ("test_export", "broken", 2.5, "regression", "reports", ()),
+]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_select_ranks_matches_sorted_order(seed):
+    rng = random.Random(seed)
+    values = [rng.choice([0.1, 0.5, 1.0]) if i % 3 else rng.uniform(0, 10) for i in range(301)]
+    original = list(values)
+    ranks = [1, 2, 150, 151, 299, 301]
+
+    assert _select_ranks(values, ranks) == {rank: sorted(values)[rank - 1] for rank in ranks}
+    assert values == original
+
+
+def test_percentiles_use_nearest_rank():
+    rng = random.Random(7)
+    durations = [rng.expovariate(1.0) for _ in range(1000)]
+    store = ResultStore()
+    for i, duration in enumerate(durations):
+        store.add(f"t{i}", "passed", duration)
+
+    assert store.percentiles((1, 50, 90, 99, 100)) == {
+        f"p{p:g}": _nearest_rank(durations, p) for p in (1, 50, 90, 99, 100)
+    }
+
+
+def test_percentiles_are_recomputed_after_add():
+    store = ResultStore()
+    store.add("fast", "passed", 1.0)
+    assert store.percentiles((100,)) == {"p100": 1.0}
+
+    store.add("slow", "passed", 9.0)
+    assert store.percentiles((100,)) == {"p100": 9.0}
+
+
+def test_percentiles_of_empty_store_are_zero():
+    assert ResultStore().percentiles((50, 99.9)) == {"p50": 0.0, "p99.9": 0.0}
+
+
+def test_top_k_slowest_orders_slowest_first():
+    store = _store(ROWS)
+
+    assert [row["name"] for row in store.top_k_slowest(3)] == ["test_search", "test_export", "test_login"]
+    assert len(store.top_k_slowest(50)) == len(ROWS)
+
+
+def test_counts_and_status_filter():
+    store = _store(ROWS)
+
+    assert store.count_by_status() == {"passed": 2, "failed": 1, "skipped": 1, "broken": 1}
+    assert [row["name"] for row in store.with_status("passed")] == ["test_login", "test_search"]
+    assert store.with_status("never-seen") == []
+
+
+@pytest.mark.parametrize("field, expected", [
+    ("suite", {
+        "smoke": {"count": 2, "passed": 1, "failed": 1, "total_duration": 2.0, "avg_duration": 1.0},
+        "regression": {"count": 3, "passed": 1, "failed": 0, "total_duration": 6.5, "avg_duration": 6.5 / 3},
+    }),
+    ("feature", {
+        "auth": {"count": 2, "passed": 1, "failed": 1, "total_duration": 2.0, "avg_duration": 1.0},
+        "search": {"count": 2, "passed": 1, "failed": 0, "total_duration": 4.0, "avg_duration": 2.0},
+        "reports": {"count": 1, "passed": 0, "failed": 0, "total_duration": 2.5, "avg_duration": 2.5},
+    }),
+    ("tag", {
+        "smoke": {"count": 2, "passed": 1, "failed": 1, "total_duration": 2.0, "avg_duration": 1.0},
+        "flaky": {"count": 2, "passed": 0, "failed": 1, "total_duration": 0.5, "avg_duration": 0.25},
+    }),
+])
+def test_group_by(field, expected):
+    assert _store(ROWS).group_by(field) == expected
+
+
+def test_group_by_rejects_unknown_field():
+    with pytest.raises(ValueError):
+        _store(ROWS).group_by("owner")
@@ -0,0 +1,87 @@
+"""
+Unit Tests - Deterministic test sharding
+Every collected test must land in exactly one shard, whatever the mode
+"""
+import json
+
+import pytest
+
+from utils.allure_index import AllureResultIndex
+from utils.duration_scheduler import DurationEstimates, allure_key
+from utils.sharding import SHARD_MODES, assign_shards, hash_shard
+
+NODEIDS = [
+    f"tests/regression/test_module_{m}.py::TestLogin::test_case_{c}[{browser}]"
+    for m in range(5) for c in range(12) for browser in ("chromium", "firefox")
+]
+
+
+class FakeEstimates:
+    """Predicted durations spread over two orders of magnitude"""
+
+    def estimate(self, nodeid):
+        return 0.1 + (hash_shard(nodeid, 97) % 50) * 0.4, True
+
+
+@pytest.mark.parametrize("mode", SHARD_MODES)
+@pytest.mark.parametrize("total", [1, 2, 3, 7, 200])
+class TestAssignShards:
+
+    def test_every_test_runs_in_exactly_one_shard(self, mode, total):
+        shards = assign_shards(NODEIDS, total, mode, FakeEstimates())
+
+        per_shard = [[n for n in NODEIDS if shards[n] == shard] for shard in range(total)]
+        assert set(shards) == set(NODEIDS)
+        assert all(0 <= shard < total for shard in shards.values())
+        assert sorted(n for shard in per_shard for n in shard) == sorted(NODEIDS)
+
+    def test_split_does_not_depend_on_collection_order(self, mode, total):
+        shards = assign_shards(NODEIDS, total, mode, FakeEstimates())
+
+        assert assign_shards(list(reversed(NODEIDS)), total, mode, FakeEstimates()) == shards
+
+
+def test_hash_shard_is_stable_when_tests_are_added():
+    before = {nodeid: hash_shard(nodeid, 4) for nodeid in NODEIDS}
+    after = assign_shards(NODEIDS + ["tests/smoke/test_new.py::test_new"], 4, "hash")
+
+    assert all(after[nodeid] == shard for nodeid, shard in before.items())
+
+
+def _write_history(path, nodeids):
+    """One history run giving every test a different duration"""
+    results = {}
+    for i, nodeid in enumerate(nodeids):
+        full_name, name = allure_key(nodeid)
+        results[f"h{i}"] = {"fullName": full_name, "name": name, "status": "passed", "duration": 100 + i * 37}
+    path.write_text(json.dumps({"timestamp": 1, "testResults": results}) + "\n", encoding="utf-8")
+
+
+def _write_results(results_dir, nodeids):
+    """Allure results that contradict the history: reversed durations, every test failed"""
+    results_dir.mkdir()
+    for i, nodeid in enumerate(nodeids):
+        full_name, name = allure_key(nodeid)
+        result = {"uuid": f"u{i}", "fullName": full_name, "name": name, "status": "failed",
+                  "start": 0, "stop": 10000 - i * 50}
+        (results_dir / f"u{i}-result.json").write_text(json.dumps(result), encoding="utf-8")
+
+
+def test_history_only_estimates_ignore_local_results_and_index(tmp_path):
+    history = tmp_path / "history.jsonl"
+    _write_history(history, NODEIDS)
+
+    # Machine A: fresh checkout, no results directory and no index
+    fresh = DurationEstimates().load(history, tmp_path / "a-results", tmp_path / "a-index.sqlite",
+                                     scan_results=False)
+
+    # Machine B: a populated results directory and an index built from it
+    results_dir = tmp_path / "b-results"
+    _write_results(results_dir, NODEIDS)
+    index = tmp_path / "b-index.sqlite"
+    assert len(list(AllureResultIndex(index, results_dir).stream(workers=1))) == len(NODEIDS)
+    local = DurationEstimates().load(history, results_dir, index, scan_results=False)
+
+    assert local.durations == fresh.durations
+    assert not local.failed
+    assert assign_shards(NODEIDS, 7, "duration", local) == assign_shards(NODEIDS, 7, "duration", fresh)
@@ -0,0 +1,143 @@
+"""
+Unit Tests - Per-test timeout budget
+Nested page-object calls share one deadline and only the outermost call is charged
+"""
+import asyncio
+
+import pytest
+
+from utils import timeout_budget
+from utils.timeout_budget import TimeoutBudgetExceeded, budgeted, current_budget, start_budget, stop_budget
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, ms):
+        self.now += ms / 1000
+
+
+def _spent(budget):
+    return {operation: (pytest.approx(ms), calls) for operation, (ms, calls) in budget.spent.items()}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(timeout_budget.time, "monotonic", fake)
+    return fake
+
+
+@pytest.fixture
+def budget(clock):
+    budget, token = start_budget(10000, default_ms=3000, label="tests/test_x.py::test_a")
+    yield budget
+    stop_budget(token)
+
+
+def test_without_a_budget_the_requested_timeout_is_passed_through():
+    assert current_budget() is None
+    with budgeted("LoginPage.login", 1234) as timeout:
+        assert timeout == 1234
+    with budgeted("LoginPage.login") as timeout:
+        assert timeout is None
+
+
+def test_stop_budget_restores_the_previous_budget(clock):
+    outer, outer_token = start_budget(1000)
+    inner, inner_token = start_budget(500)
+    assert current_budget() is inner
+
+    stop_budget(inner_token)
+    assert current_budget() is outer
+    stop_budget(outer_token)
+    assert current_budget() is None
+
+
+def test_allot_caps_the_timeout_by_what_is_left(budget, clock):
+    assert budget.allot("op") == 3000
+    assert budget.allot("op", 20000) == 10000
+
+    clock.advance(9998.5)
+    assert budget.allot("op", 20000) == 1  # never 0, which Playwright reads as "no timeout"
+
+    clock.advance(1)
+    with pytest.raises(TimeoutBudgetExceeded):
+        budget.allot("op")
+    assert budget.exhausted_in == "op"
+
+
+def test_only_the_outermost_call_is_charged(budget, clock):
+    with budgeted("LoginPage.login"):
+        clock.advance(100)
+        for _ in range(3):
+            with budgeted("BasePage.fill"):
+                clock.advance(200)
+    with budgeted("DashboardPage.open"):
+        clock.advance(50)
+    clock.advance(25)
+
+    assert _spent(budget) == {"LoginPage.login": (700, 1), "DashboardPage.open": (50, 1)}
+    assert budget.breakdown()[-1] == ("outside page objects", pytest.approx(25.0), 0)
+
+
+def test_nested_calls_get_what_is_left_of_the_outer_one(budget, clock):
+    with budgeted("LoginPage.login", 20000) as outer:
+        clock.advance(8000)
+        with budgeted("BasePage.click", 5000) as inner:
+            pass
+
+    assert (outer, inner) == (10000, 2000)
+
+
+def test_failure_after_a_shortened_wait_is_reported_as_budget_exhaustion(budget, clock):
+    clock.advance(9000)
+    with pytest.raises(TimeoutBudgetExceeded) as info:
+        with budgeted("BasePage.click", 5000) as timeout:
+            clock.advance(timeout)
+            raise RuntimeError("Timeout 1000ms exceeded")
+
+    assert isinstance(info.value.__cause__, RuntimeError)
+    assert budget.exhausted_in == "BasePage.click"
+    assert "exhausted after 10000ms in BasePage.click" in str(info.value)
+
+
+def test_failures_within_the_requested_timeout_are_left_alone(budget, clock):
+    with pytest.raises(RuntimeError):
+        with budgeted("BasePage.click", 1000) as timeout:
+            clock.advance(timeout)
+            raise RuntimeError("Timeout 1000ms exceeded")
+
+    assert not budget.exhausted
+    assert _spent(budget) == {"BasePage.click": (1000, 1)}
+
+
+def test_exhaustion_in_a_nested_call_is_kept_by_the_outer_one(budget, clock):
+    with pytest.raises(TimeoutBudgetExceeded):
+        with budgeted("LoginPage.login"):
+            clock.advance(10000)
+            with budgeted("BasePage.fill"):
+                pass
+
+    assert budget.exhausted_in == "BasePage.fill"
+    assert _spent(budget) == {"LoginPage.login": (10000, 1)}
+
+
+def test_concurrent_tasks_are_charged_individually(budget, clock):
+    async def call(name, ms):
+        with budgeted(name):
+            await asyncio.sleep(0)
+            clock.advance(ms)
+            with budgeted("AsyncBasePage.fill"):
+                await asyncio.sleep(0)
+
+    async def main():
+        await asyncio.gather(call("AsyncLoginPage.login", 100), call("AsyncDashboardPage.open", 200))
+
+    asyncio.run(main())
+
+    assert set(budget.spent) == {"AsyncLoginPage.login", "AsyncDashboardPage.open"}
@@ -0,0 +1,233 @@
+"""
+Incremental Allure Results Index
+Persists extracted result fields in SQLite keyed by file path, mtime and size
+so repeated runs only parse new or changed result files
+"""
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Iterator, Tuple
+
+from utils.allure_ingest import (
+    IngestStats,
+    ResultRecord,
+    iter_result_files,
+    parse_file,
+    parse_paths,
+    peak_rss_mb,
+)
+
+SCHEMA_VERSION = "2"
+
+
+class IndexCorrupted(Exception):
+    """Raised internally when the index cannot be trusted and must be rebuilt"""
+
+
+def _encode(record: ResultRecord) -> str:
+    return json.dumps(record, separators=(',', ':'))
+
+
+def _decode(payload: str) -> ResultRecord:
+    fields = json.loads(payload)
+    record = ResultRecord(*fields)
+    return record._replace(
+        tags=tuple(record.tags),
+        steps=tuple(tuple(step) for step in record.steps),
+        attachments=tuple(tuple(attachment) for attachment in record.attachments),
+    )
+
+
+class AllureResultIndex:
+    """
+    On-disk index of parsed Allure results
+
+    Each row maps a result file path to its (mtime_ns, size) and the extracted
+    ResultRecord. A refresh re-parses only files whose mtime or size changed and
+    drops rows for files that disappeared. An index that fails an integrity
+    check, has a different schema version or belongs to another results
+    directory is deleted and rebuilt.
+
+    Example:
+        index = AllureResultIndex(Path("reports/allure-index.sqlite"), Path("reports/allure-results"))
+        for record in index.stream():
+            ...
+    """
+
+    def __init__(self, db_path: Path, results_dir: Path):
+        """
+        Initialize index
+
+        Args:
+            db_path: SQLite file (kept outside the results directory)
+            results_dir: Allure results directory the index describes
+        """
+        self.db_path = Path(db_path)
+        self.results_dir = Path(results_dir).resolve()
+        self.rebuilt = False
+
+    # ==================== Connection ====================
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the index, rebuilding it if it is corrupted or stale"""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = None
+        try:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            self._validate(conn)
+            return conn
+        except (sqlite3.DatabaseError, IndexCorrupted) as e:
+            if conn is not None:
+                conn.close()
+            print(f"⚠️  Rebuilding results index ({e})")
+            self._delete()
+            self.rebuilt = True
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            self._create(conn)
+            return conn
+
+    def _validate(self, conn: sqlite3.Connection):
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+        if not tables:
+            self._create(conn)
+            return
+
+        if tables != {'meta', 'results'}:
+            raise IndexCorrupted("unexpected tables")
+        if conn.execute("PRAGMA quick_check").fetchone()[0] != 'ok':
+            raise IndexCorrupted("integrity check failed")
+
+        meta = dict(conn.execute("SELECT key, value FROM meta"))
+        if meta.get('schema') != SCHEMA_VERSION:
+            raise IndexCorrupted(f"schema version {meta.get('schema')} != {SCHEMA_VERSION}")
+        if meta.get('results_dir') != str(self.results_dir):
+            raise IndexCorrupted("index belongs to another results directory")
+
+    def _create(self, conn: sqlite3.Connection):
+        with conn:
+            conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            conn.execute(
+                "CREATE TABLE results ("
+                " path TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL, record TEXT NOT NULL)"
+            )
+            conn.executemany(
+                "INSERT INTO meta (key, value) VALUES (?, ?)",
+                [('schema', SCHEMA_VERSION), ('results_dir', str(self.results_dir))],
+            )
+
+    def _delete(self):
+        for suffix in ('', '-journal', '-wal', '-shm'):
+            Path(f"{self.db_path}{suffix}").unlink(missing_ok=True)
+
+    # ==================== Refresh ====================
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        """Current result files with their (mtime_ns, size)"""
+        current = {}
+        for path in iter_result_files(self.results_dir):
+            st = os.stat(path)
+            current[os.path.basename(path)] = (st.st_mtime_ns, st.st_size)
+        return current
+
+    def stream(self, workers: int = None, stats: IngestStats = None) -> Iterator[ResultRecord]:
+        """
+        Bring the index up to date and stream every record it holds
+
+        Args:
+            workers: Worker processes for parsing changed files
+            stats: Optional IngestStats (files, files reused from the index, errors)
+
+        Yields:
+            ResultRecord per result file
+        """
+        stats = stats if stats is not None else IngestStats()
+        started = time.perf_counter()
+
+        if not self.results_dir.exists():
+            return
+
+        conn = self._connect()
+        try:
+            self._refresh(conn, workers, stats)
+
+            damaged = []
+            for path, payload in conn.execute("SELECT path, record FROM results ORDER BY path"):
+                try:
+                    yield _decode(payload)
+                except (ValueError, TypeError):
+                    # Undecodable row: read the file itself and force a re-parse next time
+                    damaged.append((path,))
+                    yield parse_file(str(self.results_dir / path))
+
+            if damaged:
+                with conn:
+                    conn.executemany("DELETE FROM results WHERE path = ?", damaged)
+        finally:
+            conn.close()
+            stats.elapsed = time.perf_counter() - started
+            stats.peak_rss_mb = peak_rss_mb()
+
+    def cached_records(self) -> Iterator[ResultRecord]:
+        """
+        Stream the records stored by the last refresh without touching the results directory
+
+        Useful when the directory has already been cleaned for a new run.
+        Yields nothing if the index is missing or unreadable.
+        """
+        if not self.db_path.exists():
+            return
+
+        try:
+            conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True, timeout=30)
+        except sqlite3.DatabaseError:
+            return
+        try:
+            for (payload,) in conn.execute("SELECT record FROM results ORDER BY path"):
+                try:
+                    yield _decode(payload)
+                except (ValueError, TypeError):
+                    continue
+        except sqlite3.DatabaseError:
+            return
+        finally:
+            conn.close()
+
+    def _refresh(self, conn: sqlite3.Connection, workers: int, stats: IngestStats):
+        indexed = {
+            path: (mtime, size)
+            for path, mtime, size in conn.execute("SELECT path, mtime_ns, size FROM results")
+        }
+        current = self._scan()
+
+        removed = [(path,) for path in indexed.keys() - current.keys()]
+        changed = [path for path, sig in current.items() if indexed.get(path) != sig]
+        stats.from_index += len(current) - len(changed)
+        stats.files += len(current) - len(changed)
+
+        with conn:
+            conn.executemany("DELETE FROM results WHERE path = ?", removed)
+
+            rows = []
+            full_paths = (str(self.results_dir / name) for name in changed)
+            for full_path, record in parse_paths(full_paths, workers=workers, stats=stats):
+                name = os.path.basename(full_path)
+                mtime_ns, size = current[name]
+                rows.append((name, mtime_ns, size, _encode(record)))
+                if len(rows) >= 1000:
+                    self._upsert(conn, rows)
+                    rows = []
+            self._upsert(conn, rows)
+
+            # Files that failed to parse must not keep a stale row from an older version
+            conn.executemany("DELETE FROM results WHERE path = ?", [(name,) for name, _ in stats.errors])
+
+    @staticmethod
+    def _upsert(conn: sqlite3.Connection, rows):
+        conn.executemany(
+            "INSERT INTO results (path, mtime_ns, size, record) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(path) DO UPDATE SET mtime_ns = excluded.mtime_ns, size = excluded.size, "
+            "record = excluded.record",
+            rows,
+        )
@@ -0,0 +1,103 @@
+"""
+Async Runner
+Runs coroutines on an event loop owned by a background thread, so sync
+pytest tests (and pytest-playwright's sync browser) can drive async page objects
+"""
+import asyncio
+import contextvars
+import threading
+from typing import Any, Awaitable, Optional
+
+from playwright.async_api import Browser, Playwright, async_playwright
+
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+
+class AsyncRunner:
+    """
+    Event loop on a dedicated thread
+
+    The sync Playwright API refuses to start inside a thread with a running
+    event loop, so async Playwright gets a thread of its own.
+
+    Example:
+        with AsyncRunner() as runner:
+            results = runner.run(login_concurrently(browser, base_url, users))
+    """
+
+    def __init__(self, name: str = "async-runner"):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, name=name, daemon=True)
+        self._thread.start()
+
+    def run(self, coro: Awaitable, timeout: Optional[float] = None) -> Any:
+        """
+        Run a coroutine on the loop and wait for its result
+
+        The coroutine runs in a copy of the caller's context, so the test's
+        ContextVars (timeout budget, step timing tree) apply to the async
+        page calls it makes. Tasks it gathers each get their own copy, which
+        is why concurrent page calls are charged to the budget individually.
+
+        Args:
+            coro: Coroutine to run
+            timeout: Seconds to wait (None waits indefinitely)
+
+        Returns:
+            The coroutine's result (its exception is re-raised here)
+        """
+        context = contextvars.copy_context()
+        return context.run(asyncio.run_coroutine_threadsafe, coro, self.loop).result(timeout)
+
+    def close(self):
+        if self.loop.is_closed():
+            return
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout=10)
+        self.loop.close()
+
+    def __enter__(self) -> "AsyncRunner":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class AsyncBrowserSession:
+    """
+    async_playwright and one launched browser, living on an AsyncRunner
+
+    Example:
+        session = AsyncBrowserSession(runner, "chromium", {"headless": True})
+        session.start()
+        runner.run(login_concurrently(session.browser, base_url, users))
+        session.stop()
+    """
+
+    def __init__(self, runner: AsyncRunner, browser_name: str = "chromium", launch_args: dict = None):
+        self.runner = runner
+        self.browser_name = browser_name
+        self.launch_args = launch_args or {}
+        self.playwright: Optional[Playwright] = None
+        self.browser: Optional[Browser] = None
+
+    def start(self) -> "AsyncBrowserSession":
+        async def _start():
+            self.playwright = await async_playwright().start()
+            self.browser = await getattr(self.playwright, self.browser_name).launch(**self.launch_args)
+
+        self.runner.run(_start())
+        log.debug(f"Async {self.browser_name} browser started")
+        return self
+
+    def stop(self):
+        async def _stop():
+            if self.browser is not None:
+                await self.browser.close()
+            if self.playwright is not None:
+                await self.playwright.stop()
+
+        self.runner.run(_stop())
+        self.browser = self.playwright = None
@@ -0,0 +1,218 @@
+"""
+Authenticated Storage State Cache
+Logs each user in once per session and reuses the Playwright storage state
+"""
+import hashlib
+import json
+import os
+import tempfile
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from playwright.sync_api import Browser, BrowserContext
+
+from pages.login_page import LoginPage
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+# Seconds between attempts to take a login lock held by another worker
+LOCK_POLL_S = 0.1
+
+
+class StorageStateCache:
+    """
+    File-backed cache of Playwright storage_state keyed by (base URL, username)
+
+    Files are written atomically (temp file + rename) so pytest-xdist workers
+    sharing the cache directory never read a half-written state. A miss is
+    resolved under a per-user lock file, so workers that miss at the same
+    time log in once and the others reuse that state.
+
+    Example:
+        cache = StorageStateCache(Path(".auth"), ttl=1800)
+        state = cache.get_or_login(browser, base_url, "standard_user", "secret_sauce")
+        context = browser.new_context(storage_state=str(state))
+    """
+
+    def __init__(self, cache_dir: Path = Path(".auth"), ttl: int = 1800, lock_timeout: float = 60):
+        """
+        Initialize cache
+
+        Args:
+            cache_dir: Directory holding storage state files
+            ttl: Seconds after which a cached state is considered expired
+            lock_timeout: Age in seconds after which a login lock file counts as abandoned
+                (its holder crashed); keep it above the slowest UI login
+        """
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+        self.lock_timeout = lock_timeout
+        self.hits = 0
+        self.misses = 0
+
+    def path_for(self, base_url: str, username: str) -> Path:
+        """
+        Get storage state file path for a user
+
+        Args:
+            base_url: Base URL of the application
+            username: Username or email
+
+        Returns:
+            Path of the cache file (may not exist)
+        """
+        key = hashlib.sha1(f"{base_url.rstrip('/')}\n{username}".encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, base_url: str, username: str) -> Optional[Path]:
+        """
+        Get a cached, non-expired storage state
+
+        Returns:
+            Path to storage state file or None if missing or expired
+        """
+        path = self.path_for(base_url, username)
+        try:
+            age = time.time() - path.stat().st_mtime
+        except FileNotFoundError:
+            return None
+
+        if age > self.ttl:
+            log.debug(f"Storage state for {username} expired ({age:.0f}s old)")
+            return None
+        return path
+
+    def store(self, base_url: str, username: str, state: Dict) -> Path:
+        """
+        Atomically write a storage state
+
+        Args:
+            base_url: Base URL of the application
+            username: Username or email
+            state: Storage state dict from BrowserContext.storage_state()
+
+        Returns:
+            Path of the written file
+        """
+        path = self.path_for(base_url, username)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, prefix=f".{path.stem}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(state, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        return path
+
+    @contextmanager
+    def _locked(self, path: Path):
+        """
+        Hold the exclusive lock file of a cache entry (portable: O_CREAT | O_EXCL)
+
+        A lock counts as abandoned when the file itself is older than
+        lock_timeout, however long this worker has waited. The file holds a
+        token unique to its creator, and only the creator removes it, so a
+        holder whose lock was broken never deletes its successor's lock.
+        """
+        lock = path.with_suffix('.lock')
+        token = f"{os.getpid()}-{uuid.uuid4().hex}"
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        while True:
+            try:
+                fd = os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                break
+            except FileExistsError:
+                if self._lock_age(lock) > self.lock_timeout:
+                    # Look again right before breaking it: another waiter may have just replaced it
+                    if self._lock_age(lock) > self.lock_timeout:
+                        log.warning(f"Breaking abandoned login lock {lock.name}")
+                        lock.unlink(missing_ok=True)
+                    continue
+                time.sleep(LOCK_POLL_S)
+
+        try:
+            os.write(fd, token.encode('ascii'))
+            os.close(fd)
+            yield
+        finally:
+            try:
+                if lock.read_text(encoding='ascii') == token:
+                    lock.unlink()
+            except FileNotFoundError:
+                pass
+
+    @staticmethod
+    def _lock_age(lock: Path) -> float:
+        """Seconds since the lock file was created (0 if it is gone)"""
+        try:
+            return time.time() - lock.stat().st_mtime
+        except FileNotFoundError:
+            return 0.0
+
+    def invalidate(self, base_url: str, username: str):
+        """Remove a cached storage state (e.g. after a failed post-login check)"""
+        log.info(f"Invalidating cached storage state for user: {username}")
+        self.path_for(base_url, username).unlink(missing_ok=True)
+
+    def get_or_login(
+        self,
+        browser: Browser,
+        base_url: str,
+        username: str,
+        password: str,
+        context_options: Dict = None,
+        prepare_context: Callable[[BrowserContext], None] = None,
+    ) -> Path:
+        """
+        Get cached storage state, performing a real UI login on a miss
+
+        Args:
+            browser: Playwright browser used for the login context
+            base_url: Base URL of the application
+            username: Username or email
+            password: Password
+            context_options: Extra keyword arguments for browser.new_context
+            prepare_context: Called with the login context before it opens a page (routes, recorders)
+
+        Returns:
+            Path to storage state file
+
+        Raises:
+            AssertionError: If the real login does not succeed
+        """
+        path = self.get(base_url, username)
+        if path is not None:
+            self.hits += 1
+            return path
+
+        with self._locked(self.path_for(base_url, username)):
+            # Another worker may have logged in while this one waited for the lock
+            path = self.get(base_url, username)
+            if path is not None:
+                self.hits += 1
+                return path
+
+            self.misses += 1
+            log.info(f"No cached storage state for {username}, logging in through the UI")
+
+            context = browser.new_context(**(context_options or {}))
+            if prepare_context is not None:
+                prepare_context(context)
+            try:
+                login_page = LoginPage(context.new_page())
+                login_page.quick_login(username, password, base_url)
+                if not login_page.is_logged_in():
+                    raise AssertionError(f"Login failed for user {username}, storage state not cached")
+                return self.store(base_url, username, context.storage_state())
+            finally:
+                context.close()
@@ -0,0 +1,331 @@
+"""
+Browser Context Pool
+Keeps a bounded set of pre-warmed Playwright browser contexts that tests
+check out and return, so a test pays for a reset instead of a new context
+"""
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+from playwright.sync_api import Browser, BrowserContext, Page
+
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+
+class ContextPoolExhausted(RuntimeError):
+    """Raised when no context becomes available within the checkout timeout"""
+
+
+class PooledContext:
+    """A browser context owned by the pool together with its ready page"""
+
+    def __init__(self, context: BrowserContext, page: Page):
+        self.context = context
+        self.page = page
+        self.uses = 0
+        self.created_at = time.monotonic()
+
+
+class BrowserContextPool:
+    """
+    Bounded pool of reusable browser contexts
+
+    Contexts are created lazily up to ``max_size`` (or eagerly with ``prewarm``),
+    reset on return (routes, pages, cookies, permissions, headers) and recycled
+    after ``max_uses`` checkouts or when a reset cannot restore a clean state.
+
+    Example:
+        pool = BrowserContextPool(browser, max_size=4, max_uses=50)
+        with pool.lease() as page:
+            page.goto("https://example.com")
+    """
+
+    def __init__(
+        self,
+        browser: Browser,
+        max_size: int = 4,
+        max_uses: int = 50,
+        context_options: Dict = None,
+        default_timeout: int = 5000,
+        checkout_timeout: float = 30.0,
+    ):
+        """
+        Initialize context pool
+
+        Args:
+            browser: Playwright Browser used to create contexts
+            max_size: Maximum number of contexts alive at the same time
+            max_uses: Checkouts after which a context is closed and replaced
+            context_options: Keyword arguments for browser.new_context (viewport etc.)
+            default_timeout: Default action timeout in milliseconds for pooled contexts
+            checkout_timeout: Seconds to wait for a free context before failing
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        self.browser = browser
+        self.max_size = max_size
+        self.max_uses = max_uses
+        self.context_options = context_options or {}
+        self.default_timeout = default_timeout
+        self.checkout_timeout = checkout_timeout
+
+        self._idle: List[PooledContext] = []
+        self._size = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+        # Statistics
+        self._wait_times: List[float] = []
+        self.created = 0
+        self.recycled = 0
+        self.resets = 0
+
+    # ==================== Lifecycle ====================
+
+    def prewarm(self, count: int = None):
+        """
+        Create contexts up front so the first tests do not pay for them
+
+        Args:
+            count: Number of contexts to create (defaults to max_size)
+        """
+        count = min(count or self.max_size, self.max_size)
+        while True:
+            with self._cond:
+                if self._size >= count:
+                    break
+                self._size += 1
+            entry = self._create()
+            with self._cond:
+                self._idle.append(entry)
+                self._cond.notify()
+        log.info(f"Context pool pre-warmed with {count} context(s)")
+
+    def close(self):
+        """Close every idle context and refuse further checkouts"""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+            self._cond.notify_all()
+
+        for entry in idle:
+            self._destroy(entry)
+
+    # ==================== Checkout / Checkin ====================
+
+    def checkout(self) -> PooledContext:
+        """
+        Take a context out of the pool, waiting if all contexts are in use
+
+        Returns:
+            PooledContext with a fresh page
+
+        Raises:
+            ContextPoolExhausted: If no context frees up within checkout_timeout
+        """
+        started = time.perf_counter()
+        deadline = started + self.checkout_timeout
+
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Context pool is closed")
+                if self._idle:
+                    entry = self._idle.pop()
+                    break
+                if self._size < self.max_size:
+                    self._size += 1
+                    entry = None
+                    break
+
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    raise ContextPoolExhausted(
+                        f"No browser context available after {self.checkout_timeout:.1f}s "
+                        f"(pool size {self.max_size})"
+                    )
+                self._cond.wait(remaining)
+
+        if entry is None:
+            try:
+                entry = self._create()
+            except Exception:
+                self._release_slot()
+                raise
+
+        entry.uses += 1
+        self._wait_times.append(time.perf_counter() - started)
+        return entry
+
+    def checkin(self, entry: PooledContext):
+        """
+        Return a context to the pool, resetting or recycling it
+
+        Args:
+            entry: Context previously obtained from checkout
+        """
+        if self._closed or entry.uses >= self.max_uses or not self._reset(entry):
+            self.recycled += 1
+            self._destroy(entry)
+            self._release_slot()
+            return
+
+        with self._cond:
+            self._idle.append(entry)
+            self._cond.notify()
+
+    @contextmanager
+    def lease(self):
+        """
+        Context manager that checks out a context and yields its page
+
+        Yields:
+            Playwright Page belonging to a pooled context
+        """
+        entry = self.checkout()
+        try:
+            yield entry.page
+        finally:
+            self.checkin(entry)
+
+    # ==================== Internals ====================
+
+    def _create(self) -> PooledContext:
+        """Create a new context with the configured options and a ready page"""
+        context = self.browser.new_context(**self.context_options)
+        context.set_default_timeout(self.default_timeout)
+        page = context.new_page()
+        self.created += 1
+        log.debug(f"Context pool created context #{self.created}")
+        return PooledContext(context, page)
+
+    def _reset(self, entry: PooledContext) -> bool:
+        """
+        Restore a context to a clean state
+
+        Returns:
+            True if the context can be reused, False if it must be recycled
+        """
+        context = entry.context
+        try:
+            context.unroute_all(behavior='ignoreErrors')
+            for page in list(context.pages):
+                page.close()
+            context.clear_cookies()
+            context.clear_permissions()
+            context.set_extra_http_headers({})
+            context.set_offline(False)
+
+            # localStorage survives closing pages; only a fresh context clears it
+            state = context.storage_state()
+            if any(origin.get('localStorage') for origin in state.get('origins', [])):
+                log.debug("Context pool recycling context with leftover localStorage")
+                return False
+
+            entry.page = context.new_page()
+            self.resets += 1
+            return True
+
+        except Exception as e:
+            log.warning(f"Context pool reset failed, recycling context: {str(e)}")
+            return False
+
+    def _destroy(self, entry: PooledContext):
+        """Close a context, ignoring errors from an already dead browser"""
+        try:
+            entry.context.close()
+        except Exception as e:
+            log.debug(f"Context pool close failed: {str(e)}")
+
+    def _release_slot(self):
+        """Free a pool slot and wake up one waiting checkout"""
+        with self._cond:
+            self._size -= 1
+            self._cond.notify()
+
+    # ==================== Statistics ====================
+
+    def usage(self) -> Dict:
+        """
+        Raw usage counters of this pool
+
+        Returns:
+            Dict with checkout waits (seconds) and context lifecycle counters;
+            usages of several processes combine with merge_usage
+        """
+        return {
+            'waits_s': list(self._wait_times),
+            'max_size': self.max_size,
+            'created': self.created,
+            'recycled': self.recycled,
+            'resets': self.resets,
+        }
+
+    def stats(self) -> Dict:
+        """
+        Get pool usage statistics
+
+        Returns:
+            Dict with checkout counts, wait times (ms) and context lifecycle counters
+        """
+        return usage_stats(self.usage())
+
+    def format_stats(self) -> Optional[str]:
+        """
+        Format statistics as a one-line summary
+
+        Returns:
+            Summary string or None if the pool was never used
+        """
+        return format_usage(self.usage())
+
+
+def merge_usage(usages: List[Dict]) -> Dict:
+    """Combine BrowserContextPool.usage() of several processes (e.g. xdist workers); sizes add up"""
+    merged = {'waits_s': [], 'max_size': 0, 'created': 0, 'recycled': 0, 'resets': 0}
+    for usage in usages:
+        merged['waits_s'].extend(usage['waits_s'])
+        for key in ('max_size', 'created', 'recycled', 'resets'):
+            merged[key] += usage[key]
+    return merged
+
+
+def usage_stats(usage: Dict) -> Dict:
+    """Checkout counts, wait percentiles (ms) and lifecycle counters of a usage dict"""
+    waits = sorted(usage['waits_s'])
+    count = len(waits)
+
+    def percentile(p: float) -> float:
+        if not waits:
+            return 0.0
+        return waits[min(count - 1, int(p * count))] * 1000
+
+    return {
+        'checkouts': count,
+        'max_size': usage['max_size'],
+        'created': usage['created'],
+        'recycled': usage['recycled'],
+        'resets': usage['resets'],
+        'wait_avg_ms': (sum(waits) / count * 1000) if count else 0.0,
+        'wait_p50_ms': percentile(0.50),
+        'wait_p95_ms': percentile(0.95),
+        'wait_max_ms': waits[-1] * 1000 if waits else 0.0,
+    }
+
+
+def format_usage(usage: Dict) -> Optional[str]:
+    """One-line summary of a usage dict, or None if no context was checked out"""
+    s = usage_stats(usage)
+    if not s['checkouts']:
+        return None
+    return (
+        f"Context pool: {s['checkouts']} checkouts, {s['created']} created, "
+        f"{s['recycled']} recycled, {s['resets']} resets (size {s['max_size']}) | "
+        f"wait avg {s['wait_avg_ms']:.1f}ms, p50 {s['wait_p50_ms']:.1f}ms, "
+        f"p95 {s['wait_p95_ms']:.1f}ms, max {s['wait_max_ms']:.1f}ms"
+    )
@@ -0,0 +1,338 @@
+"""
+Test Data Provider
+Lazily loads user and case datasets (JSON, CSV, JSONL), feeds them into
+pytest.mark.parametrize and hands every xdist worker its own slice of accounts
+"""
+import csv
+import itertools
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+import pytest
+
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+FORMATS = ('.json', '.jsonl', '.csv')
+
+# Line-based files at least this large get a tag index sidecar (<file>.idx.json)
+INDEX_MIN_BYTES = 1024 * 1024
+
+# CSV datasets keep tags in one column, separated by this character
+CSV_TAG_SEPARATOR = ';'
+
+
+def _tags_of(record: Dict) -> List[str]:
+    tags = record.get('tags') or []
+    if isinstance(tags, str):
+        tags = [t.strip() for t in tags.split(CSV_TAG_SEPARATOR) if t.strip()]
+    return list(tags)
+
+
+def _matches(record: Dict, tags: Sequence[str]) -> bool:
+    return set(tags).issubset(_tags_of(record))
+
+
+# ==================== Tag Index ====================
+
+class TagIndex:
+    """
+    Byte offsets of the records of a line-based dataset, by tag
+
+    Selecting by tag then seeks straight to the matching lines instead of
+    parsing the whole file. The sidecar is rebuilt when the dataset's size or
+    modification time changes.
+    """
+
+    def __init__(self, size: int, mtime_ns: int, offsets: Dict[str, List[int]], fields: Optional[List[str]] = None):
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.offsets = offsets
+        self.fields = fields
+
+    def lookup(self, tags: Sequence[str]) -> List[int]:
+        """Offsets of the records carrying every tag, in file order"""
+        matching = None
+        for tag in tags:
+            offsets = set(self.offsets.get(tag, ()))
+            matching = offsets if matching is None else matching & offsets
+        return sorted(matching or ())
+
+    def is_current(self, path: Path) -> bool:
+        stat = path.stat()
+        return stat.st_size == self.size and stat.st_mtime_ns == self.mtime_ns
+
+    def to_dict(self) -> Dict:
+        return {'size': self.size, 'mtime_ns': self.mtime_ns, 'fields': self.fields, 'tags': self.offsets}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "TagIndex":
+        return cls(data['size'], data['mtime_ns'], data['tags'], data.get('fields'))
+
+
+# ==================== Datasets ====================
+
+class Dataset:
+    """
+    One data file, read only when records are requested
+
+    JSONL and CSV are streamed line by line (one record per line); JSON is
+    parsed once on first use and kept, as it cannot be streamed. A JSON
+    file may hold a list of records or an object with one list (e.g.
+    {"users": [...]}).
+
+    Example:
+        cases = dataset("test_data/login_cases.jsonl")
+        for case in cases.select(['empty_fields']):
+            ...
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.format = self.path.suffix.lower()
+        if self.format not in FORMATS:
+            raise ValueError(f"Unsupported dataset format '{self.format}' ({self.path}), expected one of {FORMATS}")
+        self._records: Optional[List[Dict]] = None
+        self._index: Optional[TagIndex] = None
+        self._lock = threading.Lock()
+
+    def __iter__(self) -> Iterator[Dict]:
+        return self.select()
+
+    def select(self, tags: Sequence[str] = ()) -> Iterator[Dict]:
+        """
+        Records carrying every given tag (all records without tags)
+
+        Returns:
+            Iterator over records; nothing is read before iteration starts
+        """
+        if self.format == '.json':
+            return (r for r in self._json_records() if _matches(r, tags))
+        if tags and self.path.stat().st_size >= INDEX_MIN_BYTES:
+            return self._read_at(self.index().lookup(tags))
+        return (r for r in self._stream() if _matches(r, tags))
+
+    # ==================== Reading ====================
+
+    def _json_records(self) -> List[Dict]:
+        with self._lock:
+            if self._records is None:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    text = f.read()
+                data = json.loads(text) if text.strip() else []
+                if isinstance(data, dict):
+                    lists = [value for value in data.values() if isinstance(value, list)]
+                    if len(lists) != 1:
+                        raise ValueError(f"{self.path}: expected a list of records or an object with one list")
+                    data = lists[0]
+                self._records = data
+        return self._records
+
+    def _stream(self) -> Iterator[Dict]:
+        with open(self.path, 'r', encoding='utf-8', newline='') as f:
+            if self.format == '.csv':
+                yield from csv.DictReader(f)
+                return
+            for number, line in enumerate(f, 1):
+                if line.strip():
+                    yield self._parse_jsonl(line, number)
+
+    def _read_at(self, offsets: Iterable[int]) -> Iterator[Dict]:
+        fields = self.index().fields
+        with open(self.path, 'rb') as f:
+            for offset in offsets:
+                f.seek(offset)
+                line = f.readline().decode('utf-8')
+                if self.format == '.csv':
+                    yield dict(zip(fields, next(csv.reader([line]))))
+                else:
+                    yield self._parse_jsonl(line, offset)
+
+    def _parse_jsonl(self, line: str, position: int) -> Dict:
+        try:
+            return json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"{self.path}: invalid JSON record at {position}: {e}") from None
+
+    # ==================== Index ====================
+
+    @property
+    def index_path(self) -> Path:
+        return self.path.with_name(self.path.name + '.idx.json')
+
+    def index(self) -> TagIndex:
+        """Tag index of a JSONL/CSV dataset, loaded from or written to the sidecar file"""
+        with self._lock:
+            if self._index is not None and self._index.is_current(self.path):
+                return self._index
+            self._index = self._load_index() or self._build_index()
+            return self._index
+
+    def _load_index(self) -> Optional[TagIndex]:
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                index = TagIndex.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError):
+            return None
+        return index if index.is_current(self.path) else None
+
+    def _build_index(self) -> TagIndex:
+        stat = self.path.stat()
+        offsets: Dict[str, List[int]] = {}
+        fields = None
+        with open(self.path, 'rb') as f:
+            offset = 0
+            for number, raw in enumerate(iter(f.readline, b''), 1):
+                line = raw.decode('utf-8')
+                if self.format == '.csv' and fields is None:
+                    fields = next(csv.reader([line]))
+                elif line.strip():
+                    if self.format == '.csv':
+                        record = dict(zip(fields, next(csv.reader([line]))))
+                    else:
+                        record = self._parse_jsonl(line, number)
+                    for tag in _tags_of(record):
+                        offsets.setdefault(tag, []).append(offset)
+                offset += len(raw)
+
+        index = TagIndex(stat.st_size, stat.st_mtime_ns, offsets, fields)
+        # Workers may build the same index at once; each writes a complete file
+        tmp = self.index_path.with_name(f"{self.index_path.name}.{os.getpid()}.tmp")
+        try:
+            tmp.write_text(json.dumps(index.to_dict()), encoding='utf-8')
+            os.replace(tmp, self.index_path)
+        except OSError as e:
+            log.debug(f"Tag index of {self.path} kept in memory: {e}")
+        log.info(f"Indexed {self.path.name}: {len(offsets)} tags")
+        return index
+
+
+_datasets: Dict[Path, Dataset] = {}
+
+
+def dataset(path) -> Dataset:
+    """Shared Dataset for a file (created on first use, read on first iteration)"""
+    key = Path(path).resolve()
+    if key not in _datasets:
+        _datasets[key] = Dataset(key)
+    return _datasets[key]
+
+
+def parametrize(argnames: str, path, tags: Sequence[str] = (), id_field: str = 'id'):
+    """
+    pytest.mark.parametrize over the records of a dataset
+
+    Args:
+        argnames: Comma-separated record fields passed as test arguments
+        path: Dataset file (JSON, JSONL or CSV)
+        tags: Only records carrying every tag
+        id_field: Record field used as the test id
+
+    Returns:
+        pytest.mark.parametrize decorator
+
+    Example:
+        @data_provider.parametrize('username,password,expected_error', CASES, tags=['empty_fields'])
+        def test_login_empty_fields(self, page, username, password, expected_error):
+    """
+    names = [name.strip() for name in argnames.split(',')]
+    params = []
+    for number, record in enumerate(dataset(path).select(tags), 1):
+        missing = [name for name in names if name not in record]
+        if missing:
+            raise ValueError(f"{path}: record {record.get(id_field, number)} has no {', '.join(missing)}")
+        params.append(pytest.param(*(record[name] for name in names), id=str(record.get(id_field, number))))
+    if not params:
+        raise ValueError(f"{path}: no records tagged {list(tags)}")
+    return pytest.mark.parametrize(names, params)
+
+
+# ==================== Accounts ====================
+
+class Account(NamedTuple):
+    username: str
+    password: str
+    role: str
+    tags: Tuple[str, ...]
+
+
+def worker_partition(shard_index: int = 1, shard_total: int = 1) -> Tuple[int, int]:
+    """
+    Slot of this process among all processes running tests at once
+
+    Combines the CI shard (--shard-index/--shard-total) with the xdist worker
+    (PYTEST_XDIST_WORKER=gwN, PYTEST_XDIST_WORKER_COUNT).
+
+    Returns:
+        (0-based slot, number of slots)
+    """
+    worker = os.getenv('PYTEST_XDIST_WORKER', '')
+    workers = int(os.getenv('PYTEST_XDIST_WORKER_COUNT', '1'))
+    worker_index = int(worker[2:]) if worker.startswith('gw') else 0
+    return (shard_index - 1) * workers + worker_index, shard_total * workers
+
+
+class AccountPool:
+    """
+    Accounts of a users dataset, split into disjoint per-worker slices
+
+    Test ids must be identical on every xdist worker, so accounts are not
+    parametrized; tests ask the pool for a role at run time. The accounts
+    matching a role and tags are split round-robin by slot, so two workers
+    never log in with the same account (unless there are fewer accounts than
+    slots, which is logged). Within its slice a worker rotates accounts.
+
+    Example:
+        account = user_accounts.take('standard', tags=['local'])
+        login_page.login(account.username, account.password)
+    """
+
+    def __init__(self, path, slot: int = 0, slots: int = 1):
+        self.dataset = dataset(path)
+        self.slot = slot
+        self.slots = slots
+        self._cycles: Dict[Tuple, Iterator[Account]] = {}
+
+    def accounts(self, role: Optional[str] = None, tags: Sequence[str] = ()) -> List[Account]:
+        """Every account with the role and tags, in dataset order (all workers)"""
+        return [
+            Account(r['username'], r['password'], r.get('role', ''), tuple(_tags_of(r)))
+            for r in self.dataset.select(tags)
+            if role is None or r.get('role') == role
+        ]
+
+    def slice(self, role: str, tags: Sequence[str] = ()) -> List[Account]:
+        """This worker's accounts with the role and tags"""
+        matching = self.accounts(role, tags)
+        if not matching:
+            return []
+        if len(matching) < self.slots:
+            log.warning(
+                f"Only {len(matching)} '{role}' accounts for {self.slots} workers, some workers share accounts"
+            )
+            return [matching[self.slot % len(matching)]]
+        return matching[self.slot::self.slots]
+
+    def take(self, role: str, tags: Sequence[str] = ()) -> Account:
+        """
+        Next account of this worker's slice
+
+        Raises:
+            LookupError: The dataset has no account with the role and tags
+        """
+        key = (role, tuple(sorted(tags)))
+        cycle = self._cycles.get(key)
+        if cycle is None:
+            accounts = self.slice(role, tags)
+            if not accounts:
+                raise LookupError(f"No '{role}' account tagged {list(tags)} in {self.dataset.path}")
+            cycle = self._cycles[key] = itertools.cycle(accounts)
+        return next(cycle)
+
+    def credentials(self, role: Optional[str] = None, tags: Sequence[str] = ()) -> Dict[str, str]:
+        """username -> password of every matching account (e.g. to seed the local app)"""
+        return {a.username: a.password for a in self.accounts(role, tags)}
@@ -0,0 +1,158 @@
+"""
+Batched DOM Probe
+Reads visibility, text and attributes of many selectors in a single in-page evaluation
+"""
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+# Supports plain CSS plus Playwright's :has-text("...") pseudo-class and
+# comma-separated fallback lists. Alternatives using any other Playwright-only
+# syntax are reported as unsupported so the caller can fall back to a Locator.
+_PROBE_FUNCTION = """
+(args) => {
+    const splitAlternatives = (selector) => {
+        const parts = [];
+        let depth = 0, quote = null, current = '';
+        for (const ch of selector) {
+            if (quote) {
+                if (ch === quote) quote = null;
+            } else if (ch === '"' || ch === "'") {
+                quote = ch;
+            } else if (ch === '(' || ch === '[') {
+                depth++;
+            } else if (ch === ')' || ch === ']') {
+                depth--;
+            } else if (ch === ',' && depth === 0) {
+                parts.push(current.trim());
+                current = '';
+                continue;
+            }
+            current += ch;
+        }
+        if (current.trim()) parts.push(current.trim());
+        return parts;
+    };
+
+    const normalize = (text) => (text || '').replace(/\\s+/g, ' ').trim().toLowerCase();
+
+    const queryAlternative = (alternative) => {
+        const texts = [];
+        const css = alternative.replace(/:has-text\\((["'])(.*?)\\1\\)/g, (_, q, text) => {
+            texts.push(normalize(text));
+            return '';
+        }) || '*';
+        let elements;
+        try {
+            elements = Array.from(document.querySelectorAll(css));
+        } catch (e) {
+            return null;
+        }
+        return elements.filter((el) => {
+            const content = normalize(el.textContent);
+            return texts.every((t) => content.includes(t));
+        });
+    };
+
+    const isVisible = (el) => {
+        const rect = el.getBoundingClientRect();
+        const style = window.getComputedStyle(el);
+        return rect.width > 0 && rect.height > 0 && style.visibility !== 'hidden';
+    };
+
+    const probe = (selector) => {
+        const state = {found: false, visible: false, count: 0, text: null,
+                       attributes: {}, matched: null, supported: true};
+        const alternatives = splitAlternatives(selector);
+        let chosen = null;
+        alternatives.forEach((alternative, index) => {
+            const elements = queryAlternative(alternative);
+            if (elements === null) {
+                state.supported = false;
+                return;
+            }
+            state.count += elements.length;
+            const visible = elements.find(isVisible);
+            if (visible && !state.visible) {
+                state.visible = true;
+                state.matched = index;
+                chosen = visible;
+            } else if (elements.length && chosen === null) {
+                state.matched = index;
+                chosen = elements[0];
+            }
+        });
+        state.found = state.count > 0;
+        if (chosen) {
+            state.text = chosen.textContent;
+            for (const name of args.attributes) {
+                state.attributes[name] = chosen.getAttribute(name);
+            }
+        }
+        return state;
+    };
+
+    const elements = {};
+    for (const [name, selector] of Object.entries(args.selectors)) {
+        elements[name] = probe(selector);
+    }
+    const ready = (args.require || []).every((name) => elements[name] && elements[name].visible);
+    if (args.waitMode && !ready) return false;
+    return {url: window.location.href, title: document.title, elements};
+}
+"""
+
+PROBE_SCRIPT = _PROBE_FUNCTION.strip()
+
+
+@dataclass
+class ElementState:
+    """State of one selector at snapshot time"""
+
+    name: str
+    selector: str
+    found: bool = False
+    visible: bool = False
+    count: int = 0
+    text: Optional[str] = None
+    attributes: Dict[str, Optional[str]] = field(default_factory=dict)
+    matched: Optional[int] = None  # Index of the comma-separated alternative that matched
+    supported: bool = True  # False if the selector uses syntax the probe cannot evaluate
+
+
+@dataclass
+class PageSnapshot:
+    """Typed result of a batched probe"""
+
+    url: str
+    title: str
+    elements: Dict[str, ElementState]
+
+    def __getitem__(self, name: str) -> ElementState:
+        return self.elements[name]
+
+    def all_visible(self, *names: str) -> bool:
+        """Check that every named element (or all elements) is visible"""
+        names = names or tuple(self.elements)
+        return all(self.elements[n].visible for n in names)
+
+    def missing(self) -> List[str]:
+        """Names of elements that are not visible"""
+        return [n for n, e in self.elements.items() if not e.visible]
+
+
+def build_snapshot(raw: Dict, selectors: Dict[str, str]) -> PageSnapshot:
+    """
+    Convert the raw probe result into a PageSnapshot
+
+    Args:
+        raw: Value returned by PROBE_SCRIPT
+        selectors: Name -> selector mapping that was probed
+
+    Returns:
+        PageSnapshot
+    """
+    elements = {
+        name: ElementState(name=name, selector=selector, **raw['elements'][name])
+        for name, selector in selectors.items()
+    }
+    return PageSnapshot(url=raw['url'], title=raw['title'], elements=elements)
@@ -0,0 +1,348 @@
+"""
+History-Driven Test Scheduler
+Predicts test durations from earlier runs and distributes tests across
+pytest-xdist workers with longest-processing-time-first bin packing
+"""
+import heapq
+import statistics
+import time
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+import pytest
+
+from utils.allure_index import AllureResultIndex
+from utils.allure_ingest import iter_result_files, stream_results
+from utils.history_analytics import FAIL_STATUSES, HistoryAnalyzer
+
+DEFAULT_ESTIMATE_S = 5.0
+
+
+def allure_key(nodeid: str) -> Tuple[str, str]:
+    """
+    Map a pytest node id to the (fullName, name) pair allure-pytest records
+
+    Example:
+        "tests/smoke/test_login_smoke.py::TestLoginSmoke::test_valid_login[chromium]"
+        -> ("tests.smoke.test_login_smoke.TestLoginSmoke#test_valid_login", "test_valid_login[chromium]")
+    """
+    parts = nodeid.split("::")
+    module = parts[0][:-3] if parts[0].endswith(".py") else parts[0]
+    package = module.replace("/", ".").replace("\\", ".")
+    name = parts[-1]
+    container = ".".join([package] + parts[1:-1])
+    return f"{container}#{name.split('[')[0]}", name
+
+
+def lpt_pack(durations: Sequence[float], workers: int) -> Tuple[List[List[int]], List[float]]:
+    """
+    Longest-processing-time-first bin packing
+
+    Args:
+        durations: Estimated duration per test
+        workers: Number of bins
+
+    Returns:
+        (bins of test indices, predicted load per bin)
+    """
+    bins: List[List[int]] = [[] for _ in range(workers)]
+    loads = [0.0] * workers
+    heap = [(0.0, w) for w in range(workers)]
+    for idx in sorted(range(len(durations)), key=lambda i: durations[i], reverse=True):
+        load, w = heapq.heappop(heap)
+        bins[w].append(idx)
+        loads[w] = load + durations[idx]
+        heapq.heappush(heap, (loads[w], w))
+    return bins, loads
+
+
+class DurationEstimates:
+    """
+    Duration estimates and recent failures per test from earlier runs
+
+    Sources, in order of preference: the EWMA duration from
+    .allure/history.jsonl, then the last run's Allure results (the results
+    directory if it still has files, otherwise the SQLite results index).
+    The results are machine-local, so load(scan_results=False) reads the
+    committed history file only. Tests without history get the median of
+    their class/module, then the global median, then DEFAULT_ESTIMATE_S.
+    """
+
+    def __init__(self):
+        self.durations: Dict[Tuple[str, str], float] = {}
+        self.failed: set = set()
+
+    def load(self, history_file: Path, results_dir: Path, index_path: Path,
+             scan_results: bool = True) -> "DurationEstimates":
+        """
+        Read all available sources (missing ones are ignored)
+
+        Args:
+            history_file: .allure/history.jsonl
+            results_dir: Allure results directory of the previous run
+            index_path: SQLite results index (utils.allure_index)
+            scan_results: Also read the last run's results (results_dir, or the index once
+                it is cleaned); pass False when every process must see identical estimates,
+                since both depend on what ran on this machine
+        """
+        analyzer = HistoryAnalyzer()
+        analyzer.analyze(history_file)
+        for test in analyzer.tests.values():
+            key = (test.full_name, test.name)
+            if test.ewma is not None:
+                self.durations[key] = test.ewma / 1000
+            if test.outcomes and not test.outcomes[-1]:
+                self.failed.add(key)
+
+        if not scan_results:
+            records = ()
+        elif results_dir.exists() and next(iter_result_files(results_dir), None):
+            records = stream_results(results_dir)
+        else:
+            records = AllureResultIndex(index_path, results_dir).cached_records()
+        for record in records:
+            key = (record.full_name, record.name)
+            if record.duration_ms > 0:
+                self.durations.setdefault(key, record.duration_ms / 1000)
+            if record.status in FAIL_STATUSES:
+                self.failed.add(key)
+
+        self._by_container = defaultdict(list)
+        for (full_name, _), seconds in self.durations.items():
+            self._by_container[full_name.split("#")[0]].append(seconds)
+        self._median = statistics.median(self.durations.values()) if self.durations else DEFAULT_ESTIMATE_S
+        return self
+
+    def estimate(self, nodeid: str) -> Tuple[float, bool]:
+        """
+        Predicted duration of a test
+
+        Returns:
+            (seconds, True if the estimate comes from this test's own history)
+        """
+        key = allure_key(nodeid)
+        if key in self.durations:
+            return self.durations[key], True
+        siblings = self._by_container.get(key[0].split("#")[0])
+        return (statistics.median(siblings) if siblings else self._median), False
+
+    def recently_failed(self, nodeid: str) -> bool:
+        return allure_key(nodeid) in self.failed
+
+
+class SchedulePlan:
+    """Per-worker test order produced by the planner"""
+
+    def __init__(self, estimates: DurationEstimates):
+        self.estimates = estimates
+        self.tests = 0
+        self.known = 0
+        self.failed_first = 0
+        self.predicted: Dict[str, float] = {}
+
+    def order(self, nodeids: Sequence[str]) -> List[int]:
+        """Serial order: recently failed tests first, otherwise collection order"""
+        self.tests = len(nodeids)
+        failed = [i for i, nodeid in enumerate(nodeids) if self.estimates.recently_failed(nodeid)]
+        failed_set = set(failed)
+        self.failed_first = len(failed)
+        total = 0.0
+        for nodeid in nodeids:
+            seconds, known = self.estimates.estimate(nodeid)
+            total += seconds
+            self.known += known
+        self.predicted = {"main": total}
+        return failed + [i for i in range(len(nodeids)) if i not in failed_set]
+
+    def pack(self, nodeids: Sequence[str], worker_ids: Sequence[str]) -> List[List[int]]:
+        """
+        LPT bins per worker; inside each bin recently failed tests run first
+
+        Args:
+            nodeids: Collected test ids (the xdist collection)
+            worker_ids: Worker gateway ids, e.g. ['gw0', 'gw1']
+
+        Returns:
+            List of collection indices per worker, in run order
+        """
+        self.tests = len(nodeids)
+        durations = []
+        for nodeid in nodeids:
+            seconds, known = self.estimates.estimate(nodeid)
+            durations.append(seconds)
+            self.known += known
+
+        bins, loads = lpt_pack(durations, len(worker_ids))
+        failed = {i for i, nodeid in enumerate(nodeids) if self.estimates.recently_failed(nodeid)}
+        self.failed_first = len(failed)
+        self.predicted = dict(zip(worker_ids, loads))
+        # sort() is stable, so the LPT (longest first) order is kept within each group
+        return [sorted(b, key=lambda i: i not in failed) for b in bins]
+
+
+def make_xdist_scheduler(config, log, plan: SchedulePlan):
+    """
+    Build an xdist scheduler that feeds each worker its LPT bin a few tests at a time
+
+    Returns None (xdist picks its own scheduler) when pytest-xdist is not
+    installed or a distribution mode other than --dist load was requested.
+    """
+    if config.getoption("dist", "load") != "load":
+        return None
+    try:
+        from xdist.scheduler import LoadScheduling
+    except ImportError:
+        return None
+
+    class HistoryLoadScheduling(LoadScheduling):
+        """
+        LoadScheduling variant that follows the planned LPT bins
+
+        Each worker holds only IN_FLIGHT tests of its bin and gets the next
+        one, in LPT order, as it completes a test. A worker whose bin runs
+        dry (estimates were off, or a worker crashed) takes the shortest
+        remaining test of the fullest other bin, and is shut down only once
+        no test is left to send.
+        """
+
+        IN_FLIGHT = 3
+
+        def __init__(self, config, log=None):
+            super().__init__(config, log)
+            self.queues: Dict = {}  # node -> collection indices of its bin not yet sent
+            self.unsent: set = set()  # mirrors self.pending for O(1) membership
+
+        def schedule(self):
+            assert self.collection_is_completed
+
+            # Rescheduling after a worker restart: feed every node (new ones steal)
+            if self.collection is not None:
+                for node in self.nodes:
+                    self.check_schedule(node)
+                return
+
+            collections = list(self.node2collection.values())
+            if any(collection != collections[0] for collection in collections[1:]):
+                self.log("**Different tests collected, aborting run**")
+                return
+
+            self.collection = collections[0]
+            self.pending[:] = range(len(self.collection))
+            self.unsent = set(self.pending)
+            if not self.collection:
+                return
+
+            bins = plan.pack(self.collection, [node.gateway.id for node in self.nodes])
+            for node, indices in zip(self.nodes, bins):
+                self.queues[node] = deque(indices)
+            for node in self.nodes:
+                self.check_schedule(node)
+
+        def mark_test_pending(self, item: str):
+            self.unsent.add(self.collection.index(item))
+            super().mark_test_pending(item)
+
+        def remove_node(self, node):
+            # A crashed node's tests, except the one it crashed in, go back to self.pending
+            self.unsent.update(self.node2pending.get(node, [])[1:])
+            return super().remove_node(node)
+
+        def check_schedule(self, node, duration: float = 0):
+            if node.shutting_down:
+                return
+            wanted = self.IN_FLIGHT - len(self.node2pending[node])
+            indices = []
+            while len(indices) < wanted and self.pending:
+                indices.append(self._next_for(node))
+            if indices:
+                self.node2pending[node].extend(indices)
+                node.send_runtest_some(indices)
+            if not self.pending:
+                node.shutdown()
+
+        def _next_for(self, node) -> int:
+            """Next test of the node's own bin, else the shortest test of the fullest other bin"""
+            own = self.queues.get(node)
+            index = self._pop(own, deque.popleft) if own else None
+            if index is None:
+                fullest = max(self.queues.values(), key=len, default=None)
+                index = self._pop(fullest, deque.pop) if fullest else None
+            if index is None:
+                index = self.pending[0]  # re-queued after a crash
+            self.pending.remove(index)
+            self.unsent.discard(index)
+            return index
+
+        def _pop(self, queue, take):
+            while queue:
+                index = take(queue)
+                if index in self.unsent:
+                    return index
+            return None
+
+    return HistoryLoadScheduling(config, log)
+
+
+class HistorySchedulingPlugin:
+    """
+    pytest plugin: history-driven ordering and xdist distribution
+
+    Registered by tests/conftest.py on the controller when
+    --schedule-by-history is given. Without xdist it only moves recently
+    failed tests to the front.
+    """
+
+    def __init__(self, estimates: DurationEstimates):
+        self.plan = SchedulePlan(estimates)
+        self.busy: Dict[str, float] = defaultdict(float)
+        self.started = time.perf_counter()
+
+    def pytest_collection_modifyitems(self, config, items):
+        if getattr(config.option, "numprocesses", None):
+            return
+        order = self.plan.order([item.nodeid for item in items])
+        items[:] = [items[i] for i in order]
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_xdist_make_scheduler(self, config, log):
+        return make_xdist_scheduler(config, log, self.plan)
+
+    def pytest_runtest_logreport(self, report):
+        node = getattr(report, "node", None)
+        self.busy[node.gateway.id if node is not None else "main"] += report.duration
+
+    def pytest_terminal_summary(self, terminalreporter):
+        plan = self.plan
+        if not plan.tests:
+            return
+        predicted = max(plan.predicted.values(), default=0.0)
+        actual = max(self.busy.values(), default=0.0)
+        terminalreporter.write_sep("-", "history scheduler")
+        terminalreporter.write_line(
+            f"{plan.tests} tests ({plan.known} with history, {plan.failed_first} recently failed first) "
+            f"on {len(plan.predicted)} worker(s)"
+        )
+        terminalreporter.write_line(
+            f"makespan: predicted {predicted:.1f}s, actual busiest worker {actual:.1f}s, "
+            f"wall {time.perf_counter() - self.started:.1f}s"
+        )
+        for worker in sorted(plan.predicted):
+            terminalreporter.write_line(
+                f"  {worker}: predicted {plan.predicted[worker]:.1f}s, actual {self.busy.get(worker, 0.0):.1f}s"
+            )
+
+
+def load_estimates(project_root: Path, scan_results: bool = True) -> DurationEstimates:
+    """Load duration estimates from the standard locations of a project"""
+    return DurationEstimates().load(
+        project_root / ".allure" / "history.jsonl",
+        project_root / "reports" / "allure-results",
+        project_root / "reports" / "allure-index.sqlite",
+        scan_results=scan_results,
+    )
+
+
+def build_plugin(project_root: Path) -> HistorySchedulingPlugin:
+    """Load estimates for a project and create the plugin"""
+    return HistorySchedulingPlugin(load_estimates(project_root))
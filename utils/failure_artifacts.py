@@ -0,0 +1,245 @@
+"""
+Failure Artifacts
+Captures screenshot and DOM when a test or page-object step fails and
+hands encoding, deduplication and disk writes to a background worker pool
+"""
+import hashlib
+import io
+import re
+import shutil
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+from playwright.sync_api import Error as PlaywrightError, Page
+
+from utils.logger import get_logger, log_screenshot
+
+log = get_logger(__name__)
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional; screenshots are then kept as PNG
+    Image = None
+
+IMAGE_FORMATS = ('webp', 'png')
+MIME_TYPES = {'png': 'image/png', 'webp': 'image/webp', 'html': 'text/html', 'zip': 'application/zip'}
+
+
+class Artifact(NamedTuple):
+    """An encoded file ready to attach"""
+
+    name: str
+    path: Path
+    extension: str
+    deduplicated: bool
+
+    @property
+    def mime_type(self) -> str:
+        return MIME_TYPES[self.extension]
+
+
+def screenshot_type(filename: str) -> str:
+    """Playwright screenshot type for a file name: 'jpeg' for .jpg/.jpeg, otherwise 'png'"""
+    return 'jpeg' if Path(filename).suffix.lower() in ('.jpg', '.jpeg') else 'png'
+
+
+def _slug(label: str) -> str:
+    return re.sub(r'[^A-Za-z0-9_.-]+', '_', label).strip('_')[:120] or 'artifact'
+
+
+class FailureArtifactPipeline:
+    """
+    Failure-only artifact capture with background encoding
+
+    The test thread only grabs raw bytes from the browser (one in-memory
+    screenshot and page.content()) and hashes them; PNG->WebP conversion and
+    file writes run on a small thread pool. Identical content is stored once and
+    reused. Nothing is captured or encoded for passing tests.
+
+    Example:
+        artifacts.configure(Path("reports/failure-artifacts"))
+        artifacts.capture(page, "test_login")       # on failure
+        for artifact in artifacts.collect():         # before the test result closes
+            ...
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.output_dir = Path("reports/failure-artifacts")
+        self.image_format = 'webp'
+        self.webp_quality = 80
+        self.workers = 2
+        self.pending: List[Future] = []
+        self.stats = {'captures': 0, 'deduplicated': 0, 'bytes_written': 0}
+        self._by_hash: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def configure(self, output_dir: Path, image_format: str = 'webp', workers: int = 2, enabled: bool = True):
+        """
+        Enable the pipeline
+
+        Args:
+            output_dir: Where encoded artifacts are written
+            image_format: 'webp' (needs Pillow, falls back to PNG) or 'png'
+            workers: Background encoder threads
+            enabled: Capture artifacts on failure at all
+        """
+        if image_format not in IMAGE_FORMATS:
+            raise ValueError(f"Unknown image format '{image_format}', expected one of {IMAGE_FORMATS}")
+        if image_format == 'webp' and Image is None:
+            log.info("Pillow not installed, failure screenshots are kept as PNG")
+            image_format = 'png'
+        self.output_dir = Path(output_dir)
+        self.image_format = image_format
+        self.workers = workers
+        self.enabled = enabled
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="artifact-encoder")
+        return self._executor
+
+    # ==================== Capture (test thread) ====================
+
+    def capture(self, page: Page, label: str) -> List[Future]:
+        """
+        Grab a screenshot and the DOM of a page and queue them for encoding
+
+        Args:
+            page: Page showing the failure
+            label: Test id or step description used in file and attachment names
+
+        Returns:
+            Futures resolving to Artifact (also kept in self.pending)
+        """
+        futures = []
+        self.stats['captures'] += 1
+        try:
+            png = page.screenshot(type='png', animations='disabled', caret='hide')
+            futures.append(self._submit(png, 'png', f"{label} screenshot", self._encode_image))
+        except PlaywrightError as e:
+            log.debug(f"Failure screenshot unavailable: {e}")
+        try:
+            html = page.content().encode('utf-8')
+            futures.append(self._submit(html, 'html', f"{label} DOM", self._write_bytes))
+        except PlaywrightError as e:
+            log.debug(f"Failure DOM snapshot unavailable: {e}")
+
+        self.pending.extend(futures)
+        return futures
+
+    def save_screenshot(self, image: bytes, filename: str) -> Future:
+        """
+        Write screenshot bytes (encoded as screenshot_type(filename)) to a caller-chosen file in the background
+
+        Returns:
+            Future resolving to the written Path
+        """
+        def _write() -> Path:
+            path = Path(filename)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(image)
+            log_screenshot(str(path))
+            return path
+
+        return self.executor.submit(_write)
+
+    def queue_trace(self, path: Path, label: str, part: int = 1):
+        """Move a trace archive (e.g. a buffered ring chunk) into output_dir in the background"""
+        self.pending.append(self.executor.submit(self._store_trace, Path(path), label, part))
+
+    # ==================== Encoding (worker threads) ====================
+
+    def _submit(self, data: bytes, extension: str, name: str, encoder) -> Future:
+        """Queue content for encoding, reusing the result for content seen before"""
+        digest = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            existing = self._by_hash.get(digest)
+            if existing is not None:
+                self.stats['deduplicated'] += 1
+                return self.executor.submit(_reuse, existing, name)
+            future = self._by_hash[digest] = self.executor.submit(encoder, data, digest, extension, name)
+        return future
+
+    def _target(self, digest: str, extension: str) -> Path:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        return self.output_dir / f"{digest[:16]}.{extension}"
+
+    def _write_bytes(self, data: bytes, digest: str, extension: str, name: str) -> Artifact:
+        path = self._target(digest, extension)
+        path.write_bytes(data)
+        self._count_bytes(len(data))
+        return Artifact(name, path, extension, False)
+
+    def _count_bytes(self, size: int):
+        with self._lock:
+            self.stats['bytes_written'] += size
+
+    def _encode_image(self, png: bytes, digest: str, extension: str, name: str) -> Artifact:
+        if self.image_format != 'webp':
+            return self._write_bytes(png, digest, 'png', name)
+        buffer = io.BytesIO()
+        with Image.open(io.BytesIO(png)) as image:
+            image.save(buffer, format='WEBP', quality=self.webp_quality, method=4)
+        return self._write_bytes(buffer.getvalue(), digest, 'webp', name)
+
+    def _store_trace(self, tmp_path: Path, label: str, part: int) -> Artifact:
+        target = self.output_dir / f"{_slug(label)}.part{part}.trace.zip"
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        shutil.move(str(tmp_path), target)
+        self._count_bytes(target.stat().st_size)
+        return Artifact(f"{label} trace (part {part})", target, 'zip', False)
+
+    # ==================== Collection ====================
+
+    def collect(self, timeout: float = 30) -> List[Artifact]:
+        """
+        Wait for this test's queued artifacts and return them
+
+        Only failing tests have pending work, so passing tests return at once.
+        """
+        pending, self.pending = self.pending, []
+        artifacts = []
+        for future in pending:
+            try:
+                artifacts.append(future.result(timeout=timeout))
+            except Exception as e:
+                log.warning(f"Failure artifact could not be encoded: {e}")
+        return artifacts
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+def _reuse(existing: Future, name: str) -> Artifact:
+    artifact = existing.result()
+    return artifact._replace(name=name, deduplicated=True)
+
+
+def capture_step_failure(description: str, args: tuple, error: BaseException):
+    """
+    log_test_step failure handler: capture the page of the failing page-object step
+
+    The exception is marked, so enclosing steps and the test-level hook do not
+    capture the same failure again.
+    """
+    if not artifacts.enabled or getattr(error, '_failure_artifacts', False):
+        return
+    page = getattr(args[0], 'page', None) if args else None
+    if not isinstance(page, Page) or page.is_closed():
+        return
+    try:
+        error._failure_artifacts = True
+    except AttributeError:
+        pass
+    artifacts.capture(page, description)
+
+
+# Process-wide pipeline, configured by tests/conftest.py
+artifacts = FailureArtifactPipeline()
@@ -0,0 +1,254 @@
+"""
+HAR Record / Replay
+Records each test's traffic to a HAR file and replays it through Playwright
+routing so login suites run offline and deterministically
+"""
+import base64
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from playwright.sync_api import BrowserContext, Error as PlaywrightError, Request, Route
+
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+HAR_MODES = ('off', 'record', 'replay')
+
+# Hop-by-hop / encoding headers that no longer describe the stored (decoded) body
+DROPPED_RESPONSE_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding', 'connection'}
+
+TEXT_MIME = re.compile(r"^(text/|application/(json|javascript|xml|x-www-form-urlencoded)|image/svg)")
+
+
+def har_path(har_dir: Path, nodeid: str) -> Path:
+    """HAR file for a test, named after its node id"""
+    return Path(har_dir) / f"{re.sub(r'[^A-Za-z0-9_.-]+', '_', nodeid).strip('_')}.har"
+
+
+def request_key(method: str, url: str, body: Optional[bytes]) -> Tuple[str, str, str]:
+    """Lookup key: (method, url without fragment, sha1 of the request body)"""
+    return method.upper(), url.split('#', 1)[0], hashlib.sha1(body or b'').hexdigest()
+
+
+class ReplayResponse(NamedTuple):
+    """Recorded response, decoded once when the archive is indexed"""
+
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+
+
+# ==================== Recording ====================
+
+
+class HarRecorder:
+    """
+    Captures finished requests of one or more contexts as HAR 1.2 entries
+
+    Uses the context's `requestfinished` event rather than a route, so it
+    works on pooled contexts and does not change what the page loads.
+    Requests aborted by a network policy never finish and are not recorded.
+    """
+
+    def __init__(self):
+        self.entries: List[Dict] = []
+        self._contexts: List[BrowserContext] = []
+
+    def attach(self, context: BrowserContext):
+        context.on("requestfinished", self._on_finished)
+        self._contexts.append(context)
+
+    def _on_finished(self, request: Request):
+        try:
+            response = request.response()
+            if response is None:
+                return
+            # Playwright keeps no body for redirects (body() raises); status and Location are what replay needs
+            body = b'' if 300 <= response.status < 400 else response.body()
+        except PlaywrightError:
+            return  # page or context went away while the body was read
+
+        mime = response.headers.get('content-type', '')
+        if TEXT_MIME.match(mime):
+            content = {'size': len(body), 'mimeType': mime, 'text': body.decode('utf-8', errors='replace')}
+        else:
+            content = {'size': len(body), 'mimeType': mime, 'text': base64.b64encode(body).decode('ascii'),
+                       'encoding': 'base64'}
+
+        entry = {
+            'startedDateTime': datetime.now(timezone.utc).isoformat(),
+            'time': max(request.timing.get('responseEnd', 0), 0),
+            'request': {
+                'method': request.method,
+                'url': request.url,
+                'httpVersion': 'HTTP/1.1',
+                'headers': [{'name': k, 'value': v} for k, v in request.headers.items()],
+                'queryString': [],
+                'cookies': [],
+                'headersSize': -1,
+                'bodySize': len(request.post_data_buffer or b''),
+            },
+            'response': {
+                'status': response.status,
+                'statusText': response.status_text,
+                'httpVersion': 'HTTP/1.1',
+                'headers': [{'name': k, 'value': v} for k, v in response.headers.items()],
+                'cookies': [],
+                'content': content,
+                'redirectURL': response.headers.get('location', ''),
+                'headersSize': -1,
+                'bodySize': len(body),
+            },
+            'cache': {},
+            'timings': {'send': 0, 'wait': 0, 'receive': 0},
+        }
+        post_data = request.post_data_buffer
+        if post_data is not None:
+            entry['request']['postData'] = {
+                'mimeType': request.headers.get('content-type', ''),
+                'text': base64.b64encode(post_data).decode('ascii'),
+                'encoding': 'base64',  # HAR extension used by Playwright for binary bodies
+            }
+        self.entries.append(entry)
+
+    def save(self, path: Path) -> Optional[Path]:
+        """
+        Detach from all contexts and write the HAR file atomically
+
+        Returns:
+            Path written, or None if nothing was recorded
+        """
+        for context in self._contexts:
+            try:
+                context.remove_listener("requestfinished", self._on_finished)
+            except PlaywrightError:
+                pass
+        self._contexts.clear()
+
+        if not self.entries:
+            return None
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        har = {'log': {'version': '1.2', 'creator': {'name': 'har_replay', 'version': '1.0'},
+                       'pages': [], 'entries': self.entries}}
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(har, f, indent=1)
+        os.replace(tmp_name, path)
+        log.info(f"Recorded {len(self.entries)} requests to {path}")
+        return path
+
+
+# ==================== Replay ====================
+
+
+def _decode_body(data: Optional[Dict]) -> bytes:
+    if not data or 'text' not in data:
+        return b''
+    if data.get('encoding') == 'base64':
+        return base64.b64decode(data['text'])
+    return data['text'].encode('utf-8')
+
+
+class HarIndex:
+    """
+    Immutable lookup table over one or more HAR files
+
+    Maps (method, url, body sha1) to the recorded responses in recording
+    order. Bodies are decoded once at load time so serving a request is a
+    dict lookup plus route.fulfill.
+    """
+
+    def __init__(self):
+        self.entries: Dict[Tuple[str, str, str], List[ReplayResponse]] = {}
+        self.files = 0
+
+    @classmethod
+    def load(cls, paths: Iterable[Path]) -> "HarIndex":
+        index = cls()
+        for path in paths:
+            index.add_file(Path(path))
+        return index
+
+    def add_file(self, path: Path):
+        with open(path, 'r', encoding='utf-8') as f:
+            har = json.load(f)
+        for entry in har.get('log', {}).get('entries', []):
+            request, response = entry['request'], entry['response']
+            key = request_key(request['method'], request['url'], _decode_body(request.get('postData')))
+            headers = {
+                h['name']: h['value'] for h in response.get('headers', [])
+                if h['name'].lower() not in DROPPED_RESPONSE_HEADERS
+            }
+            self.entries.setdefault(key, []).append(
+                ReplayResponse(response['status'], headers, _decode_body(response.get('content')))
+            )
+        self.files += 1
+
+    def __len__(self) -> int:
+        return sum(len(responses) for responses in self.entries.values())
+
+
+_index_cache: Dict[str, HarIndex] = {}
+
+
+def load_index(paths: List[Path]) -> HarIndex:
+    """HarIndex for a set of files, cached per process until any file changes"""
+    signature = "|".join(f"{p}:{p.stat().st_mtime_ns}" for p in paths)
+    index = _index_cache.get(signature)
+    if index is None:
+        started = time.perf_counter()
+        index = _index_cache[signature] = HarIndex.load(paths)
+        log.debug(f"Indexed {len(index)} HAR entries from {index.files} file(s) "
+                  f"in {(time.perf_counter() - started) * 1000:.0f}ms")
+    return index
+
+
+def replay_index_for(path: Path, har_dir: Path) -> HarIndex:
+    """The test's own recording if it exists, otherwise every recording in har_dir"""
+    path = Path(path)
+    if path.exists():
+        return load_index([path])
+    return load_index(sorted(Path(har_dir).glob("*.har")))
+
+
+class HarReplayer:
+    """
+    Serves every request of a context from a HarIndex
+
+    Identical requests are answered with the recorded responses in order,
+    repeating the last one. Requests missing from the archive get a 404 and
+    are listed in `unmatched`.
+    """
+
+    def __init__(self, index: HarIndex):
+        self.index = index
+        self.served = 0
+        self.unmatched: List[str] = []
+        self._cursor: Dict[Tuple[str, str, str], int] = {}
+
+    def attach(self, context: BrowserContext):
+        context.route("**/*", self._handle)
+
+    def _handle(self, route: Route, request: Request):
+        key = request_key(request.method, request.url, request.post_data_buffer)
+        responses = self.index.entries.get(key)
+        if not responses:
+            self.unmatched.append(f"{request.method} {request.url}")
+            route.fulfill(status=404, content_type='text/plain', body='Not in HAR archive')
+            return
+
+        position = self._cursor.get(key, 0)
+        self._cursor[key] = position + 1
+        response = responses[min(position, len(responses) - 1)]
+        self.served += 1
+        route.fulfill(status=response.status, headers=response.headers, body=response.body)
@@ -0,0 +1,242 @@
+"""
+Test History Analytics
+Streams .allure/history.jsonl and keeps rolling per-test statistics to flag
+flaky tests and duration regressions
+"""
+import json
+from collections import deque
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+PASS_STATUSES = {'passed'}
+FAIL_STATUSES = {'failed', 'broken'}
+
+
+def iter_history_runs(history_file: Path) -> Iterator[Tuple[int, Dict]]:
+    """
+    Stream runs from an Allure history file, one line at a time
+
+    Args:
+        history_file: Path to history.jsonl
+
+    Yields:
+        (timestamp, testResults) per run; malformed lines are skipped
+    """
+    with open(history_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                run = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(run, dict) and isinstance(run.get('testResults'), dict):
+                yield run.get('timestamp', 0), run['testResults']
+
+
+class TestHistory:
+    """
+    Rolling statistics for one test case
+
+    Outcomes are kept in a bounded window for the flip rate. Duration is
+    tracked with an EWMA and a Page-Hinkley detector on the ratio of each
+    duration to the running mean of the current regime. When the detector
+    fires, the regime mean before the change becomes the baseline and the
+    statistics restart from the new level.
+    """
+
+    __slots__ = (
+        'history_id', 'name', 'full_name', 'runs', 'failures', 'outcomes',
+        'ewma', 'mean', 'count', 'ph_sum', 'ph_min', 'baseline', 'changed_at',
+    )
+
+    def __init__(self, history_id: str, window: int):
+        self.history_id = history_id
+        self.name = ''
+        self.full_name = ''
+        self.runs = 0
+        self.failures = 0
+        self.outcomes = deque(maxlen=window)
+        self.ewma = None
+        self.mean = 0.0
+        self.count = 0
+        self.ph_sum = 0.0
+        self.ph_min = 0.0
+        self.baseline = None
+        self.changed_at = None
+
+    @property
+    def flip_rate(self) -> float:
+        """Share of consecutive runs in the window whose outcome changed"""
+        if len(self.outcomes) < 2:
+            return 0.0
+        outcomes = list(self.outcomes)
+        flips = sum(1 for a, b in zip(outcomes, outcomes[1:]) if a != b)
+        return flips / (len(outcomes) - 1)
+
+    @property
+    def fail_rate(self) -> float:
+        return self.failures / self.runs if self.runs else 0.0
+
+
+class HistoryAnalyzer:
+    """
+    Flag flaky and slowed-down tests from Allure run history
+
+    Memory is proportional to the number of distinct tests (times the
+    outcome window), not to the number of runs in the file.
+
+    Example:
+        analyzer = HistoryAnalyzer()
+        report = analyzer.analyze(Path(".allure/history.jsonl"))
+        report['flaky'], report['slower']
+    """
+
+    def __init__(
+        self,
+        window: int = 20,
+        min_runs: int = 5,
+        flaky_flip_rate: float = 0.2,
+        ewma_alpha: float = 0.3,
+        ph_delta: float = 0.05,
+        ph_threshold: float = 1.5,
+        slowdown_ratio: float = 1.3,
+        min_slowdown_ms: int = 200,
+    ):
+        """
+        Initialize analyzer
+
+        Args:
+            window: Number of recent outcomes used for the flip rate
+            min_runs: Runs a test needs before it can be flagged
+            flaky_flip_rate: Flip rate at or above which a test is flaky
+            ewma_alpha: Smoothing factor for the duration EWMA
+            ph_delta: Page-Hinkley tolerance, as a fraction of the regime mean
+            ph_threshold: Page-Hinkley alarm threshold (cumulative excess ratio)
+            slowdown_ratio: EWMA / baseline ratio needed to report a slowdown
+            min_slowdown_ms: Absolute increase needed to report a slowdown
+        """
+        self.window = window
+        self.min_runs = min_runs
+        self.flaky_flip_rate = flaky_flip_rate
+        self.ewma_alpha = ewma_alpha
+        self.ph_delta = ph_delta
+        self.ph_threshold = ph_threshold
+        self.slowdown_ratio = slowdown_ratio
+        self.min_slowdown_ms = min_slowdown_ms
+        self.tests: Dict[str, TestHistory] = {}
+        self.runs = 0
+
+    # ==================== Ingestion ====================
+
+    def analyze(self, history_file: Path) -> Optional[Dict]:
+        """
+        Stream a history file and build the findings
+
+        Args:
+            history_file: Path to history.jsonl
+
+        Returns:
+            Report dict, or None if the file does not exist
+        """
+        history_file = Path(history_file)
+        if not history_file.exists():
+            return None
+
+        for timestamp, results in iter_history_runs(history_file):
+            self.add_run(timestamp, results)
+        return self.report()
+
+    def add_run(self, timestamp: int, results: Dict[str, Dict]):
+        """Fold one run's testResults into the rolling statistics"""
+        self.runs += 1
+        for history_id, result in results.items():
+            test = self.tests.get(history_id)
+            if test is None:
+                test = self.tests[history_id] = TestHistory(history_id, self.window)
+            test.name = result.get('name', test.name)
+            test.full_name = result.get('fullName', test.full_name)
+            self._observe(test, timestamp, result)
+
+    def _observe(self, test: TestHistory, timestamp: int, result: Dict):
+        status = result.get('status', 'unknown')
+        if status in PASS_STATUSES:
+            test.outcomes.append(True)
+        elif status in FAIL_STATUSES:
+            test.outcomes.append(False)
+            test.failures += 1
+        else:
+            return  # skipped/unknown runs say nothing about flakiness or speed
+        test.runs += 1
+
+        duration = result.get('duration')
+        if duration is None:
+            duration = result.get('stop', 0) - result.get('start', 0)
+        if duration <= 0:
+            return
+
+        test.ewma = duration if test.ewma is None else (
+            self.ewma_alpha * duration + (1 - self.ewma_alpha) * test.ewma
+        )
+
+        if test.count:
+            # Page-Hinkley on the upward direction, scale-free via the regime mean
+            test.ph_sum += duration / test.mean - 1 - self.ph_delta
+            test.ph_min = min(test.ph_min, test.ph_sum)
+            if test.ph_sum - test.ph_min > self.ph_threshold and test.count >= self.min_runs:
+                test.baseline = test.mean
+                test.changed_at = timestamp
+                test.mean, test.count, test.ph_sum, test.ph_min = 0.0, 0, 0.0, 0.0
+                test.ewma = duration
+
+        test.count += 1
+        test.mean += (duration - test.mean) / test.count
+
+    # ==================== Findings ====================
+
+    def flaky_tests(self) -> List[Dict]:
+        """Tests whose recent outcomes keep flipping, most flaky first"""
+        flaky = []
+        for test in self.tests.values():
+            if test.runs < self.min_runs:
+                continue
+            flip_rate = test.flip_rate
+            if flip_rate >= self.flaky_flip_rate:
+                flaky.append({
+                    'name': test.name,
+                    'fullName': test.full_name,
+                    'historyId': test.history_id,
+                    'runs': test.runs,
+                    'flip_rate': round(flip_rate, 3),
+                    'fail_rate': round(test.fail_rate, 3),
+                })
+        return sorted(flaky, key=lambda t: t['flip_rate'], reverse=True)
+
+    def slower_tests(self) -> List[Dict]:
+        """Tests with a detected duration change point that are still slower, worst first"""
+        slower = []
+        for test in self.tests.values():
+            if test.baseline is None or test.ewma is None:
+                continue
+            ratio = test.ewma / test.baseline
+            if ratio >= self.slowdown_ratio and test.ewma - test.baseline >= self.min_slowdown_ms:
+                slower.append({
+                    'name': test.name,
+                    'fullName': test.full_name,
+                    'historyId': test.history_id,
+                    'baseline_ms': round(test.baseline),
+                    'ewma_ms': round(test.ewma),
+                    'ratio': round(ratio, 2),
+                    'changed_at': test.changed_at,
+                })
+        return sorted(slower, key=lambda t: t['ratio'], reverse=True)
+
+    def report(self) -> Dict:
+        """Summary of the analyzed history"""
+        return {
+            'runs': self.runs,
+            'tests_tracked': len(self.tests),
+            'flaky': self.flaky_tests(),
+            'slower': self.slower_tests(),
+        }
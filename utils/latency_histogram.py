@@ -0,0 +1,150 @@
+"""
+Latency Histogram
+HDR-style log-linear histogram: fixed relative precision over a wide value
+range, constant-time recording and mergeable across runs and workers
+"""
+import math
+from typing import Dict, Iterable, List, Tuple
+
+DEFAULT_PERCENTILES = (50, 90, 95, 99, 99.9)
+
+
+class LatencyHistogram:
+    """
+    Records integer values (microseconds) with a bounded relative error
+
+    Values below the sub-bucket count are stored exactly; above that each
+    power-of-two range is split into the same number of linear sub-buckets,
+    so the error stays below 10^-significant_figures of the value, like
+    HdrHistogram. Counts are kept sparse, so memory grows with the number of
+    distinct buckets hit rather than with the value range.
+
+    Example:
+        histogram = LatencyHistogram()
+        histogram.record_ms(142.7)
+        histogram.percentile_ms(99)
+    """
+
+    def __init__(self, significant_figures: int = 2):
+        """
+        Initialize histogram
+
+        Args:
+            significant_figures: Decimal digits of precision kept (1-4)
+        """
+        if not 1 <= significant_figures <= 4:
+            raise ValueError(f"significant_figures must be between 1 and 4, got {significant_figures}")
+        self.significant_figures = significant_figures
+        self._sub_bits = math.ceil(math.log2(2 * 10 ** significant_figures))
+        self._sub_count = 1 << self._sub_bits
+        self._half = self._sub_count >> 1
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    # ==================== Bucketing ====================
+
+    def _index(self, value: int) -> int:
+        if value < self._sub_count:
+            return value
+        shift = value.bit_length() - self._sub_bits
+        return self._sub_count + (shift - 1) * self._half + ((value >> shift) - self._half)
+
+    def _highest_equivalent(self, index: int) -> int:
+        """Largest value that lands in the same bucket"""
+        if index < self._sub_count:
+            return index
+        shift, offset = divmod(index - self._sub_count, self._half)
+        shift += 1
+        return ((offset + self._half + 1) << shift) - 1
+
+    # ==================== Recording ====================
+
+    def record(self, value_us: int, count: int = 1):
+        """Record a value in microseconds (negative values count as 0)"""
+        value = max(int(value_us), 0)
+        index = self._index(value)
+        self.counts[index] = self.counts.get(index, 0) + count
+        self.count += count
+        self.total += value * count
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def record_ms(self, value_ms: float):
+        self.record(round(value_ms * 1000))
+
+    def merge(self, other: "LatencyHistogram"):
+        """Add another histogram's counts (both must use the same precision)"""
+        if other.significant_figures != self.significant_figures:
+            raise ValueError("Cannot merge histograms with different precision")
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        if other.count:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+
+    # ==================== Queries ====================
+
+    def percentile(self, percentile: float) -> int:
+        """
+        Value at a percentile, in microseconds
+
+        Returns the highest value equivalent to the bucket holding the
+        requested rank (capped at the recorded maximum), 0 when empty.
+        """
+        if not self.count:
+            return 0
+        rank = max(1, math.ceil(percentile / 100 * self.count))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(self._highest_equivalent(index), self.max)
+        return self.max
+
+    def percentile_ms(self, percentile: float) -> float:
+        return self.percentile(percentile) / 1000
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total / self.count / 1000 if self.count else 0.0
+
+    def buckets_ms(self) -> List[Tuple[float, int]]:
+        """(bucket upper bound in ms, count) for every non-empty bucket, ascending"""
+        return [(self._highest_equivalent(i) / 1000, self.counts[i]) for i in sorted(self.counts)]
+
+    # ==================== Serialization ====================
+
+    def summary(self, percentiles: Iterable[float] = DEFAULT_PERCENTILES) -> Dict:
+        """Count, min/mean/max and percentiles in milliseconds"""
+        return {
+            'count': self.count,
+            'min_ms': (self.min or 0) / 1000,
+            'mean_ms': round(self.mean_ms, 3),
+            'max_ms': (self.max or 0) / 1000,
+            'percentiles_ms': {f"p{p:g}": self.percentile_ms(p) for p in percentiles},
+        }
+
+    def to_dict(self) -> Dict:
+        """Summary plus the sparse bucket counts needed to rebuild or merge the histogram"""
+        return {
+            **self.summary(),
+            'significant_figures': self.significant_figures,
+            'total_us': self.total,
+            'counts': sorted(self.counts.items()),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "LatencyHistogram":
+        histogram = cls(data['significant_figures'])
+        histogram.counts = {int(index): count for index, count in data['counts']}
+        histogram.count = data['count']
+        histogram.total = data['total_us']
+        if histogram.count:
+            histogram.min = round(data['min_ms'] * 1000)
+            histogram.max = round(data['max_ms'] * 1000)
+        return histogram
@@ -0,0 +1,66 @@
+"""
+Load Test Report
+Markdown rendering of login load results, kept free of browser dependencies
+so report generation can include it
+"""
+import json
+from pathlib import Path
+from typing import Dict, Optional
+
+
+def load_result_data(path: Path) -> Optional[Dict]:
+    """Saved load result JSON, or None when the file is missing or unreadable"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def render_markdown(data: Dict) -> str:
+    """
+    Markdown section for a load result (LoadResult.to_dict or its saved JSON)
+
+    Used by the load CLI and included by TestReportGenerator.
+    """
+    profile = data['profile']
+    total = data['attempts'] or 1
+    percentiles = data['latency']['percentiles_ms']
+
+    md = f"""## 🏋️ Login Load Test
+
+- **Run:** {data['started_at']} against `{data['base_url']}`
+- **Profile:** {profile['attempts']} attempts, {profile['arrival_rate']:g}/s after a {profile['ramp_up_s']:g}s ramp-up, \
+{profile['max_concurrency']} concurrent contexts
+
+| Metric | Value |
+|--------|-------|
+| Duration | {data['elapsed_s']:.1f}s |
+| Throughput | {data['throughput_per_s']:.2f} attempts/s |
+| Error rate | {data['error_rate'] * 100:.1f}% |
+| Mean latency | {data['latency']['mean_ms']:.0f}ms |
+| Max latency | {data['latency']['max_ms']:.0f}ms |
+
+### Outcomes
+
+| Outcome | Count | Share |
+|---------|-------|-------|
+"""
+    for outcome, count in data['outcomes'].items():
+        md += f"| {outcome} | {count} | {count / total * 100:.1f}% |\n"
+
+    md += "\n### Latency Percentiles (ms)\n\n"
+    md += "| Outcome | " + " | ".join(percentiles) + " |\n"
+    md += "|---------|" + "|".join("------" for _ in percentiles) + "|\n"
+    md += "| **all** | " + " | ".join(f"{v:.0f}" for v in percentiles.values()) + " |\n"
+    for outcome, summary in data['latency_by_outcome'].items():
+        md += f"| {outcome} | " + " | ".join(f"{v:.0f}" for v in summary['percentiles_ms'].values()) + " |\n"
+
+    service = data['service_time']['percentiles_ms']
+    md += f"\nService time (login flow only): p50 {service['p50']:.0f}ms, p99 {service['p99']:.0f}ms\n"
+
+    if data['top_errors']:
+        md += "\n### Top Errors\n\n"
+        for message, count in data['top_errors']:
+            md += f"- `{message}` ({count}x)\n"
+    return md
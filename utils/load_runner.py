@@ -0,0 +1,224 @@
+"""
+Login Load Runner
+Drives concurrent browser contexts through the LoginPage flow at a configured
+arrival rate and records latency histograms and outcome splits
+"""
+import asyncio
+import itertools
+import json
+import math
+import time
+from collections import Counter
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from playwright.async_api import Browser
+
+from pages.async_login_page import AsyncLoginPage
+from utils.latency_histogram import LatencyHistogram
+from utils.load_report import render_markdown
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+OUTCOMES = ('success', 'lockout', 'rejected', 'error')
+
+
+@dataclass
+class LoadProfile:
+    """
+    Shape of the generated load
+
+    Attributes:
+        attempts: Total login attempts to start
+        arrival_rate: Attempts started per second once ramp-up is over
+        ramp_up_s: Seconds over which the rate grows linearly from 0 to arrival_rate
+        max_concurrency: Browser contexts open at the same time
+        timeout_ms: Per-attempt timeout for navigation and the login outcome
+    """
+
+    attempts: int = 100
+    arrival_rate: float = 5.0
+    ramp_up_s: float = 10.0
+    max_concurrency: int = 20
+    timeout_ms: int = 10000
+
+    def __post_init__(self):
+        if self.arrival_rate <= 0 or self.max_concurrency < 1:
+            raise ValueError("arrival_rate must be positive and max_concurrency at least 1")
+
+    def arrival_times(self) -> List[float]:
+        """
+        Intended start offset (seconds) of each attempt
+
+        Inverts the cumulative arrivals of a linear ramp (rate * t^2 / 2T)
+        followed by a constant rate, so the schedule is deterministic.
+        """
+        rate, ramp = self.arrival_rate, self.ramp_up_s
+        ramp_arrivals = rate * ramp / 2
+        times = []
+        for i in range(self.attempts):
+            if ramp > 0 and i <= ramp_arrivals:
+                times.append(math.sqrt(2 * ramp * i / rate))
+            else:
+                times.append(ramp + (i - ramp_arrivals) / rate)
+        return times
+
+
+def classify(logged_in: bool, error: Optional[str]) -> str:
+    """Outcome of one attempt: success, lockout, rejected or error"""
+    if logged_in:
+        return 'success'
+    if error is None:
+        return 'error'
+    text = error.lower()
+    if 'locked' in text or 'too many' in text:
+        return 'lockout'
+    return 'rejected'
+
+
+class LoadResult:
+    """
+    Outcome counts and latency histograms of one load run
+
+    Two histograms are kept: `latency` is measured from the attempt's
+    intended start, so time spent waiting for a free context counts
+    (avoiding coordinated omission); `service` starts once the attempt has
+    a context and only covers the login flow itself.
+    """
+
+    def __init__(self, profile: LoadProfile, base_url: str):
+        self.profile = profile
+        self.base_url = base_url
+        self.outcomes: Counter = Counter()
+        self.latency = {outcome: LatencyHistogram() for outcome in OUTCOMES}
+        self.service = LatencyHistogram()
+        self.errors: Counter = Counter()
+        self.started_at = datetime.now().isoformat(timespec='seconds')
+        self.elapsed_s = 0.0
+
+    def add(self, outcome: str, latency_ms: float, service_ms: float, error: str = None):
+        self.outcomes[outcome] += 1
+        self.latency[outcome].record_ms(latency_ms)
+        self.service.record_ms(service_ms)
+        if error:
+            self.errors[error] += 1
+
+    @property
+    def total(self) -> int:
+        return sum(self.outcomes.values())
+
+    def overall_latency(self) -> LatencyHistogram:
+        histogram = LatencyHistogram()
+        for outcome_histogram in self.latency.values():
+            histogram.merge(outcome_histogram)
+        return histogram
+
+    def to_dict(self) -> Dict:
+        total = self.total
+        return {
+            'started_at': self.started_at,
+            'base_url': self.base_url,
+            'profile': asdict(self.profile),
+            'elapsed_s': round(self.elapsed_s, 3),
+            'attempts': total,
+            'throughput_per_s': round(total / self.elapsed_s, 3) if self.elapsed_s else 0.0,
+            'outcomes': {outcome: self.outcomes[outcome] for outcome in OUTCOMES},
+            'error_rate': round(self.outcomes['error'] / total, 4) if total else 0.0,
+            'latency': self.overall_latency().to_dict(),
+            'latency_by_outcome': {o: h.summary() for o, h in self.latency.items() if h.count},
+            'service_time': self.service.summary(),
+            'top_errors': self.errors.most_common(5),
+        }
+
+
+class LoginLoadRunner:
+    """
+    Open-model load generator for the login flow
+
+    Attempts start on the LoadProfile schedule whether or not earlier ones
+    finished; each gets a fresh browser context and runs the AsyncLoginPage
+    navigate + login flow.
+    Credentials are used round-robin, so a wrong password repeated across
+    attempts exercises lockout.
+
+    Example:
+        runner = LoginLoadRunner(browser, base_url, [{'username': 'u', 'password': 'p'}])
+        result = await runner.run(LoadProfile(attempts=200, arrival_rate=10))
+    """
+
+    def __init__(self, browser: Browser, base_url: str, credentials: Sequence[Dict[str, str]],
+                 context_options: Dict = None):
+        """
+        Initialize runner
+
+        Args:
+            browser: playwright.async_api Browser
+            base_url: Base URL of the application
+            credentials: Dicts with 'username' and 'password'
+            context_options: Options for browser.new_context
+        """
+        if not credentials:
+            raise ValueError("At least one credential is required")
+        self.browser = browser
+        self.base_url = base_url
+        self.credentials = list(credentials)
+        self.context_options = context_options or {}
+
+    async def run(self, profile: LoadProfile) -> LoadResult:
+        result = LoadResult(profile, self.base_url)
+        semaphore = asyncio.Semaphore(profile.max_concurrency)
+        users = itertools.cycle(self.credentials)
+        started = time.perf_counter()
+
+        async def attempt(offset: float, user: Dict[str, str]):
+            await asyncio.sleep(max(0.0, started + offset - time.perf_counter()))
+            intended = started + offset
+            async with semaphore:
+                began = time.perf_counter()
+                outcome, error = await self._attempt(user, profile.timeout_ms)
+                finished = time.perf_counter()
+            result.add(outcome, (finished - intended) * 1000, (finished - began) * 1000, error)
+
+        log.info(f"Load run: {profile.attempts} attempts at {profile.arrival_rate}/s "
+                 f"(ramp-up {profile.ramp_up_s}s, {profile.max_concurrency} contexts)")
+        await asyncio.gather(*(attempt(offset, next(users)) for offset in profile.arrival_times()))
+        result.elapsed_s = time.perf_counter() - started
+        return result
+
+    async def _attempt(self, user: Dict[str, str], timeout_ms: int):
+        """Run one login; returns (outcome, error text for unexpected failures)"""
+        context = await self.browser.new_context(**self.context_options)
+        try:
+            context.set_default_timeout(timeout_ms)
+            login_page = AsyncLoginPage(await context.new_page())
+            await login_page.navigate(f"{self.base_url}/login")
+            await login_page.login(user['username'], user['password'])
+            logged_in = await login_page.is_logged_in()
+            message = None if logged_in else await login_page.get_error_message()
+            outcome = classify(logged_in, message)
+            return outcome, "No login outcome (neither dashboard nor error shown)" if outcome == 'error' else None
+        except Exception as e:
+            return 'error', f"{type(e).__name__}: {str(e).splitlines()[0] if str(e) else ''}"
+        finally:
+            await context.close()
+
+
+def save_result(result: LoadResult, output_dir: Path, name: str = "login_load") -> Dict[str, Path]:
+    """
+    Write <name>.json and <name>.md into output_dir
+
+    Returns:
+        {'json': path, 'markdown': path}
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    data = result.to_dict()
+    json_path = output_dir / f"{name}.json"
+    md_path = output_dir / f"{name}.md"
+    with open(json_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+    with open(md_path, 'w', encoding='utf-8') as f:
+        f.write(render_markdown(data))
+    return {'json': json_path, 'markdown': md_path}
@@ -1,8 +1,23 @@
+import atexit
 import logging
+import logging.handlers
 import os
 import functools
+import inspect
+import queue
+import threading
+from contextlib import nullcontext
 from datetime import datetime
 from pathlib import Path
+from typing import Callable, List
+
+from utils.step_timing import finish_step, start_step
+
+try:
+    from allure import step as _allure_step
+except ImportError:  # scripts run without the test dependencies
+    def _allure_step(description):
+        return nullcontext()
 
 
 class ColoredFormatter(logging.Formatter):
@@ -18,14 +33,170 @@ class ColoredFormatter(logging.Formatter):
     RESET = '\033[0m'
 
     def format(self, record):
+        # Work on a copy: the same record is passed to the file sinks afterwards
+        record = logging.makeLogRecord(record.__dict__)
         log_color = self.COLORS.get(record.levelname, self.RESET)
         record.levelname = f"{log_color}{record.levelname}{self.RESET}"
         return super().format(record)
 
 
+class BatchFileHandler(logging.Handler):
+    """
+    File sink that buffers formatted lines and appends them in batches
+
+    Each flush is a single os.write on an O_APPEND descriptor, so several
+    pytest-xdist worker processes can share the same daily log file without
+    interleaving partial lines.
+    """
+
+    def __init__(self, filename: Path, capacity: int = 200, flush_level: int = logging.ERROR):
+        """
+        Initialize batch file handler
+
+        Args:
+            filename: Log file path
+            capacity: Buffered lines that trigger a flush
+            flush_level: Records at or above this level are flushed immediately
+        """
+        super().__init__()
+        self.filename = Path(filename)
+        self.capacity = capacity
+        self.flush_level = flush_level
+        self._buffer = []
+        self._fd = None
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            self._buffer.append(self.format(record) + '\n')
+            if len(self._buffer) >= self.capacity or record.levelno >= self.flush_level:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        self.acquire()
+        try:
+            if not self._buffer:
+                return
+            if self._fd is None:
+                self._fd = os.open(self.filename, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            data = ''.join(self._buffer).encode('utf-8')
+            self._buffer.clear()
+            while data:
+                written = os.write(self._fd, data)
+                data = data[written:]
+        finally:
+            self.release()
+
+    def close(self):
+        try:
+            self.flush()
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+        finally:
+            super().close()
+
+
+class _BatchingQueueListener(logging.handlers.QueueListener):
+    """QueueListener that flushes its sinks whenever the queue has been idle for a moment"""
+
+    def __init__(self, log_queue, *handlers, flush_interval: float = 0.5):
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self.flush_interval = flush_interval
+
+    def dequeue(self, block):
+        while True:
+            try:
+                return self.queue.get(block, self.flush_interval)
+            except queue.Empty:
+                for handler in self.handlers:
+                    handler.flush()
+
+
+class _PipelineQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that (re)starts the shared listener on first use"""
+
+    def emit(self, record):
+        if _listener is None:
+            _start_pipeline()
+        super().emit(record)
+
+
+_queue = queue.SimpleQueue()
+_queue_handler = _PipelineQueueHandler(_queue)
+_listener = None
+_pipeline_lock = threading.Lock()
+
+
+def _start_pipeline():
+    """Create the process-wide sinks and start the listener thread"""
+    global _listener
+
+    with _pipeline_lock:
+        if _listener is not None:
+            return
+
+        # Create logs directory
+        log_dir = Path("logs")
+        log_dir.mkdir(exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d")
+
+        file_formatter = logging.Formatter(
+            '%(asctime)s | %(name)s | %(levelname)s | %(funcName)s:%(lineno)d | %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
+
+        # === File Sink (Detailed logs) ===
+        file_handler = BatchFileHandler(log_dir / f"test_{timestamp}.log")
+        file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(file_formatter)
+
+        # === Console Sink (Colored output) ===
+        console_handler = logging.StreamHandler()
+        console_handler.setLevel(logging.INFO)
+        console_handler.setFormatter(ColoredFormatter(
+            '%(asctime)s | %(levelname)s | %(message)s',
+            datefmt='%H:%M:%S'
+        ))
+
+        # === Error File Sink (Errors only) ===
+        error_handler = BatchFileHandler(log_dir / f"errors_{timestamp}.log")
+        error_handler.setLevel(logging.ERROR)
+        error_handler.setFormatter(file_formatter)
+
+        _listener = _BatchingQueueListener(_queue, file_handler, console_handler, error_handler)
+        _listener.start()
+
+
+def shutdown_logging():
+    """
+    Drain the log queue, flush every sink and stop the listener thread
+
+    Called at pytest session end and at interpreter exit. Logging afterwards
+    transparently starts a new pipeline.
+    """
+    global _listener
+
+    with _pipeline_lock:
+        listener, _listener = _listener, None
+        if listener is None:
+            return
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+atexit.register(shutdown_logging)
+
+
 def get_logger(name: str = __name__, level: str = "INFO") -> logging.Logger:
     """
-    Create and configure logger with file and console handlers
+    Get a logger attached to the shared non-blocking logging pipeline
+
+    All loggers enqueue records onto one process-wide queue; a single listener
+    thread writes them to the console and to batched daily log files, so test
+    threads never block on disk.
 
     Args:
         name: Logger name (usually __name__)
@@ -46,55 +217,55 @@ def get_logger(name: str = __name__, level: str = "INFO") -> logging.Logger:
 
     logger.setLevel(getattr(logging, level.upper()))
     logger.propagate = False  # Prevent duplicate logs
-
-    # Create logs directory
-    log_dir = Path("logs")
-    log_dir.mkdir(exist_ok=True)
-
-    # === File Handler (Detailed logs) ===
-    timestamp = datetime.now().strftime("%Y%m%d")
-    file_handler = logging.FileHandler(
-        log_dir / f"test_{timestamp}.log",
-        encoding='utf-8'
-    )
-    file_handler.setLevel(logging.DEBUG)
-
-    file_formatter = logging.Formatter(
-        '%(asctime)s | %(name)s | %(levelname)s | %(funcName)s:%(lineno)d | %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    file_handler.setFormatter(file_formatter)
-
-    # === Console Handler (Colored output) ===
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.INFO)
-
-    console_formatter = ColoredFormatter(
-        '%(asctime)s | %(levelname)s | %(message)s',
-        datefmt='%H:%M:%S'
-    )
-    console_handler.setFormatter(console_formatter)
-
-    # === Error File Handler (Errors only) ===
-    error_handler = logging.FileHandler(
-        log_dir / f"errors_{timestamp}.log",
-        encoding='utf-8'
-    )
-    error_handler.setLevel(logging.ERROR)
-    error_handler.setFormatter(file_formatter)
-
-    # Add all handlers
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
-    logger.addHandler(error_handler)
+    logger.addHandler(_queue_handler)
 
     return logger
 
 
+# Called as handler(description, args) before a sync step runs
+_step_start_handlers: List[Callable] = []
+# Called as handler(description, args, exception) when a sync step fails
+_step_failure_handlers: List[Callable] = []
+
+
+def on_step_start(handler: Callable):
+    """
+    Register a handler run before each sync log_test_step step (e.g. trace chunk rotation)
+
+    Args:
+        handler: Callable (description, positional args of the step)
+    """
+    if handler not in _step_start_handlers:
+        _step_start_handlers.append(handler)
+
+
+def on_step_failure(handler: Callable):
+    """
+    Register a handler for failing log_test_step steps (e.g. failure artifact capture)
+
+    Args:
+        handler: Callable (description, positional args of the step, exception)
+    """
+    if handler not in _step_failure_handlers:
+        _step_failure_handlers.append(handler)
+
+
+def _notify_step_failure(description: str, args: tuple, error: Exception):
+    for handler in _step_failure_handlers:
+        try:
+            handler(description, args, error)
+        except Exception as e:
+            get_logger(__name__).debug(f"Step failure handler failed: {e}")
+
+
 def log_test_step(description: str):
     """
     Decorator to log test steps with execution time
 
+    Durations are measured with perf_counter_ns and nested into the running
+    test's step tree (utils.step_timing). Sync steps are also reported as
+    Allure steps when allure is installed.
+
     Args:
         description: Step description
 
@@ -105,18 +276,43 @@ def log_test_step(description: str):
     """
 
     def decorator(func):
+        log = get_logger(func.__module__)
+
+        if inspect.iscoroutinefunction(func):
+            # Allure keeps its step stack per thread, which concurrent tasks would interleave
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                log.info(f"▶ STEP: {description}")
+                node, token, started = start_step(description)
+                try:
+                    result = await func(*args, **kwargs)
+                except Exception as e:
+                    finish_step(node, token, started, e)
+                    log.error(f"✗ FAILED: {description} | Error: {str(e)} ({node.duration_ns / 1e6:.0f}ms)")
+                    raise
+                finish_step(node, token, started)
+                log.info(f"✓ PASSED: {description} ({node.duration_ns / 1e6:.0f}ms)")
+                return result
+
+            return async_wrapper
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            log = get_logger(func.__module__)
             log.info(f"▶ STEP: {description}")
-
-            try:
-                result = func(*args, **kwargs)
-                log.info(f"✓ PASSED: {description}")
-                return result
-            except Exception as e:
-                log.error(f"✗ FAILED: {description} | Error: {str(e)}")
-                raise
+            for handler in _step_start_handlers:
+                handler(description, args)
+            with _allure_step(description):
+                node, token, started = start_step(description)
+                try:
+                    result = func(*args, **kwargs)
+                except Exception as e:
+                    finish_step(node, token, started, e)
+                    log.error(f"✗ FAILED: {description} | Error: {str(e)} ({node.duration_ns / 1e6:.0f}ms)")
+                    _notify_step_failure(description, args, e)
+                    raise
+                finish_step(node, token, started)
+            log.info(f"✓ PASSED: {description} ({node.duration_ns / 1e6:.0f}ms)")
+            return result
 
         return wrapper
 
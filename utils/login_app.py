@@ -0,0 +1,358 @@
+"""
+Local Login Application
+Lightweight threaded HTTP stand-in for the application under test, serving
+the pages LoginPage expects (/login, /dashboard, /forgot-password) with
+configurable latency, failure injection and account lockout
+"""
+import argparse
+import html
+import json
+import random
+import secrets
+import threading
+import time
+from dataclasses import dataclass, field
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+from urllib.parse import parse_qs, urlsplit
+
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+DEFAULT_USERS = {
+    'testuser@example.com': 'ValidPass123!',
+    'user@example.com': 'ValidPass123!',
+    'standard_user': 'secret_sauce',
+}
+SESSION_COOKIE = 'session'
+REMEMBER_ME_SECONDS = 30 * 24 * 3600
+
+PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head><meta charset="utf-8"><title>{title}</title></head>
+<body>
+{body}
+</body>
+</html>
+"""
+
+LOGIN_FORM = """<h1>Sign in</h1>
+{error}<form method="post" action="/login">
+  <label for="username">Username or email</label>
+  <input id="username" name="username" type="text" autocomplete="username" value="{username}">
+  <label for="password">Password</label>
+  <input id="password" name="password" type="password" autocomplete="current-password">
+  <label><input type="checkbox" name="remember_me" value="1"> Remember me</label>
+  <button type="submit">Login</button>
+</form>
+<a href="/forgot-password">Forgot password?</a>
+"""
+
+
+@dataclass
+class LoginAppConfig:
+    """
+    Behaviour of the local app (can be changed while it runs)
+
+    Attributes:
+        users: username -> password
+        locked_users: Accounts that are always locked
+        latency_ms: Added delay per request
+        jitter_ms: Random extra delay, uniform in [0, jitter_ms]
+        failure_rate: Share of page requests answered with 503 (0..1)
+        lockout_threshold: Failed attempts before an account locks
+        lockout_seconds: How long a lockout lasts
+        seed: Seed for jitter and failure injection
+    """
+
+    users: Dict[str, str] = field(default_factory=lambda: dict(DEFAULT_USERS))
+    locked_users: set = field(default_factory=lambda: {'locked_out_user'})
+    latency_ms: float = 0
+    jitter_ms: float = 0
+    failure_rate: float = 0.0
+    lockout_threshold: int = 5
+    lockout_seconds: float = 300
+    seed: Optional[int] = None
+
+
+class LoginAppState:
+    """Thread-safe sessions, failed-attempt counters and lockouts"""
+
+    def __init__(self, config: LoginAppConfig):
+        self.config = config
+        self.lock = threading.Lock()
+        self.rng = random.Random(config.seed)
+        self.sessions: Dict[str, str] = {}
+        self.failures: Dict[str, int] = {}
+        self.locked_until: Dict[str, float] = {}
+        self.requests = 0
+        self.injected_failures = 0
+
+    def reset(self):
+        with self.lock:
+            self.sessions.clear()
+            self.failures.clear()
+            self.locked_until.clear()
+            self.requests = 0
+            self.injected_failures = 0
+
+    def delay(self) -> float:
+        with self.lock:
+            self.requests += 1
+            jitter = self.rng.uniform(0, self.config.jitter_ms) if self.config.jitter_ms else 0
+        return (self.config.latency_ms + jitter) / 1000
+
+    def inject_failure(self) -> bool:
+        with self.lock:
+            failed = self.config.failure_rate > 0 and self.rng.random() < self.config.failure_rate
+            self.injected_failures += failed
+        return failed
+
+    def authenticate(self, username: str, password: str) -> tuple:
+        """
+        Check credentials and update lockout state
+
+        Returns:
+            (session token or None, error message or None)
+        """
+        if not username and not password:
+            return None, "Username and password are required"
+        if not username:
+            return None, "Username is required"
+        if not password:
+            return None, "Password is required"
+
+        locked = "Account locked: too many attempts. Please try again later."
+        with self.lock:
+            if username in self.config.locked_users:
+                return None, "Sorry, this user has been locked out."
+            if self.locked_until.get(username, 0) > time.monotonic():
+                return None, locked
+
+            if self.config.users.get(username) != password:
+                self.failures[username] = self.failures.get(username, 0) + 1
+                if self.failures[username] >= self.config.lockout_threshold:
+                    self.locked_until[username] = time.monotonic() + self.config.lockout_seconds
+                    self.failures[username] = 0
+                    return None, locked
+                return None, "Invalid username or password"
+
+            self.failures.pop(username, None)
+            token = secrets.token_urlsafe(24)
+            self.sessions[token] = username
+            return token, None
+
+    def user_for(self, token: Optional[str]) -> Optional[str]:
+        with self.lock:
+            return self.sessions.get(token) if token else None
+
+    def logout(self, token: Optional[str]):
+        with self.lock:
+            self.sessions.pop(token, None)
+
+
+class LoginRequestHandler(BaseHTTPRequestHandler):
+    """Request handler; the server instance carries the shared LoginAppState"""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "LocalLoginApp/1.0"
+
+    # ==================== Routing ====================
+
+    def do_GET(self):
+        self._dispatch({
+            '/': lambda: self._redirect('/login'),
+            '/login': self._login_page,
+            '/dashboard': self._dashboard,
+            '/forgot-password': self._forgot_password,
+            '/logout': self._logout,
+            '/health': lambda: self._send(200, 'ok', 'text/plain'),
+        })
+
+    def do_POST(self):
+        self._dispatch({
+            '/login': self._login_submit,
+            '/__admin/reset': self._admin_reset,
+        })
+
+    def _dispatch(self, routes: Dict):
+        path = urlsplit(self.path).path
+        handler = routes.get(path)
+        state = self.server.state
+
+        if not path.startswith('/__admin') and path != '/health':
+            time.sleep(state.delay())
+            if state.inject_failure():
+                self.close_connection = True  # an unread request body must not leak into the next request
+                self._send(503, PAGE.format(title="Unavailable", body="<h1>Service Unavailable</h1>"))
+                return
+
+        if handler is None:
+            self.close_connection = True
+            self._send(404, PAGE.format(title="Not found", body="<h1>Not found</h1>"))
+            return
+        handler()
+
+    # ==================== Pages ====================
+
+    def _login_page(self, error: str = None, username: str = '', status: int = 200):
+        error_html = f'<div class="error-message" role="alert">{html.escape(error)}</div>\n' if error else ''
+        body = LOGIN_FORM.format(error=error_html, username=html.escape(username, quote=True))
+        self._send(status, PAGE.format(title="Login", body=body))
+
+    def _login_submit(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        form = parse_qs(self.rfile.read(length).decode('utf-8'), keep_blank_values=True)
+        username = form.get('username', [''])[0].strip()
+        password = form.get('password', [''])[0]
+        remember = bool(form.get('remember_me'))
+
+        token, error = self.server.state.authenticate(username, password)
+        if error:
+            self._login_page(error, username, status=401 if username and password else 400)
+            return
+
+        cookie = f"{SESSION_COOKIE}={token}; Path=/; HttpOnly; SameSite=Lax"
+        if remember:
+            cookie += f"; Max-Age={REMEMBER_ME_SECONDS}"
+        self._redirect('/dashboard', {'Set-Cookie': cookie})
+
+    def _dashboard(self):
+        username = self.server.state.user_for(self._session_token())
+        if username is None:
+            self._redirect('/login')
+            return
+        body = (
+            '<h1 class="title">Dashboard</h1>\n'
+            f'<div data-testid="user-menu" class="user-profile">{html.escape(username)}</div>\n'
+            '<a href="/logout">Logout</a>'
+        )
+        self._send(200, PAGE.format(title="Dashboard", body=body))
+
+    def _forgot_password(self):
+        body = (
+            '<h1>Reset password</h1>\n'
+            '<form method="post" action="/forgot-password">\n'
+            '  <label for="email">Email</label>\n'
+            '  <input id="email" name="email" type="email" autocomplete="email">\n'
+            '  <button type="submit">Send reset link</button>\n'
+            '</form>'
+        )
+        self._send(200, PAGE.format(title="Forgot password", body=body))
+
+    def _logout(self):
+        self.server.state.logout(self._session_token())
+        self._redirect('/login', {'Set-Cookie': f"{SESSION_COOKIE}=; Path=/; Max-Age=0"})
+
+    def _admin_reset(self):
+        self.server.state.reset()
+        self._send(200, json.dumps({'reset': True}), 'application/json')
+
+    # ==================== Helpers ====================
+
+    def _session_token(self) -> Optional[str]:
+        cookie = SimpleCookie(self.headers.get('Cookie', ''))
+        morsel = cookie.get(SESSION_COOKIE)
+        return morsel.value if morsel else None
+
+    def _redirect(self, location: str, headers: Dict[str, str] = None):
+        self.send_response(303)
+        self.send_header('Location', location)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def _send(self, status: int, body: str, content_type: str = 'text/html; charset=utf-8'):
+        payload = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(payload)))
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        log.debug(f"login app: {format % args}")
+
+
+class _ThreadingServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128  # the default of 5 drops connections under parallel browsers
+
+
+class LoginAppServer:
+    """
+    Runs the local app on a background thread
+
+    Example:
+        with LoginAppServer(LoginAppConfig(latency_ms=50)) as app:
+            page.goto(f"{app.base_url}/login")
+    """
+
+    def __init__(self, config: LoginAppConfig = None, host: str = '127.0.0.1', port: int = 0):
+        """
+        Initialize server
+
+        Args:
+            config: App behaviour (defaults: no latency, no failures, lockout after 5 attempts)
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+        """
+        self.config = config or LoginAppConfig()
+        self.state = LoginAppState(self.config)
+        self.httpd = _ThreadingServer((host, port), LoginRequestHandler)
+        self.httpd.state = self.state
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "LoginAppServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="login-app", daemon=True)
+        self._thread.start()
+        log.info(f"Local login app listening on {self.base_url}")
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def reset(self):
+        """Forget sessions, failed attempts and lockouts"""
+        self.state.reset()
+
+    def __enter__(self) -> "LoginAppServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the local login application")
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--latency', type=float, default=0, help='Added latency per request (ms)')
+    parser.add_argument('--jitter', type=float, default=0, help='Random extra latency (ms)')
+    parser.add_argument('--failure-rate', type=float, default=0.0, help='Share of requests answered with 503')
+    args = parser.parse_args()
+
+    config = LoginAppConfig(latency_ms=args.latency, jitter_ms=args.jitter, failure_rate=args.failure_rate)
+    server = LoginAppServer(config, port=args.port)
+    print(f"🚀 Local login app on {server.base_url} (Ctrl+C to stop)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
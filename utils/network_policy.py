@@ -0,0 +1,259 @@
+"""
+Network Interception Policies
+Blocks or stubs resources that page-object assertions never look at
+(images, fonts, media, analytics, third-party scripts) per test suite
+"""
+import ipaddress
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Optional, Tuple
+from urllib.parse import urlsplit
+
+from playwright.sync_api import BrowserContext, Request, Route
+
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+ANALYTICS_PATTERNS = (
+    r"google-analytics\.com",
+    r"googletagmanager\.com",
+    r"doubleclick\.net",
+    r"connect\.facebook\.net",
+    r"hotjar\.com",
+    r"segment\.(io|com)",
+    r"clarity\.ms",
+    r"nr-data\.net",
+    r"js-agent\.newrelic\.com",
+)
+
+# Typical transfer sizes used to estimate savings (aborted requests have no response)
+ESTIMATED_BYTES = {
+    'image': 40_000,
+    'media': 500_000,
+    'font': 30_000,
+    'script': 30_000,
+    'stylesheet': 15_000,
+    'xhr': 2_000,
+    'fetch': 2_000,
+}
+DEFAULT_ESTIMATED_BYTES = 5_000
+
+
+@dataclass(frozen=True)
+class NetworkPolicy:
+    """
+    What to keep off the wire for one suite
+
+    Attributes:
+        name: Policy name (matches a pytest marker)
+        block_types: Playwright resource types aborted on every host
+        third_party_types: Resource types aborted when served from another site than BASE_URL
+        stub_patterns: URL regexes answered with an empty 200 (analytics and similar)
+        block_patterns: URL regexes always aborted
+    """
+
+    name: str
+    block_types: FrozenSet[str] = frozenset()
+    third_party_types: FrozenSet[str] = frozenset()
+    stub_patterns: Tuple[str, ...] = ()
+    block_patterns: Tuple[str, ...] = ()
+
+
+POLICIES: Dict[str, NetworkPolicy] = {
+    'smoke': NetworkPolicy(
+        'smoke',
+        block_types=frozenset({'image', 'media', 'font'}),
+        third_party_types=frozenset({'script', 'stylesheet'}),
+        stub_patterns=ANALYTICS_PATTERNS,
+    ),
+    'regression': NetworkPolicy(
+        'regression',
+        block_types=frozenset({'image', 'media', 'font'}),
+        stub_patterns=ANALYTICS_PATTERNS,
+    ),
+    # Security checks may depend on every script and stylesheet the page loads
+    'security': NetworkPolicy('security', stub_patterns=ANALYTICS_PATTERNS),
+}
+
+# When a test carries several suite markers, the least aggressive policy wins
+POLICY_PRECEDENCE = ('security', 'regression', 'smoke')
+
+
+def resolve_policy(node, setting: str = 'auto') -> Optional[NetworkPolicy]:
+    """
+    Pick the policy for a test
+
+    Args:
+        node: pytest item
+        setting: 'auto' (from the test's markers), 'none', or a policy name
+
+    Returns:
+        NetworkPolicy, or None when nothing should be intercepted
+    """
+    if setting == 'none':
+        return None
+    if setting != 'auto':
+        if setting not in POLICIES:
+            raise ValueError(f"Unknown network policy '{setting}', expected one of {sorted(POLICIES)} or auto/none")
+        return POLICIES[setting]
+
+    for name in POLICY_PRECEDENCE:
+        if node.get_closest_marker(name):
+            return POLICIES[name]
+    return None
+
+
+def _site(host: str) -> str:
+    """
+    Host name that the application's subdomains share (example.com for www.example.com)
+
+    Only a leading www. is dropped; taking the last labels would merge
+    unrelated sites under multi-part suffixes (a.co.uk and b.co.uk) and
+    unrelated IP addresses (10.0.0.1 and 192.168.0.1).
+    """
+    host = host.lower().rstrip('.')
+    try:
+        ipaddress.ip_address(host.strip('[]'))
+        return host
+    except ValueError:
+        pass
+    return host[4:] if host.startswith('www.') and host.count('.') >= 2 else host
+
+
+def _same_site(host: str, site: str) -> bool:
+    """True for the application's site itself and its subdomains (never for another IP address)"""
+    host = host.lower().rstrip('.')
+    return host == site or host.endswith('.' + site)
+
+
+class NetworkStats:
+    """Per-test counters of intercepted requests"""
+
+    def __init__(self):
+        self.requests = 0
+        self.blocked = 0
+        self.stubbed = 0
+        self.estimated_bytes_saved = 0
+        self.by_type: Counter = Counter()
+
+    def add(self, other: "NetworkStats"):
+        """Fold another test's counters into this one"""
+        self.requests += other.requests
+        self.blocked += other.blocked
+        self.stubbed += other.stubbed
+        self.estimated_bytes_saved += other.estimated_bytes_saved
+        self.by_type.update(other.by_type)
+
+    def to_dict(self) -> Dict:
+        return {**self.counts(), 'estimated_bytes_saved': self.estimated_bytes_saved}
+
+    def counts(self) -> Dict:
+        """
+        Measured counters only, for per-test reports
+
+        estimated_bytes_saved is left out: it is blocked requests times a
+        typical size per resource type (ESTIMATED_BYTES), only meaningful
+        as a rough session total.
+        """
+        return {
+            'requests': self.requests,
+            'blocked': self.blocked,
+            'stubbed': self.stubbed,
+            'by_type': dict(self.by_type),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "NetworkStats":
+        stats = cls()
+        stats.requests = data['requests']
+        stats.blocked = data['blocked']
+        stats.stubbed = data['stubbed']
+        stats.estimated_bytes_saved = data['estimated_bytes_saved']
+        stats.by_type.update(data['by_type'])
+        return stats
+
+
+# Totals across all tests in this process (reported in the terminal summary)
+session_stats = NetworkStats()
+
+
+class NetworkInterceptor:
+    """
+    Applies a NetworkPolicy to browser contexts through one catch-all route
+
+    Requests the policy does not cover are passed on with route.fallback(),
+    so routes registered later (or earlier) by tests still see them.
+
+    Example:
+        interceptor = NetworkInterceptor(POLICIES['smoke'], BASE_URL)
+        interceptor.attach(page.context)
+        ...
+        interceptor.stats.to_dict()
+    """
+
+    def __init__(self, policy: Optional[NetworkPolicy], base_url: str):
+        """
+        Initialize interceptor
+
+        Args:
+            policy: Policy to apply (None attaches nothing)
+            base_url: Application URL; other sites count as third-party
+        """
+        self.policy = policy
+        self.site = _site(urlsplit(base_url).hostname or '')
+        self.stats = NetworkStats()
+        self._stub = re.compile("|".join(policy.stub_patterns)) if policy and policy.stub_patterns else None
+        self._block = re.compile("|".join(policy.block_patterns)) if policy and policy.block_patterns else None
+
+    def attach(self, context: BrowserContext):
+        """Install the policy on a context (no-op without a policy)"""
+        if self.policy is None:
+            return
+        context.route("**/*", self._handle)
+        log.debug(f"Network policy '{self.policy.name}' attached")
+
+    def detach(self, context: BrowserContext):
+        if self.policy is not None:
+            context.unroute("**/*", self._handle)
+
+    def decide(self, url: str, resource_type: str) -> str:
+        """
+        Decision for one request
+
+        Returns:
+            'stub', 'block' or 'continue'
+        """
+        policy = self.policy
+        if self._stub and self._stub.search(url):
+            return 'stub'
+        if self._block and self._block.search(url):
+            return 'block'
+        if resource_type in policy.block_types:
+            return 'block'
+        if resource_type in policy.third_party_types:
+            host = urlsplit(url).hostname or ''
+            if host and not _same_site(host, self.site):
+                return 'block'
+        return 'continue'
+
+    def _handle(self, route: Route, request: Request):
+        stats = self.stats
+        stats.requests += 1
+        resource_type = request.resource_type
+        decision = self.decide(request.url, resource_type)
+
+        if decision == 'continue':
+            route.fallback()
+            return
+
+        stats.by_type[resource_type] += 1
+        stats.estimated_bytes_saved += ESTIMATED_BYTES.get(resource_type, DEFAULT_ESTIMATED_BYTES)
+        if decision == 'stub':
+            stats.stubbed += 1
+            content_type = 'application/javascript' if resource_type == 'script' else 'text/plain'
+            route.fulfill(status=200, content_type=content_type, body='')
+        else:
+            stats.blocked += 1
+            route.abort('blockedbyclient')
@@ -0,0 +1,233 @@
+"""
+Browser Performance Metrics
+Captures Navigation, Paint and Resource Timing (plus Chromium CDP
+Performance.getMetrics) after a navigation and keeps them per test and per URL
+"""
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+from playwright.sync_api import Error as PlaywrightError
+from playwright.sync_api import Page
+
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+# One evaluation returns everything the browser's performance timeline knows
+# about the current document; times are ms relative to navigation start.
+METRICS_SCRIPT = """
+(slowest) => {
+    const round = (value) => Math.round(value * 10) / 10;
+    const nav = performance.getEntriesByType('navigation')[0];
+    const navigation = nav ? {
+        ttfb: round(nav.responseStart),
+        dom_interactive: round(nav.domInteractive),
+        dom_content_loaded: round(nav.domContentLoadedEventEnd),
+        load: round(nav.loadEventEnd),
+        duration: round(nav.duration),
+        transfer_size: nav.transferSize || 0,
+        type: nav.type,
+    } : {};
+
+    const paint = {};
+    for (const entry of performance.getEntriesByType('paint')) {
+        paint[entry.name === 'first-contentful-paint' ? 'fcp' : 'first_paint'] = round(entry.startTime);
+    }
+
+    const resources = performance.getEntriesByType('resource');
+    const byType = {};
+    let transfer = 0;
+    for (const r of resources) {
+        const bucket = byType[r.initiatorType] || (byType[r.initiatorType] = {count: 0, transfer_size: 0, max_ms: 0});
+        bucket.count += 1;
+        bucket.transfer_size += r.transferSize || 0;
+        bucket.max_ms = Math.max(bucket.max_ms, round(r.duration));
+        transfer += r.transferSize || 0;
+    }
+    const slowestEntries = [...resources]
+        .sort((a, b) => b.duration - a.duration)
+        .slice(0, slowest)
+        .map((r) => ({name: r.name, type: r.initiatorType, duration_ms: round(r.duration)}));
+
+    return {
+        navigation,
+        paint,
+        resources: {count: resources.length, transfer_size: transfer, by_type: byType, slowest: slowestEntries},
+    };
+}
+"""
+
+# CDP Performance.getMetrics entries worth keeping (seconds are converted to ms)
+CDP_METRICS = {
+    'JSHeapUsedSize': 'js_heap_used_bytes',
+    'JSHeapTotalSize': 'js_heap_total_bytes',
+    'Nodes': 'dom_nodes',
+    'LayoutCount': 'layout_count',
+    'RecalcStyleCount': 'recalc_style_count',
+    'LayoutDuration': 'layout_ms',
+    'RecalcStyleDuration': 'recalc_style_ms',
+    'ScriptDuration': 'script_ms',
+    'TaskDuration': 'task_ms',
+}
+
+# Names accepted by expect_navigation_under, mapped to where they live
+THRESHOLD_METRICS = {
+    'ttfb': ('navigation', 'ttfb'),
+    'dom_interactive': ('navigation', 'dom_interactive'),
+    'dom_content_loaded': ('navigation', 'dom_content_loaded'),
+    'load': ('navigation', 'load'),
+    'fcp': ('paint', 'fcp'),
+    'script': ('cdp', 'script_ms'),
+}
+
+
+@dataclass
+class NavigationMetrics:
+    """Performance data of one navigation"""
+
+    url: str
+    navigation: Dict = field(default_factory=dict)
+    paint: Dict = field(default_factory=dict)
+    resources: Dict = field(default_factory=dict)
+    cdp: Dict = field(default_factory=dict)
+
+    @property
+    def path(self) -> str:
+        """URL without query or fragment, used to group navigations"""
+        parts = urlsplit(self.url)
+        return f"{parts.scheme}://{parts.netloc}{parts.path}"
+
+    def get(self, metric: str) -> Optional[float]:
+        """Value of a THRESHOLD_METRICS name (None if the browser did not report it)"""
+        if metric not in THRESHOLD_METRICS:
+            raise ValueError(f"Unknown metric '{metric}', expected one of {sorted(THRESHOLD_METRICS)}")
+        section, key = THRESHOLD_METRICS[metric]
+        value = getattr(self, section).get(key)
+        return value
+
+    def to_dict(self) -> Dict:
+        return {
+            'url': self.url,
+            'navigation': self.navigation,
+            'paint': self.paint,
+            'resources': self.resources,
+            'cdp': self.cdp,
+        }
+
+
+def _parse_cdp(response: Dict) -> Dict:
+    metrics = {}
+    for entry in response.get('metrics', []):
+        name = CDP_METRICS.get(entry['name'])
+        if name:
+            metrics[name] = round(entry['value'] * 1000, 1) if name.endswith('_ms') else int(entry['value'])
+    return metrics
+
+
+def capture(page: Page, slowest: int = 5) -> NavigationMetrics:
+    """
+    Read the performance timeline of the current document
+
+    CDP metrics are only collected on Chromium; the CDP session is opened
+    once per page and reused.
+
+    Args:
+        page: Playwright Page (sync API)
+        slowest: Number of slowest resources to keep
+
+    Returns:
+        NavigationMetrics for page.url
+    """
+    data = page.evaluate(METRICS_SCRIPT, slowest)
+    metrics = NavigationMetrics(page.url, data['navigation'], data['paint'], data['resources'])
+
+    if page.context.browser and page.context.browser.browser_type.name == 'chromium':
+        try:
+            session = recorder.cdp_sessions.get(page)
+            if session is None:
+                session = page.context.new_cdp_session(page)
+                session.send('Performance.enable')
+                recorder.cdp_sessions[page] = session
+            metrics.cdp = _parse_cdp(session.send('Performance.getMetrics'))
+        except PlaywrightError as e:
+            log.debug(f"CDP metrics unavailable: {e}")
+
+    recorder.record(metrics)
+    return metrics
+
+
+async def capture_async(page, slowest: int = 5) -> NavigationMetrics:
+    """capture for a playwright.async_api Page"""
+    data = await page.evaluate(METRICS_SCRIPT, slowest)
+    metrics = NavigationMetrics(page.url, data['navigation'], data['paint'], data['resources'])
+
+    browser = page.context.browser
+    if browser and browser.browser_type.name == 'chromium':
+        try:
+            session = recorder.cdp_sessions.get(page)
+            if session is None:
+                session = await page.context.new_cdp_session(page)
+                await session.send('Performance.enable')
+                recorder.cdp_sessions[page] = session
+            metrics.cdp = _parse_cdp(await session.send('Performance.getMetrics'))
+        except Exception as e:
+            log.debug(f"CDP metrics unavailable: {e}")
+
+    recorder.record(metrics)
+    return metrics
+
+
+class PageMetricsRecorder:
+    """
+    Collects captured navigations per test and aggregates them per URL
+
+    Capture is off by default; tests/conftest.py switches it on from
+    settings.PAGE_METRICS and opens/closes a test around each test.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.current: Optional[List[NavigationMetrics]] = None
+        self.by_url: Dict[str, List[NavigationMetrics]] = {}
+        self.cdp_sessions: Dict = {}
+
+    def begin_test(self):
+        self.current = []
+
+    def end_test(self) -> List[NavigationMetrics]:
+        captured, self.current = self.current or [], None
+        self.cdp_sessions.clear()  # pages of a finished test are closed
+        return captured
+
+    def record(self, metrics: NavigationMetrics):
+        if self.current is not None:
+            self.current.append(metrics)
+        self.by_url.setdefault(metrics.path, []).append(metrics)
+        log.debug(
+            f"Page metrics {metrics.path}: ttfb {metrics.get('ttfb')}ms, "
+            f"DCL {metrics.get('dom_content_loaded')}ms, load {metrics.get('load')}ms, fcp {metrics.get('fcp')}ms"
+        )
+
+    def summary(self) -> Dict[str, Dict]:
+        """Per URL: navigation count plus median and max of each threshold metric"""
+        summary = {}
+        for path, captured in self.by_url.items():
+            row = {'navigations': len(captured)}
+            for metric in ('ttfb', 'dom_content_loaded', 'load', 'fcp'):
+                values = sorted(v for v in (m.get(metric) for m in captured) if v is not None)
+                if values:
+                    row[metric] = {'median_ms': values[len(values) // 2], 'max_ms': values[-1]}
+            summary[path] = row
+        return summary
+
+    def to_dict(self) -> Dict:
+        return {path: [m.to_dict() for m in captured] for path, captured in self.by_url.items()}
+
+    def merge_dict(self, data: Dict):
+        """Fold in the navigations saved by another process (e.g. an xdist worker)"""
+        for path, captured in data.items():
+            self.by_url.setdefault(path, []).extend(NavigationMetrics(**m) for m in captured)
+
+
+recorder = PageMetricsRecorder()
@@ -0,0 +1,216 @@
+"""
+Pandoc Conversion Scheduler
+Probes the Pandoc toolchain once and runs markdown conversions concurrently,
+skipping outputs whose source (or the data it was rendered from) has not changed
+"""
+import functools
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+PDF_ENGINE = "pdflatex"
+
+
+@functools.lru_cache(maxsize=None)
+def probe_pandoc() -> Optional[str]:
+    """
+    Check whether Pandoc is installed (cached for the life of the process)
+
+    Returns:
+        First line of `pandoc --version`, or None if Pandoc is unavailable
+    """
+    try:
+        result = subprocess.run(["pandoc", "--version"], capture_output=True, text=True, check=True, timeout=30)
+        return result.stdout.splitlines()[0] if result.stdout else "pandoc"
+    except (FileNotFoundError, subprocess.CalledProcessError, subprocess.TimeoutExpired):
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def probe_pdf_engine(engine: str = PDF_ENGINE) -> bool:
+    """Check whether the LaTeX engine used for PDF output is on PATH (cached)"""
+    return shutil.which(engine) is not None
+
+
+def build_pandoc_command(input_file: Path, output_file: Path, output_format: str) -> List[str]:
+    """
+    Build the Pandoc command line for one conversion
+
+    Args:
+        input_file: Markdown source
+        output_file: Destination file
+        output_format: 'html', 'docx' or 'pdf'
+
+    Returns:
+        Command as argument list
+    """
+    cmd = [
+        "pandoc",
+        str(input_file),
+        "-o", str(output_file),
+        "--standalone",
+        "--toc",  # Table of contents
+        "--toc-depth=3",
+        "-V", "geometry:margin=1in"
+    ]
+
+    if output_format == "html":
+        cmd.extend([
+            "--css=https://cdn.jsdelivr.net/npm/water.css@2/out/water.css",
+            "--metadata", "title=Test Execution Report"
+        ])
+    elif output_format == "pdf":
+        cmd.extend([
+            f"--pdf-engine={PDF_ENGINE}",
+            "-V", "colorlinks=true"
+        ])
+
+    return cmd
+
+
+class ConversionJob(NamedTuple):
+    """
+    One markdown file to convert into one output format
+
+    A fingerprint of the data the source was rendered from replaces the source
+    bytes in the manifest hash, for sources that embed a generation timestamp.
+    """
+
+    source: Path
+    output_format: str
+    fingerprint: str = ''
+
+    @property
+    def output(self) -> Path:
+        return self.source.with_suffix(f".{self.output_format}")
+
+
+class ConversionResult(NamedTuple):
+    """Outcome of a conversion job"""
+
+    job: ConversionJob
+    status: str  # 'converted', 'up-to-date', 'failed', 'timeout' or 'unavailable'
+    output: Optional[Path]
+    elapsed: float
+    error: str = ''
+
+
+class PandocScheduler:
+    """
+    Run Pandoc conversions on a bounded thread pool
+
+    A manifest next to the outputs stores a hash of each output's source (or
+    the job's fingerprint) and command line; jobs whose output exists with a
+    matching hash are skipped.
+
+    Example:
+        scheduler = PandocScheduler(max_workers=3)
+        results = scheduler.run([ConversionJob(md_file, "html"), ConversionJob(md_file, "pdf")])
+    """
+
+    MANIFEST_NAME = ".pandoc-manifest.json"
+
+    def __init__(self, max_workers: int = 4, timeout: float = 120):
+        """
+        Initialize scheduler
+
+        Args:
+            max_workers: Maximum concurrent pandoc processes
+            timeout: Per-job timeout in seconds
+        """
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self._lock = threading.Lock()
+
+    def run(self, jobs: List[ConversionJob]) -> List[ConversionResult]:
+        """
+        Run all jobs concurrently
+
+        Args:
+            jobs: Conversion jobs
+
+        Returns:
+            ConversionResult per job, in the same order
+        """
+        if not jobs:
+            return []
+
+        if probe_pandoc() is None:
+            print("❌ Pandoc not installed. Install with: https://pandoc.org/installing.html")
+            return [ConversionResult(job, 'unavailable', None, 0.0, 'pandoc not installed') for job in jobs]
+
+        manifests = {directory: self._load_manifest(directory) for directory in {j.source.parent for j in jobs}}
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(jobs))) as pool:
+            results = list(pool.map(lambda job: self._run_job(job, manifests[job.source.parent]), jobs))
+
+        for directory, manifest in manifests.items():
+            self._save_manifest(directory, manifest)
+
+        for result in results:
+            self._report(result)
+        return results
+
+    # ==================== Internals ====================
+
+    def _run_job(self, job: ConversionJob, manifest: Dict[str, str]) -> ConversionResult:
+        started = time.perf_counter()
+
+        if job.output_format == "pdf" and not probe_pdf_engine():
+            return ConversionResult(job, 'unavailable', None, 0.0, f"{PDF_ENGINE} not installed")
+
+        cmd = build_pandoc_command(job.source, job.output, job.output_format)
+        try:
+            content = job.fingerprint.encode('utf-8') if job.fingerprint else job.source.read_bytes()
+            digest = hashlib.sha256(content + "\0".join(cmd).encode('utf-8')).hexdigest()
+        except OSError as e:
+            return ConversionResult(job, 'failed', None, 0.0, str(e))
+
+        key = job.output.name
+        if job.output.exists() and manifest.get(key) == digest:
+            return ConversionResult(job, 'up-to-date', job.output, time.perf_counter() - started)
+
+        try:
+            subprocess.run(cmd, capture_output=True, text=True, check=True, timeout=self.timeout)
+        except subprocess.TimeoutExpired:
+            return ConversionResult(job, 'timeout', None, time.perf_counter() - started,
+                                    f"timed out after {self.timeout:.0f}s")
+        except subprocess.CalledProcessError as e:
+            return ConversionResult(job, 'failed', None, time.perf_counter() - started,
+                                    (e.stderr or str(e)).strip())
+
+        with self._lock:
+            manifest[key] = digest
+        return ConversionResult(job, 'converted', job.output, time.perf_counter() - started)
+
+    def _load_manifest(self, directory: Path) -> Dict[str, str]:
+        try:
+            return json.loads((directory / self.MANIFEST_NAME).read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+
+    def _save_manifest(self, directory: Path, manifest: Dict[str, str]):
+        fd, tmp_name = tempfile.mkstemp(dir=directory, prefix=".pandoc-manifest.", suffix=".tmp")
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp_name, directory / self.MANIFEST_NAME)
+
+    @staticmethod
+    def _report(result: ConversionResult):
+        fmt = result.job.output_format.upper()
+        if result.status == 'converted':
+            print(f"✅ Converted to {fmt}: {result.output} ({result.elapsed:.1f}s)")
+        elif result.status == 'up-to-date':
+            print(f"⏭️  {fmt} up to date: {result.output}")
+        elif result.status == 'unavailable':
+            print(f"⚠️  Skipped {fmt} for {result.job.source.name}: {result.error}")
+        else:
+            print(f"❌ Pandoc conversion to {fmt} {result.status} for {result.job.source.name}: {result.error}")
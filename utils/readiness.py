@@ -0,0 +1,368 @@
+"""
+Readiness Strategy Engine
+Polls several "page is ready" signals after an action and records which one fired
+"""
+import inspect
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Callable, Dict, List, Optional
+
+from playwright.sync_api import Page, Response
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+SLOW_WAIT_MS = 2000
+
+
+# ==================== Strategies ====================
+
+class ReadinessStrategy:
+    """
+    Base class for a readiness signal
+
+    A strategy is armed before the action runs (so it can capture the starting
+    URL or subscribe to events) and then polled until it reports ready.
+    """
+
+    name = "strategy"
+
+    def arm(self, page: Page):
+        """Capture starting state before the action"""
+
+    async def arm_async(self, page):
+        """arm for an async_api Page (strategies that only read page.url or subscribe to events reuse arm)"""
+        self.arm(page)
+
+    def is_ready(self, page: Page) -> bool:
+        """Non-blocking check whether this outcome has happened"""
+        raise NotImplementedError
+
+    async def is_ready_async(self, page) -> bool:
+        """is_ready for an async_api Page (strategies that only read page.url reuse is_ready)"""
+        return self.is_ready(page)
+
+    def disarm(self, page: Page):
+        """Release listeners registered in arm"""
+
+
+class UrlChanged(ReadinessStrategy):
+    """
+    Ready when the page URL differs from the URL before the action
+
+    Any navigation counts, including a redirect to an error page, so pages
+    declare what success looks like (UrlContains, SelectorVisible) instead.
+    """
+
+    name = "url_changed"
+
+    def __init__(self):
+        self._start_url = None
+
+    def arm(self, page: Page):
+        self._start_url = page.url
+
+    def is_ready(self, page: Page) -> bool:
+        return page.url != self._start_url
+
+
+class UrlContains(ReadinessStrategy):
+    """Ready when the page URL contains a fragment"""
+
+    def __init__(self, fragment: str):
+        self.fragment = fragment
+        self.name = f"url_contains({fragment})"
+
+    def is_ready(self, page: Page) -> bool:
+        return self.fragment in page.url
+
+
+class SelectorVisible(ReadinessStrategy):
+    """Ready when an element matching the selector is visible"""
+
+    def __init__(self, selector: str):
+        self.selector = selector
+        self.name = f"selector_visible({selector})"
+
+    def is_ready(self, page: Page) -> bool:
+        try:
+            return page.locator(self.selector).first.is_visible()
+        except Exception:
+            return False
+
+    async def is_ready_async(self, page) -> bool:
+        try:
+            return await page.locator(self.selector).first.is_visible()
+        except Exception:
+            return False
+
+
+class SelectorChanged(ReadinessStrategy):
+    """
+    Ready when an element is visible and was hidden before the action, or shows different text
+
+    Unlike SelectorVisible, an element left over from an earlier action (e.g.
+    the error of a previous failed login) does not count. If it was already
+    showing, an optional `after` strategy (e.g. the response to the submitted
+    form) confirms that the action was answered while the element stayed up.
+    """
+
+    def __init__(self, selector: str, after: Optional[ReadinessStrategy] = None):
+        self.selector = selector
+        self.after = after
+        self.name = f"selector_changed({selector})"
+        self._baseline: Optional[str] = None  # text shown before the action, None if hidden
+
+    def _read(self, page: Page) -> Optional[str]:
+        try:
+            element = page.locator(self.selector).first
+            return element.inner_text() if element.is_visible() else None
+        except Exception:
+            return None
+
+    async def _read_async(self, page) -> Optional[str]:
+        try:
+            element = page.locator(self.selector).first
+            return await element.inner_text() if await element.is_visible() else None
+        except Exception:
+            return None
+
+    def _changed(self, current: Optional[str], answered: bool) -> bool:
+        if current is None:
+            return False
+        return self._baseline is None or current != self._baseline or answered
+
+    def arm(self, page: Page):
+        self._baseline = self._read(page)
+        if self.after is not None:
+            self.after.arm(page)
+
+    async def arm_async(self, page):
+        self._baseline = await self._read_async(page)
+        if self.after is not None:
+            await self.after.arm_async(page)
+
+    def is_ready(self, page: Page) -> bool:
+        answered = self.after is not None and self.after.is_ready(page)
+        return self._changed(self._read(page), answered)
+
+    async def is_ready_async(self, page) -> bool:
+        answered = self.after is not None and await self.after.is_ready_async(page)
+        return self._changed(await self._read_async(page), answered)
+
+    def disarm(self, page: Page):
+        if self.after is not None:
+            self.after.disarm(page)
+
+
+class ResponseMatches(ReadinessStrategy):
+    """Ready when a network response matching the predicate has been received"""
+
+    def __init__(self, predicate: Callable[[Response], bool], name: str = "response"):
+        self.predicate = predicate
+        self.name = f"response({name})"
+        self._matched = False
+
+    def _on_response(self, response: Response):
+        if not self._matched and self.predicate(response):
+            self._matched = True
+
+    def arm(self, page: Page):
+        self._matched = False
+        page.on("response", self._on_response)
+
+    def is_ready(self, page: Page) -> bool:
+        return self._matched
+
+    def disarm(self, page: Page):
+        page.remove_listener("response", self._on_response)
+
+
+class Predicate(ReadinessStrategy):
+    """Ready when a custom callable returns True"""
+
+    def __init__(self, check: Callable[[Page], bool], name: str = "predicate"):
+        self.check = check
+        self.name = f"predicate({name})"
+
+    def is_ready(self, page: Page) -> bool:
+        return bool(self.check(page))
+
+    async def is_ready_async(self, page) -> bool:
+        result = self.check(page)
+        if inspect.isawaitable(result):
+            result = await result
+        return bool(result)
+
+
+# ==================== Recording ====================
+
+class ReadinessRecorder:
+    """Collects duration and winning strategy of every readiness wait"""
+
+    def __init__(self, slow_ms: float = SLOW_WAIT_MS):
+        self.slow_ms = slow_ms
+        self.records: List[Dict] = []
+
+    def record(self, label: str, winner: Optional[str], elapsed_ms: float):
+        self.records.append({'label': label, 'winner': winner, 'elapsed_ms': elapsed_ms})
+
+        if winner is None:
+            log.warning(f"Readiness wait '{label}' timed out after {elapsed_ms:.0f}ms")
+        elif elapsed_ms >= self.slow_ms:
+            log.warning(f"Slow readiness wait '{label}': {elapsed_ms:.0f}ms (won by {winner})")
+        else:
+            log.debug(f"Readiness wait '{label}': {elapsed_ms:.0f}ms (won by {winner})")
+
+    def summary(self) -> Dict:
+        """
+        Summarize recorded waits
+
+        Returns:
+            Dict with wait count, average/max duration, timeouts and wins per strategy
+        """
+        count = len(self.records)
+        durations = [r['elapsed_ms'] for r in self.records]
+        wins: Dict[str, int] = {}
+        for r in self.records:
+            key = r['winner'] or 'timeout'
+            wins[key] = wins.get(key, 0) + 1
+
+        return {
+            'waits': count,
+            'avg_ms': sum(durations) / count if count else 0.0,
+            'max_ms': max(durations) if durations else 0.0,
+            'slow': sum(1 for d in durations if d >= self.slow_ms),
+            'wins': wins,
+        }
+
+    def to_dict(self) -> Dict:
+        return {'records': self.records}
+
+    def merge_dict(self, data: Dict):
+        """Fold in the waits saved by another process (e.g. an xdist worker)"""
+        self.records.extend(data.get('records', []))
+
+
+recorder = ReadinessRecorder()
+
+
+# ==================== Engine ====================
+
+class ReadinessResult:
+    """Outcome of a readiness wait"""
+
+    def __init__(self):
+        self.winner: Optional[str] = None
+        self.elapsed_ms: float = 0.0
+
+
+@contextmanager
+def wait_until_ready(
+    page: Page,
+    strategies: List[ReadinessStrategy],
+    label: str = "action",
+    timeout: int = 5000,
+    poll_interval: int = 50,
+):
+    """
+    Arm strategies, run the wrapped action, then wait until any strategy is ready
+
+    Args:
+        page: Playwright Page
+        strategies: Candidate outcomes, checked in order on every poll (the first ready one wins)
+        label: Name used in logs and statistics
+        timeout: Maximum wait in milliseconds after the action
+        poll_interval: Milliseconds between polls (events are pumped while waiting)
+
+    Yields:
+        ReadinessResult filled in once the wait finishes
+
+    Raises:
+        TimeoutError: Playwright TimeoutError if no strategy becomes ready in time
+
+    Example:
+        with wait_until_ready(page, [UrlChanged(), SelectorVisible(".error")], "submit"):
+            page.click("button[type=submit]")
+    """
+    result = ReadinessResult()
+    for strategy in strategies:
+        strategy.arm(page)
+
+    try:
+        yield result
+
+        started = time.perf_counter()
+        deadline = started + timeout / 1000
+        while True:
+            winner = next((s for s in strategies if s.is_ready(page)), None)
+            if winner is not None:
+                result.winner = winner.name
+                break
+            if time.perf_counter() >= deadline:
+                break
+            page.wait_for_timeout(poll_interval)
+
+        result.elapsed_ms = (time.perf_counter() - started) * 1000
+        recorder.record(label, result.winner, result.elapsed_ms)
+
+        if result.winner is None:
+            names = ", ".join(s.name for s in strategies)
+            raise PlaywrightTimeoutError(f"Page not ready after '{label}' within {timeout}ms (waited for: {names})")
+
+    finally:
+        for strategy in strategies:
+            strategy.disarm(page)
+
+
+@asynccontextmanager
+async def async_wait_until_ready(
+    page,
+    strategies: List[ReadinessStrategy],
+    label: str = "action",
+    timeout: int = 5000,
+    poll_interval: int = 50,
+):
+    """
+    wait_until_ready for a playwright.async_api Page
+
+    Same arming, polling, recording and timeout behaviour; polls with
+    `await page.wait_for_timeout` so other pages keep running meanwhile.
+
+    Example:
+        async with async_wait_until_ready(page, [UrlChanged()], "submit"):
+            await page.click("button[type=submit]")
+    """
+    result = ReadinessResult()
+    for strategy in strategies:
+        await strategy.arm_async(page)
+
+    try:
+        yield result
+
+        started = time.perf_counter()
+        deadline = started + timeout / 1000
+        while True:
+            winner = None
+            for strategy in strategies:
+                if await strategy.is_ready_async(page):
+                    winner = strategy
+                    break
+            if winner is not None:
+                result.winner = winner.name
+                break
+            if time.perf_counter() >= deadline:
+                break
+            await page.wait_for_timeout(poll_interval)
+
+        result.elapsed_ms = (time.perf_counter() - started) * 1000
+        recorder.record(label, result.winner, result.elapsed_ms)
+
+        if result.winner is None:
+            names = ", ".join(s.name for s in strategies)
+            raise PlaywrightTimeoutError(f"Page not ready after '{label}' within {timeout}ms (waited for: {names})")
+    finally:
+        for strategy in strategies:
+            strategy.disarm(page)
@@ -0,0 +1,310 @@
+"""
+Columnar Result Store
+Array-backed storage of test results with heap/vectorized aggregations
+"""
+import heapq
+import random
+import sys
+from array import array
+from typing import Dict, Iterator, List, Sequence
+
+from utils.allure_ingest import ResultRecord
+
+KNOWN_STATUSES = ('passed', 'failed', 'skipped', 'broken', 'unknown')
+GROUP_FIELDS = ('suite', 'feature', 'tag')
+
+
+def _select_ranks(values: Sequence[float], ranks: List[int]) -> Dict[int, float]:
+    """
+    Values at 1-based ranks of the ascending order, by multi-rank quickselect
+
+    Args:
+        values: Unordered values (not modified)
+        ranks: Ascending ranks between 1 and len(values)
+    """
+    found = {}
+    pending = [(values, 0, ranks)]  # (part, ranks before it, ranks inside it)
+    while pending:
+        part, offset, wanted = pending.pop()
+        pivot = random.choice(part)
+        lower = [v for v in part if v < pivot]
+        upper = [v for v in part if v > pivot]
+        equal_end = offset + len(part) - len(upper)
+        below = [r for r in wanted if r <= offset + len(lower)]
+        above = [r for r in wanted if r > equal_end]
+        for rank in wanted:
+            if offset + len(lower) < rank <= equal_end:
+                found[rank] = pivot
+        if below:
+            pending.append((lower, offset, below))
+        if above:
+            pending.append((upper, equal_end, above))
+    return found
+
+
+class StringPool:
+    """Interns strings and hands out compact integer ids"""
+
+    def __init__(self):
+        self.values: List[str] = []
+        self._ids: Dict[str, int] = {}
+
+    def intern(self, value: str) -> int:
+        idx = self._ids.get(value)
+        if idx is None:
+            idx = self._ids[value] = len(self.values)
+            self.values.append(value)
+        return idx
+
+    def id_of(self, value: str) -> int:
+        return self._ids.get(value, -1)
+
+    def __getitem__(self, idx: int) -> str:
+        return self.values[idx]
+
+    def nbytes(self) -> int:
+        return sys.getsizeof(self.values) + sys.getsizeof(self._ids) + sum(sys.getsizeof(v) for v in self.values)
+
+
+class StringColumn:
+    """Append-only column of mostly unique strings packed into one UTF-8 buffer"""
+
+    def __init__(self):
+        self._data = bytearray()
+        self._offsets = array('Q', [0])
+
+    def append(self, value: str):
+        self._data += value.encode('utf-8')
+        self._offsets.append(len(self._data))
+
+    def __getitem__(self, idx: int) -> str:
+        return self._data[self._offsets[idx]:self._offsets[idx + 1]].decode('utf-8')
+
+    def nbytes(self) -> int:
+        return sys.getsizeof(self._data) + sys.getsizeof(self._offsets)
+
+
+class ResultStore:
+    """
+    Column-oriented store of test results
+
+    Each column is an array: status codes (1 byte per test), durations in
+    seconds (8 bytes), names and full names packed into UTF-8 buffers, and ids
+    into interned pools for suites and features. Tags (markers) map to arrays
+    of row numbers. Iterating the store yields the same
+    {'name', 'status', 'duration', 'fullName'} dicts the metrics code used
+    before, built on demand.
+
+    Example:
+        store = ResultStore()
+        for record in stream_results(results_dir):
+            store.add_record(record)
+        store.top_k_slowest(5)
+        store.percentiles((50, 90, 99))
+    """
+
+    def __init__(self):
+        self.statuses = StringPool()
+        for status in KNOWN_STATUSES:
+            self.statuses.intern(status)
+        self.strings = StringPool()
+
+        self._status = array('B')
+        self._duration = array('d')
+        self._name = StringColumn()
+        self._full_name = StringColumn()
+        self._suite = array('I')
+        self._feature = array('I')
+        self._tags: Dict[str, array] = {}
+
+        self.total_duration = 0.0
+        self._ranked: Dict[int, float] = {}  # nearest rank -> duration, cleared on add
+
+    # ==================== Loading ====================
+
+    def add(
+        self,
+        name: str,
+        status: str,
+        duration: float,
+        full_name: str = '',
+        suite: str = '',
+        feature: str = '',
+        tags: Sequence[str] = (),
+    ):
+        """
+        Append one test result
+
+        Args:
+            name: Test name
+            status: Allure status
+            duration: Duration in seconds
+            full_name: Allure fullName
+            suite: Suite label
+            feature: Feature label
+            tags: Tag labels / pytest markers
+        """
+        row = len(self._status)
+        self._status.append(self.statuses.intern(status))
+        self._duration.append(duration)
+        self._name.append(name)
+        self._full_name.append(full_name)
+        self._suite.append(self.strings.intern(suite))
+        self._feature.append(self.strings.intern(feature))
+        for tag in tags:
+            rows = self._tags.get(tag)
+            if rows is None:
+                rows = self._tags[tag] = array('I')
+            rows.append(row)
+
+        self.total_duration += duration
+        self._ranked.clear()
+
+    def add_record(self, record: ResultRecord):
+        """Append a ResultRecord from utils.allure_ingest"""
+        self.add(
+            record.name,
+            record.status,
+            record.duration_ms / 1000,
+            record.full_name,
+            record.suite,
+            record.feature,
+            record.tags,
+        )
+
+    # ==================== Row access ====================
+
+    def __len__(self) -> int:
+        return len(self._status)
+
+    def row(self, idx: int) -> Dict:
+        """Materialize one row as a dict"""
+        return {
+            'name': self._name[idx],
+            'status': self.statuses[self._status[idx]],
+            'duration': self._duration[idx],
+            'fullName': self._full_name[idx],
+        }
+
+    def __iter__(self) -> Iterator[Dict]:
+        for idx in range(len(self)):
+            yield self.row(idx)
+
+    # ==================== Aggregations ====================
+
+    def count_by_status(self) -> Dict[str, int]:
+        """
+        Count tests per status
+
+        Returns:
+            Dict status -> count (statuses with zero tests are omitted)
+        """
+        raw = self._status.tobytes()
+        counts = {}
+        for code, status in enumerate(self.statuses.values):
+            n = raw.count(bytes((code,)))
+            if n:
+                counts[status] = n
+        return counts
+
+    def count(self, status: str) -> int:
+        return self.count_by_status().get(status, 0)
+
+    def with_status(self, status: str) -> List[Dict]:
+        """All rows with the given status, in insertion order"""
+        code = self.statuses.id_of(status)
+        if code < 0:
+            return []
+
+        raw = self._status.tobytes()
+        marker = bytes((code,))
+        rows = []
+        idx = raw.find(marker)
+        while idx != -1:
+            rows.append(self.row(idx))
+            idx = raw.find(marker, idx + 1)
+        return rows
+
+    def top_k_slowest(self, k: int = 5) -> List[Dict]:
+        """
+        Slowest k tests using a bounded heap (O(n log k), no full sort)
+
+        Returns:
+            Rows ordered from slowest to fastest
+        """
+        durations = self._duration
+        return [self.row(i) for i in heapq.nlargest(k, range(len(durations)), key=durations.__getitem__)]
+
+    def percentiles(self, points: Sequence[float] = (50, 90, 99)) -> Dict[str, float]:
+        """
+        Duration percentiles (nearest-rank)
+
+        Ranks are found by quickselect (expected O(n), no full sort): one
+        partition pass serves every requested rank on its side of the pivot.
+        Selected ranks are cached until the next add.
+
+        Args:
+            points: Percentiles between 0 and 100
+
+        Returns:
+            Dict like {'p50': 1.2, 'p90': 3.4, 'p99': 7.9} in seconds
+        """
+        n = len(self._duration)
+        if n == 0:
+            return {f"p{p:g}": 0.0 for p in points}
+
+        ranks = {p: int(min(max(1, -(-p * n // 100)), n)) for p in points}  # ceil(p/100 * n)
+        missing = sorted({rank for rank in ranks.values() if rank not in self._ranked})
+        if missing:
+            self._ranked.update(_select_ranks(self._duration, missing))
+        return {f"p{p:g}": self._ranked[rank] for p, rank in ranks.items()}
+
+    def group_by(self, field: str) -> Dict[str, Dict]:
+        """
+        Aggregate counts and durations per suite, feature or tag
+
+        Args:
+            field: 'suite', 'feature' or 'tag'
+
+        Returns:
+            Dict label -> {'count', 'passed', 'failed', 'total_duration', 'avg_duration'}
+        """
+        if field not in GROUP_FIELDS:
+            raise ValueError(f"Unknown group field '{field}', expected one of {GROUP_FIELDS}")
+
+        passed_code = self.statuses.id_of('passed')
+        failed_code = self.statuses.id_of('failed')
+
+        if field == 'tag':
+            groups = {tag: rows for tag, rows in self._tags.items()}
+        else:
+            column = self._suite if field == 'suite' else self._feature
+            buckets: Dict[int, array] = {}
+            for row, label_id in enumerate(column):
+                rows = buckets.get(label_id)
+                if rows is None:
+                    rows = buckets[label_id] = array('I')
+                rows.append(row)
+            groups = {self.strings[label_id]: rows for label_id, rows in buckets.items()}
+
+        result = {}
+        for label, rows in groups.items():
+            statuses = bytes(self._status[r] for r in rows)
+            total = sum(self._duration[r] for r in rows)
+            result[label] = {
+                'count': len(rows),
+                'passed': statuses.count(bytes((passed_code,))),
+                'failed': statuses.count(bytes((failed_code,))),
+                'total_duration': total,
+                'avg_duration': total / len(rows),
+            }
+        return result
+
+    # ==================== Memory ====================
+
+    def nbytes(self) -> int:
+        """Approximate memory held by the store in bytes"""
+        columns = (self._status, self._duration, self._suite, self._feature)
+        size = sum(sys.getsizeof(c) for c in columns) + self._name.nbytes() + self._full_name.nbytes()
+        size += sum(sys.getsizeof(rows) for rows in self._tags.values())
+        return size + self.strings.nbytes() + self.statuses.nbytes()
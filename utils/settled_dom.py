@@ -0,0 +1,295 @@
+"""
+Settled-DOM Visibility Checks
+Decides that an element is absent as soon as the page is quiescent instead
+of after a fixed timeout, and records the wait time saved per test
+"""
+import asyncio
+import time
+import weakref
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from playwright.sync_api import Error as PlaywrightError
+
+from utils.dom_probe import PROBE_SCRIPT, ElementState
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+# Resolves as soon as the element is visible, or once the document is loaded
+# and no DOM mutation happened for quietMs (settled), or after timeoutMs.
+# Selector matching is the batched probe's, so comma fallbacks and
+# :has-text() work; other Playwright-only syntax is reported as unsupported.
+SETTLED_CHECK_SCRIPT = """
+async (args) => {
+    const probe = PROBE_FUNCTION;
+    const check = () => probe({
+        selectors: {target: args.selector}, attributes: [], require: [], waitMode: false,
+    }).elements.target;
+
+    const started = performance.now();
+    const first = check();
+    if (first.visible || !first.supported) return {state: first, settled: false, waited_ms: 0};
+
+    return await new Promise((resolve) => {
+        let lastChange = started;
+        const observer = new MutationObserver(() => { lastChange = performance.now(); });
+        observer.observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+        const timer = setInterval(() => {
+            const now = performance.now();
+            const state = check();
+            const settled = !state.visible && document.readyState === 'complete' && now - lastChange >= args.quietMs;
+            if (state.visible || settled || now - started >= args.timeoutMs) {
+                observer.disconnect();
+                clearInterval(timer);
+                resolve({state, settled, waited_ms: now - started});
+            }
+        }, args.pollMs);
+    });
+}
+""".strip().replace('PROBE_FUNCTION', PROBE_SCRIPT)
+
+
+@dataclass
+class SettledCheck:
+    """Outcome of a settled-DOM visibility check"""
+
+    state: ElementState
+    settled: bool  # absence decided by quiescence rather than by the timeout
+    waited_ms: float
+    timeout_ms: float
+
+    @property
+    def visible(self) -> bool:
+        return self.state.visible
+
+    @property
+    def saved_ms(self) -> float:
+        """Wait avoided compared with waiting out the timeout"""
+        return max(0.0, self.timeout_ms - self.waited_ms) if self.settled else 0.0
+
+
+# ==================== In-flight requests ====================
+
+# Requests in flight per page; a DOM that is quiet while a response is still
+# pending (e.g. the login POST) is not settled yet
+_in_flight: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def track_requests(page):
+    """Count in-flight requests of a page (sync or async API; idempotent)"""
+    if page in _in_flight:
+        return
+    _in_flight[page] = 0
+
+    def _started(_request):
+        _in_flight[page] = _in_flight.get(page, 0) + 1
+
+    def _ended(_request):
+        _in_flight[page] = max(0, _in_flight.get(page, 0) - 1)
+
+    page.on("request", _started)
+    page.on("requestfinished", _ended)
+    page.on("requestfailed", _ended)
+
+
+def pending_requests(page) -> int:
+    return _in_flight.get(page, 0)
+
+
+# ==================== Checks ====================
+
+def _arguments(selector: str, timeout_ms: float) -> Dict:
+    return {
+        'selector': selector,
+        'quietMs': recorder.quiet_ms,
+        'pollMs': recorder.poll_ms,
+        'timeoutMs': max(0.0, timeout_ms),
+    }
+
+
+def _retry_delay(remaining_ms: float) -> float:
+    """Seconds to back off before re-running a check that raised: one poll interval, within the timeout"""
+    return max(0.0, min(recorder.poll_ms, remaining_ms)) / 1000
+
+
+def _result(raw: Optional[Dict], selector: str, started: float, timeout_ms: float, settled: bool) -> SettledCheck:
+    state = ElementState(name='target', selector=selector, **(raw['state'] if raw else {}))
+    return SettledCheck(state, settled, (time.perf_counter() - started) * 1000, timeout_ms)
+
+
+def check_visible(page, selector: str, timeout: float = 2000, label: str = "check") -> SettledCheck:
+    """
+    Return as soon as an element is visible or the page has settled without it
+
+    Args:
+        page: Playwright Page (sync API)
+        selector: CSS selector (comma fallbacks and :has-text() supported)
+        timeout: Longest wait in milliseconds, as with a plain visibility wait
+        label: Name used in logs and statistics
+
+    Returns:
+        SettledCheck; state.supported is False for selectors the in-page probe cannot evaluate
+    """
+    track_requests(page)
+    started = time.perf_counter()
+    while True:
+        remaining = timeout - (time.perf_counter() - started) * 1000
+        try:
+            raw = page.evaluate(SETTLED_CHECK_SCRIPT, _arguments(selector, remaining))
+        except PlaywrightError as e:
+            # A closed page or context fails every retry at once: report it instead of spinning
+            if page.is_closed():
+                raise
+            # A navigation replaced the document mid-check: look again at the new one
+            if remaining <= 0:
+                result = _result(None, selector, started, timeout, settled=False)
+                break
+            log.debug(f"Settled check of {selector} restarted: {e}")
+            try:
+                page.wait_for_load_state('domcontentloaded', timeout=max(1, remaining))
+            except PlaywrightError:
+                pass
+            time.sleep(_retry_delay(remaining))
+            continue
+
+        result = _result(raw, selector, started, timeout, raw['settled'])
+        if not result.settled or pending_requests(page) == 0:
+            break
+        if result.waited_ms >= timeout:
+            result.settled = False  # never went quiet on the network
+            break
+        # The DOM is quiet but a response is still on its way
+        page.wait_for_timeout(recorder.quiet_ms)
+
+    recorder.record(label, result)
+    return result
+
+
+async def check_visible_async(page, selector: str, timeout: float = 2000, label: str = "check") -> SettledCheck:
+    """check_visible for a playwright.async_api Page"""
+    track_requests(page)
+    started = time.perf_counter()
+    while True:
+        remaining = timeout - (time.perf_counter() - started) * 1000
+        try:
+            raw = await page.evaluate(SETTLED_CHECK_SCRIPT, _arguments(selector, remaining))
+        except PlaywrightError as e:
+            if page.is_closed():
+                raise
+            if remaining <= 0:
+                result = _result(None, selector, started, timeout, settled=False)
+                break
+            log.debug(f"Settled check of {selector} restarted: {e}")
+            try:
+                await page.wait_for_load_state('domcontentloaded', timeout=max(1, remaining))
+            except PlaywrightError:
+                pass
+            await asyncio.sleep(_retry_delay(remaining))
+            continue
+
+        result = _result(raw, selector, started, timeout, raw['settled'])
+        if not result.settled or pending_requests(page) == 0:
+            break
+        if result.waited_ms >= timeout:
+            result.settled = False  # never went quiet on the network
+            break
+        await page.wait_for_timeout(recorder.quiet_ms)
+
+    recorder.record(label, result)
+    return result
+
+
+# ==================== Recording ====================
+
+class NegativeCheckRecorder:
+    """
+    Counts settled-DOM checks and the wait time they saved, per test and in total
+
+    Configured from settings by tests/conftest.py, which also opens and
+    closes a test around each test.
+    """
+
+    def __init__(self):
+        self.quiet_ms = 100
+        self.poll_ms = 20
+        self.checks = 0
+        self.visible = 0
+        self.settled = 0
+        self.timed_out = 0
+        self.saved_ms = 0.0
+        self.per_test_saved: List[float] = []
+        self.current: Optional[Dict] = None
+
+    def configure(self, quiet_ms: float = 100, poll_ms: float = 20):
+        """
+        Args:
+            quiet_ms: Mutation-free window after which a loaded page counts as settled
+            poll_ms: In-page polling interval
+        """
+        self.quiet_ms, self.poll_ms = quiet_ms, poll_ms
+
+    def begin_test(self):
+        self.current = {'checks': 0, 'absent': 0, 'saved_ms': 0.0, 'waited_ms': 0.0}
+
+    def end_test(self) -> Dict:
+        """The finished test's counters (saved_ms is the wait time avoided)"""
+        current, self.current = self.current or {}, None
+        if current.get('checks'):
+            self.per_test_saved.append(current['saved_ms'])
+        return current
+
+    def record(self, label: str, check: SettledCheck):
+        self.checks += 1
+        if check.visible:
+            self.visible += 1
+        elif check.settled:
+            self.settled += 1
+        else:
+            self.timed_out += 1
+        self.saved_ms += check.saved_ms
+
+        if self.current is not None:
+            self.current['checks'] += 1
+            self.current['absent'] += 0 if check.visible else 1
+            self.current['saved_ms'] += check.saved_ms
+            self.current['waited_ms'] += check.waited_ms
+
+        outcome = 'visible' if check.visible else 'settled' if check.settled else 'timeout'
+        log.debug(f"Settled check '{label}': {outcome} after {check.waited_ms:.0f}ms (saved {check.saved_ms:.0f}ms)")
+
+    def summary(self) -> Dict:
+        tests = len(self.per_test_saved)
+        return {
+            'checks': self.checks,
+            'visible': self.visible,
+            'settled': self.settled,
+            'timed_out': self.timed_out,
+            'saved_ms': self.saved_ms,
+            'tests': tests,
+            'avg_saved_per_test_ms': self.saved_ms / tests if tests else 0.0,
+            'max_saved_per_test_ms': max(self.per_test_saved, default=0.0),
+        }
+
+    def to_dict(self) -> Dict:
+        return {
+            'checks': self.checks,
+            'visible': self.visible,
+            'settled': self.settled,
+            'timed_out': self.timed_out,
+            'saved_ms': self.saved_ms,
+            'per_test_saved': self.per_test_saved,
+        }
+
+    def merge_dict(self, data: Dict):
+        """Fold in the counters saved by another process (e.g. an xdist worker)"""
+        self.checks += data['checks']
+        self.visible += data['visible']
+        self.settled += data['settled']
+        self.timed_out += data['timed_out']
+        self.saved_ms += data['saved_ms']
+        self.per_test_saved.extend(data['per_test_saved'])
+
+
+# Process-wide recorder, configured by tests/conftest.py
+recorder = NegativeCheckRecorder()
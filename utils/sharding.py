@@ -0,0 +1,97 @@
+"""
+Deterministic Test Sharding
+Splits the collected tests across parallel CI jobs so every job runs a
+stable, balanced subset
+"""
+import hashlib
+from typing import Dict, Optional, Sequence
+
+import pytest
+
+from utils.duration_scheduler import DurationEstimates, lpt_pack
+
+SHARD_MODES = ("hash", "duration")
+
+
+def hash_shard(nodeid: str, total: int) -> int:
+    """Shard (0-based) of a test from a hash of its node id"""
+    return int(hashlib.sha1(nodeid.encode("utf-8")).hexdigest()[:8], 16) % total
+
+
+def assign_shards(
+    nodeids: Sequence[str],
+    total: int,
+    mode: str = "hash",
+    estimates: Optional[DurationEstimates] = None,
+) -> Dict[str, int]:
+    """
+    Assign every test to a shard (0-based)
+
+    'hash' depends only on the node id, so a test never moves between shards.
+    'duration' packs tests by predicted duration (LPT) for balanced shards.
+    The result depends only on the set of tests and the estimates, not on the
+    collection order, so every job computes the same split as long as they
+    read the same history.
+
+    Args:
+        nodeids: Collected test ids
+        total: Number of shards
+        mode: 'hash' or 'duration'
+        estimates: Duration estimates (required for 'duration')
+
+    Returns:
+        Dict nodeid -> shard
+    """
+    if mode == "hash" or estimates is None:
+        return {nodeid: hash_shard(nodeid, total) for nodeid in nodeids}
+
+    ordered = sorted(nodeids)
+    bins, _ = lpt_pack([estimates.estimate(nodeid)[0] for nodeid in ordered], total)
+    return {ordered[i]: shard for shard, indices in enumerate(bins) for i in indices}
+
+
+class ShardingPlugin:
+    """
+    pytest plugin: keep only the tests of one shard
+
+    Registered by tests/conftest.py on the controller and on every xdist
+    worker when --shard-total is greater than 1. Runs after marker
+    selection so shards are balanced on the tests that will actually run.
+    """
+
+    def __init__(self, index: int, total: int, mode: str, estimates: Optional[DurationEstimates]):
+        """
+        Args:
+            index: Shard to run, 1-based (matches GitLab's CI_NODE_INDEX)
+            total: Number of shards
+            mode: 'hash' or 'duration'
+            estimates: Duration estimates for 'duration' mode
+        """
+        self.index = index
+        self.total = total
+        self.mode = mode
+        self.estimates = estimates
+        self.selected = 0
+        self.deselected = 0
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, config, items):
+        shards = assign_shards([item.nodeid for item in items], self.total, self.mode, self.estimates)
+        keep, drop = [], []
+        for item in items:
+            (keep if shards[item.nodeid] == self.index - 1 else drop).append(item)
+        if drop:
+            config.hook.pytest_deselected(items=drop)
+        items[:] = keep
+        self.selected, self.deselected = len(keep), len(drop)
+
+    def pytest_report_header(self, config):
+        return f"shard: {self.index}/{self.total} ({self.mode} mode)"
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.selected or self.deselected:
+            terminalreporter.write_sep("-", "sharding")
+            terminalreporter.write_line(
+                f"shard {self.index}/{self.total} ({self.mode}): ran {self.selected} tests, "
+                f"{self.deselected} belong to other shards"
+            )
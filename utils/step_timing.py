@@ -0,0 +1,178 @@
+"""
+Step Timing
+Per-test step trees and a cross-test profile of the page-object steps
+recorded by utils.logger.log_test_step
+"""
+import json
+import os
+import threading
+import time
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from utils.latency_histogram import LatencyHistogram
+
+
+class StepNode:
+    """One timed step; children are the steps it called"""
+
+    __slots__ = ('description', 'status', 'duration_ns', 'children', 'error')
+
+    def __init__(self, description: str):
+        self.description = description
+        self.status = 'running'
+        self.duration_ns = 0
+        self.children: List["StepNode"] = []
+        self.error: Optional[str] = None
+
+    def to_dict(self) -> Dict:
+        data = {
+            'step': self.description,
+            'status': self.status,
+            'duration_ms': round(self.duration_ns / 1e6, 3),
+        }
+        if self.error:
+            data['error'] = self.error
+        if self.children:
+            data['children'] = [child.to_dict() for child in self.children]
+        return data
+
+
+# Innermost running step of the current test / thread / asyncio task
+_current: ContextVar[Optional[StepNode]] = ContextVar('current_step', default=None)
+
+
+class StepProfile:
+    """
+    Step durations aggregated by description across tests
+
+    Each description keeps a LatencyHistogram, so memory stays flat no
+    matter how many times a step runs, and per-worker profiles can be merged.
+    """
+
+    def __init__(self):
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self.failures: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, description: str, duration_ns: int, failed: bool = False):
+        with self._lock:
+            histogram = self.histograms.get(description)
+            if histogram is None:
+                histogram = self.histograms[description] = LatencyHistogram()
+            histogram.record(duration_ns // 1000)
+            if failed:
+                self.failures[description] = self.failures.get(description, 0) + 1
+
+    def merge(self, other: "StepProfile"):
+        for description, histogram in other.histograms.items():
+            if description in self.histograms:
+                self.histograms[description].merge(histogram)
+            else:
+                self.histograms[description] = LatencyHistogram.from_dict(histogram.to_dict())
+        for description, count in other.failures.items():
+            self.failures[description] = self.failures.get(description, 0) + count
+
+    def rows(self) -> List[Dict]:
+        """count, total, mean and p95 per step description, by total time descending"""
+        rows = [
+            {
+                'step': description,
+                'count': h.count,
+                'failed': self.failures.get(description, 0),
+                'total_ms': round(h.total / 1000, 3),
+                'mean_ms': round(h.mean_ms, 3),
+                'p95_ms': h.percentile_ms(95),
+            }
+            for description, h in self.histograms.items()
+        ]
+        return sorted(rows, key=lambda row: row['total_ms'], reverse=True)
+
+    def to_dict(self) -> Dict:
+        return {
+            'steps': {description: h.to_dict() for description, h in self.histograms.items()},
+            'failures': dict(self.failures),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "StepProfile":
+        profile = cls()
+        profile.histograms = {d: LatencyHistogram.from_dict(h) for d, h in data.get('steps', {}).items()}
+        profile.failures = dict(data.get('failures', {}))
+        return profile
+
+    def save(self, path: Path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(self.to_dict()), encoding='utf-8')
+        os.replace(tmp, path)
+
+    @classmethod
+    def load_all(cls, paths: Iterable[Path]) -> "StepProfile":
+        """Merge saved profiles (e.g. one per xdist worker)"""
+        merged = cls()
+        for path in paths:
+            with open(path, 'r', encoding='utf-8') as f:
+                merged.merge(cls.from_dict(json.load(f)))
+        return merged
+
+    def format_table(self, limit: int = 15) -> str:
+        rows = self.rows()[:limit]
+        if not rows:
+            return ""
+        width = max(len(row['step']) for row in rows)
+        lines = [f"{'step':<{width}} {'count':>6} {'total':>10} {'mean':>9} {'p95':>9} {'failed':>6}"]
+        for row in rows:
+            lines.append(
+                f"{row['step']:<{width}} {row['count']:>6} {row['total_ms'] / 1000:>9.2f}s "
+                f"{row['mean_ms']:>7.0f}ms {row['p95_ms']:>7.0f}ms {row['failed']:>6}"
+            )
+        return "\n".join(lines)
+
+
+# Process-wide profile fed by every finished step
+profile = StepProfile()
+
+
+# ==================== Recording ====================
+
+
+def start_step(description: str) -> Tuple[StepNode, object, int]:
+    """
+    Open a step under the current one
+
+    Returns:
+        (node, context token, start time in ns) to pass to finish_step
+    """
+    node = StepNode(description)
+    parent = _current.get()
+    if parent is not None:
+        parent.children.append(node)
+    return node, _current.set(node), time.perf_counter_ns()
+
+
+def finish_step(node: StepNode, token, started_ns: int, error: BaseException = None):
+    """Close a step opened with start_step and add it to the profile"""
+    node.duration_ns = time.perf_counter_ns() - started_ns
+    _current.reset(token)
+    if error is None:
+        node.status = 'passed'
+    else:
+        node.status = 'failed'
+        node.error = f"{type(error).__name__}: {error}"[:200]
+    profile.record(node.description, node.duration_ns, failed=error is not None)
+
+
+def begin_test(name: str) -> Tuple[StepNode, object, int]:
+    """Open the root of a test's step tree (steps outside a test are only profiled)"""
+    return start_step(name)
+
+
+def end_test(root: StepNode, token, started_ns: int) -> StepNode:
+    """Close a test's step tree without counting the test itself in the profile"""
+    root.duration_ns = time.perf_counter_ns() - started_ns
+    root.status = 'done'
+    _current.reset(token)
+    return root
@@ -2,27 +2,49 @@
 Automated Test Report Generator
 Generates beautiful documentation from test results using Obsidian notes and Pandoc
 """
+import hashlib
 import json
-import subprocess
+import os
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Sequence
 import xml.etree.ElementTree as ET
 
+from utils.allure_index import AllureResultIndex
+from utils.allure_ingest import IngestStats, ResultAggregates, stream_results
+from utils.load_report import load_result_data, render_markdown as render_load_markdown
+from utils.pandoc_scheduler import ConversionJob, ConversionResult, PandocScheduler
+
 
 class TestReportGenerator:
     """Generate test reports from Allure results and convert to multiple formats"""
 
-    def __init__(self, project_root: Path = None):
+    def __init__(self, project_root: Path = None, use_index: bool = True):
         self.project_root = project_root or Path.cwd()
         self.docs_dir = self.project_root / "docs"
         self.reports_dir = self.project_root / "reports"
         self.allure_results = self.reports_dir / "allure-results"
+        self.results_index = self.reports_dir / "allure-index.sqlite"
+        self.load_results = self.reports_dir / "load" / "login_load.json"
+        self.use_index = use_index
         self.output_dir = self.docs_dir / "generated_reports"
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.pandoc = PandocScheduler(
+            max_workers=int(os.getenv('PANDOC_WORKERS', '4')),
+            timeout=float(os.getenv('PANDOC_TIMEOUT', '120')),
+        )
 
     def parse_allure_results(self) -> Dict:
-        """Parse Allure test results from JSON files"""
+        """
+        Parse Allure test results from JSON files
+
+        Each test keeps the Allure attachment dicts (name, source, type). Steps are
+        reduced to the name and status of the top-level steps, which is all the
+        templates render; nested steps and step timings are not carried over.
+
+        Returns:
+            Dict with 'total', 'passed', 'failed', 'skipped' and 'tests'
+        """
         if not self.allure_results.exists():
             print(f"❌ Allure results not found: {self.allure_results}")
             return {}
@@ -35,32 +57,37 @@ class TestReportGenerator:
             'tests': []
         }
 
-        # Parse all result JSON files
-        for result_file in self.allure_results.glob("*-result.json"):
-            try:
-                with open(result_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-
-                    test_results['total'] += 1
-                    status = data.get('status', 'unknown')
-
-                    if status == 'passed':
-                        test_results['passed'] += 1
-                    elif status == 'failed':
-                        test_results['failed'] += 1
-                    elif status == 'skipped':
-                        test_results['skipped'] += 1
-
-                    test_results['tests'].append({
-                        'name': data.get('name', 'Unknown'),
-                        'status': status,
-                        'duration': data.get('stop', 0) - data.get('start', 0),
-                        'description': data.get('description', ''),
-                        'steps': data.get('steps', []),
-                        'attachments': data.get('attachments', [])
-                    })
-            except Exception as e:
-                print(f"⚠️ Failed to parse {result_file.name}: {e}")
+        aggregates = ResultAggregates()
+        stats = IngestStats()
+
+        if self.use_index:
+            records = AllureResultIndex(self.results_index, self.allure_results).stream(stats=stats)
+        else:
+            records = stream_results(self.allure_results, stats=stats)
+
+        for record in records:
+            aggregates.add(record)
+            test_results['tests'].append({
+                'name': record.name,
+                'status': record.status,
+                'duration': record.duration_ms,
+                'description': record.description,
+                'steps': [{'name': name, 'status': status} for name, status in record.steps],
+                'attachments': [
+                    {'name': name, 'source': source, 'type': mime_type}
+                    for name, source, mime_type in record.attachments
+                ]
+            })
+
+        for name, error in stats.errors:
+            print(f"⚠️ Failed to parse {name}: {error}")
+
+        test_results['total'] = aggregates.total
+        for status in ('passed', 'failed', 'skipped'):
+            test_results[status] = aggregates.count(status)
+
+        if stats.files:
+            print(f"📊 Parsed {stats.format()}")
 
         return test_results
 
@@ -192,6 +219,8 @@ Pass Rate: {pass_rate:.1f}%
 
             md += "\n---\n\n"
 
+        md += self._load_test_section()
+
         md += """
 ## 📝 Notes
 
@@ -250,6 +279,33 @@ Generated: {timestamp}
 ## Test List
 """
 
+    def report_fingerprint(self, test_results: Dict, template: str) -> str:
+        """
+        Hash of everything a report is rendered from
+
+        The markdown embeds its generation time, so its bytes change on every run.
+        This hash covers the results, the template, the load test data and this
+        module (the templates live here), and only changes when the report would.
+
+        Args:
+            test_results: Output of parse_allure_results
+            template: Report template name
+
+        Returns:
+            Hex digest, used as the Pandoc job fingerprint
+        """
+        inputs = {'results': test_results, 'template': template, 'load': load_result_data(self.load_results)}
+        digest = hashlib.sha256(Path(__file__).read_bytes())
+        digest.update(json.dumps(inputs, sort_keys=True, default=str).encode('utf-8'))
+        return digest.hexdigest()
+
+    def _load_test_section(self) -> str:
+        """Login load test section from scripts/run_login_load.py output (empty if it has not run)"""
+        data = load_result_data(self.load_results)
+        if not data:
+            return ""
+        return render_load_markdown(data) + "\n---\n"
+
     def _calculate_avg_duration(self, tests: List[Dict]) -> float:
         """Calculate average test duration"""
         if not tests:
@@ -270,45 +326,21 @@ Generated: {timestamp}
 
     def convert_with_pandoc(self, input_file: Path, output_format: str = "html") -> Path:
         """Convert markdown to other formats using Pandoc"""
-        output_file = input_file.with_suffix(f".{output_format}")
-
-        try:
-            # Check if pandoc is installed
-            subprocess.run(["pandoc", "--version"],
-                           capture_output=True, check=True)
-
-            # Pandoc conversion with enhanced styling
-            cmd = [
-                "pandoc",
-                str(input_file),
-                "-o", str(output_file),
-                "--standalone",
-                "--toc",  # Table of contents
-                "--toc-depth=3",
-                "-V", "geometry:margin=1in"
-            ]
-
-            if output_format == "html":
-                cmd.extend([
-                    "--css=https://cdn.jsdelivr.net/npm/water.css@2/out/water.css",
-                    "--metadata", "title=Test Execution Report"
-                ])
-            elif output_format == "pdf":
-                cmd.extend([
-                    "--pdf-engine=pdflatex",
-                    "-V", "colorlinks=true"
-                ])
-
-            subprocess.run(cmd, check=True)
-            print(f"✅ Converted to {output_format.upper()}: {output_file}")
-            return output_file
-
-        except FileNotFoundError:
-            print("❌ Pandoc not installed. Install with: https://pandoc.org/installing.html")
-            return None
-        except subprocess.CalledProcessError as e:
-            print(f"❌ Pandoc conversion failed: {e}")
-            return None
+        result = self.pandoc.run([ConversionJob(input_file, output_format)])[0]
+        return result.output
+
+    def convert_all(self, sources: List[Path], formats: Sequence[str]) -> List[ConversionResult]:
+        """
+        Convert several markdown files to several formats concurrently
+
+        Args:
+            sources: Markdown files
+            formats: Output formats for every source ('html', 'docx', 'pdf')
+
+        Returns:
+            ConversionResult per (source, format) job
+        """
+        return self.pandoc.run([ConversionJob(source, fmt) for source in sources for fmt in formats])
 
     def generate_obsidian_compatible(self, content: str, filename: str = None) -> Path:
         """Save report in Obsidian-compatible format with metadata"""
@@ -333,53 +365,64 @@ status: completed
         print(f"✅ Obsidian report saved: {filepath}")
         return filepath
 
-    def generate_all_formats(self, template: str = "comprehensive"):
-        """Generate reports in all formats"""
+    def generate_all_formats(self, template: str = "comprehensive",
+                             executive_formats: Sequence[str] = ()) -> Dict:
+        """
+        Generate reports in all formats
+
+        The main report is written as test_report_<template>.md so its conversions
+        keep their names across runs and are skipped while the results are unchanged.
+
+        Args:
+            template: Template for the main report
+            executive_formats: Also write executive_summary.md and convert it to these formats
+
+        Returns:
+            Parsed test results (None if there are no results)
+        """
         print("\n🚀 Starting report generation...")
 
         # Parse test results
         results = self.parse_allure_results()
         if not results or results['total'] == 0:
             print("⚠️ No test results found. Run tests first!")
-            return
+            return None
 
         # Generate markdown
         print(f"\n📝 Generating {template} markdown report...")
         content = self.generate_markdown_report(results, template)
 
         # Save to output directory
-        md_file = self.save_markdown_report(content)
+        md_file = self.save_markdown_report(content, f"test_report_{template}.md")
 
         # Save to Obsidian
         obsidian_file = self.generate_obsidian_compatible(content)
 
-        # Convert to other formats
-        print("\n🔄 Converting to multiple formats...")
-        self.convert_with_pandoc(md_file, "html")
-        self.convert_with_pandoc(md_file, "docx")
+        fingerprint = self.report_fingerprint(results, template)
+        jobs = [ConversionJob(md_file, fmt, fingerprint) for fmt in ("html", "docx", "pdf")]
+        if executive_formats:
+            exec_content = self.generate_markdown_report(results, template="executive")
+            exec_file = self.save_markdown_report(exec_content, "executive_summary.md")
+            exec_fingerprint = self.report_fingerprint(results, "executive")
+            jobs.extend(ConversionJob(exec_file, fmt, exec_fingerprint) for fmt in executive_formats)
 
-        # Try PDF if LaTeX is available
-        pdf_file = self.convert_with_pandoc(md_file, "pdf")
+        # Convert everything in one batch; PDF is skipped when LaTeX is unavailable
+        print("\n🔄 Converting to multiple formats...")
+        self.pandoc.run(jobs)
 
         print("\n✅ Report generation complete!")
         print(f"📁 Output directory: {self.output_dir}")
         print(f"📝 Obsidian vault: {self.docs_dir}")
+        return results
 
 
 def main():
     """Main execution function"""
     generator = TestReportGenerator()
 
-    # Generate all report formats
-    generator.generate_all_formats(template="comprehensive")
-
-    # Also generate executive summary
-    results = generator.parse_allure_results()
-    if results:
-        exec_content = generator.generate_markdown_report(results, template="executive")
-        exec_file = generator.save_markdown_report(exec_content, "executive_summary.md")
-        generator.convert_with_pandoc(exec_file, "html")
+    # Generate all report formats plus the executive summary
+    generator.generate_all_formats(template="comprehensive", executive_formats=("html",))
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,196 @@
+"""
+Timeout Budget
+Per-test deadline shared by every page-object call: each call's timeout is
+capped by what is left, and the test is aborted once the budget is spent
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+
+class TimeoutBudgetExceeded(AssertionError):
+    """
+    Raised when a test has spent its whole timeout budget
+
+    The message is the budget breakdown, rendered when the failure is
+    reported so the enclosing calls are already charged.
+    """
+
+    def __init__(self, budget: "TimeoutBudget"):
+        super().__init__(budget.label)
+        self.budget = budget
+
+    def __str__(self) -> str:
+        return self.budget.format_breakdown()
+
+
+class TimeoutBudget:
+    """
+    Wall-clock budget of one test
+
+    Only the outermost page-object call is charged (LoginPage.login, not the
+    fills and clicks it makes), so the breakdown adds up to at most the
+    elapsed time; the rest is reported as time outside page objects.
+    Concurrent calls (async pages) are charged individually.
+
+    Example:
+        budget, token = start_budget(60000, default_ms=5000, label=nodeid)
+        with budgeted('LoginPage.login') as timeout:
+            ...
+        stop_budget(token)
+    """
+
+    def __init__(self, total_ms: float, default_ms: float = 5000, label: str = ""):
+        """
+        Args:
+            total_ms: Wall-clock milliseconds the test may spend
+            default_ms: Timeout of calls that do not ask for one (settings.TIMEOUT)
+            label: Test id used in the breakdown
+        """
+        self.total_ms = total_ms
+        self.default_ms = default_ms
+        self.label = label
+        self.started = time.monotonic()
+        self.spent: Dict[str, List[float]] = {}  # operation -> [ms, calls]
+        self.exhausted_in: Optional[str] = None
+        self.exhausted_at_ms: Optional[float] = None
+
+    @property
+    def elapsed_ms(self) -> float:
+        return (time.monotonic() - self.started) * 1000
+
+    @property
+    def remaining_ms(self) -> float:
+        return self.total_ms - self.elapsed_ms
+
+    @property
+    def exhausted(self) -> bool:
+        return self.exhausted_in is not None
+
+    def allot(self, operation: str, requested_ms: Optional[float] = None) -> int:
+        """
+        Timeout for the next call: the requested one, capped by what is left
+
+        Raises:
+            TimeoutBudgetExceeded: Nothing is left
+        """
+        requested = self.default_ms if requested_ms is None else requested_ms
+        remaining = self.remaining_ms
+        if remaining < 1:
+            raise self.exceeded(operation)
+        # Playwright reads timeout=0 as "no timeout", so never go below 1ms
+        return max(1, int(min(requested, remaining)))
+
+    def charge(self, operation: str, elapsed_ms: float):
+        entry = self.spent.setdefault(operation, [0.0, 0])
+        entry[0] += elapsed_ms
+        entry[1] += 1
+
+    def breakdown(self) -> List[Tuple[str, float, int]]:
+        """(operation, ms, calls) by time descending, plus the time spent outside page objects"""
+        rows = sorted(((op, ms, calls) for op, (ms, calls) in self.spent.items()), key=lambda r: r[1], reverse=True)
+        elapsed = self.exhausted_at_ms if self.exhausted else self.elapsed_ms
+        outside = elapsed - sum(ms for _, ms, _ in rows)
+        if outside > 0:
+            rows.append(("outside page objects", outside, 0))
+        return rows
+
+    def format_breakdown(self) -> str:
+        if self.exhausted:
+            lines = [f"Timeout budget of {self.total_ms:.0f}ms exhausted after {self.exhausted_at_ms:.0f}ms "
+                     f"in {self.exhausted_in}"]
+        else:
+            lines = [f"Timeout budget of {self.total_ms:.0f}ms, {self.elapsed_ms:.0f}ms spent"]
+        for operation, ms, calls in self.breakdown():
+            suffix = f" ({calls} call{'s' if calls != 1 else ''})" if calls else ""
+            lines.append(f"  {ms:>8.0f}ms  {operation}{suffix}")
+        return "\n".join(lines)
+
+    def exceeded(self, operation: str) -> TimeoutBudgetExceeded:
+        if self.exhausted_in is None:
+            self.exhausted_in = operation
+            self.exhausted_at_ms = self.elapsed_ms
+            log.error(f"Timeout budget exhausted in {operation} ({self.label})")
+        return TimeoutBudgetExceeded(self)
+
+    def to_dict(self) -> Dict:
+        return {
+            'test': self.label,
+            'total_ms': self.total_ms,
+            'elapsed_ms': round(self.elapsed_ms, 1),
+            'exhausted_in': self.exhausted_in,
+            'breakdown': [
+                {'operation': operation, 'ms': round(ms, 1), 'calls': calls}
+                for operation, ms, calls in self.breakdown()
+            ],
+        }
+
+
+# Budget of the running test and page-object call nesting (per thread / asyncio task)
+_current: ContextVar[Optional[TimeoutBudget]] = ContextVar('timeout_budget', default=None)
+_depth: ContextVar[int] = ContextVar('timeout_budget_depth', default=0)
+
+
+def start_budget(total_ms: float, default_ms: float = 5000, label: str = "") -> Tuple[TimeoutBudget, object]:
+    """
+    Open a budget for the running test
+
+    Returns:
+        (budget, context token to pass to stop_budget)
+    """
+    budget = TimeoutBudget(total_ms, default_ms, label)
+    return budget, _current.set(budget)
+
+
+def stop_budget(token):
+    _current.reset(token)
+
+
+def current_budget() -> Optional[TimeoutBudget]:
+    return _current.get()
+
+
+@contextmanager
+def budgeted(operation: str, requested_ms: Optional[float] = None):
+    """
+    Run a page-object call against the current test's budget
+
+    Args:
+        operation: Name shown in the breakdown (e.g. 'LoginPage.login')
+        requested_ms: Timeout the call would use without a budget (None: the default timeout)
+
+    Yields:
+        Timeout in milliseconds to pass on (requested_ms unchanged when no budget is active)
+
+    Raises:
+        TimeoutBudgetExceeded: The budget is spent, or the call failed after
+            waiting out a timeout that the budget had cut short
+    """
+    budget = _current.get()
+    if budget is None:
+        yield requested_ms
+        return
+
+    timeout = budget.allot(operation, requested_ms)
+    requested = budget.default_ms if requested_ms is None else requested_ms
+    depth = _depth.get()
+    token = _depth.set(depth + 1)
+    started = time.monotonic()
+    try:
+        yield timeout
+    except TimeoutBudgetExceeded:
+        raise
+    except Exception as e:
+        elapsed = (time.monotonic() - started) * 1000
+        if timeout < requested and elapsed >= timeout:
+            raise budget.exceeded(operation) from e
+        raise
+    finally:
+        _depth.reset(token)
+        if depth == 0:
+            budget.charge(operation, (time.monotonic() - started) * 1000)
@@ -0,0 +1,273 @@
+"""
+Ring-Buffered Tracing
+Records Playwright traces in short chunks kept in a memory-backed ring
+buffer; only the last N seconds are persisted, and only for failed tests
+"""
+import itertools
+import os
+import shutil
+import tempfile
+import time
+from collections import deque
+from pathlib import Path
+from typing import Deque, Dict, List, NamedTuple, Optional
+
+from playwright.sync_api import BrowserContext, Error as PlaywrightError
+
+from utils.latency_histogram import LatencyHistogram
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+TRACE_MODES = ('off', 'full', 'ring')
+
+# tmpfs: chunks written here never touch the disk
+MEMORY_DIRS = ('/dev/shm',)
+
+
+def _buffer_root() -> Path:
+    for candidate in MEMORY_DIRS:
+        if os.path.isdir(candidate) and os.access(candidate, os.W_OK):
+            return Path(candidate)
+    return Path(tempfile.gettempdir())
+
+
+# Chunk file numbers are unique per process, so a kept chunk waiting to be
+# moved is never overwritten by a later test on the same context
+_chunk_numbers = itertools.count(1)
+
+
+class TraceChunk(NamedTuple):
+    path: Path
+    started: float
+    ended: float
+
+
+class ContextTrace:
+    """
+    Tracing state of one browser context
+
+    In 'ring' mode the trace is split into chunks of chunk_s seconds; each
+    finished chunk goes to the buffer directory and chunks that ended more
+    than window_s ago are deleted. In 'full' mode the whole test is one
+    chunk. A passing test's open chunk is discarded without being written.
+    """
+
+    def __init__(self, context: BrowserContext, label: str, mode: str, window_s: float, chunk_s: float,
+                 buffer_dir: Path):
+        self.context = context
+        self.label = label
+        self.mode = mode
+        self.window_s = window_s
+        self.chunk_s = chunk_s
+        self.buffer_dir = buffer_dir
+        self.chunks: Deque[TraceChunk] = deque()
+        self.chunk_started = 0.0
+
+    def start(self):
+        tracing = self.context.tracing
+        try:
+            tracing.start(screenshots=True, snapshots=True, sources=False)
+        except PlaywrightError:
+            # A pooled context can come back with tracing still running from a failed setup
+            tracing.stop()
+            tracing.start(screenshots=True, snapshots=True, sources=False)
+        self._start_chunk()
+
+    def _start_chunk(self):
+        self.context.tracing.start_chunk(title=self.label)
+        self.chunk_started = time.monotonic()
+
+    def _chunk_path(self) -> Path:
+        return self.buffer_dir / f"chunk-{next(_chunk_numbers)}.zip"
+
+    def maybe_rotate(self, now: float):
+        """Close the running chunk into the buffer once it is chunk_s old"""
+        if self.mode != 'ring' or now - self.chunk_started < self.chunk_s:
+            return
+        path = self._chunk_path()
+        self.context.tracing.stop_chunk(path=str(path))
+        self.chunks.append(TraceChunk(path, self.chunk_started, now))
+        while self.chunks and self.chunks[0].ended < now - self.window_s:
+            self.chunks.popleft().path.unlink(missing_ok=True)
+        self._start_chunk()
+
+    def finish(self, failed: bool) -> List[Path]:
+        """
+        Stop tracing and drop the chunks that are not needed
+
+        Returns:
+            Buffered chunk files covering the last window_s seconds, oldest
+            first (empty for passing tests); the caller moves them out of the buffer
+        """
+        tracing = self.context.tracing
+        kept: List[Path] = []
+        try:
+            if failed:
+                now = time.monotonic()
+                last = self._chunk_path()
+                tracing.stop_chunk(path=str(last))
+                self.chunks.append(TraceChunk(last, self.chunk_started, now))
+                kept = [c.path for c in self.chunks if c.ended >= now - self.window_s]
+            else:
+                tracing.stop_chunk()
+            tracing.stop()
+        except PlaywrightError as e:
+            log.debug(f"Trace could not be stopped: {e}")
+
+        for chunk in self.chunks:
+            if chunk.path not in kept:
+                chunk.path.unlink(missing_ok=True)
+        self.chunks.clear()
+        return [path for path in kept if path.exists()]
+
+
+class TraceRecorder:
+    """
+    Traces every instrumented context of the running test
+
+    Time spent in tracing calls on the test thread is measured per test and
+    aggregated in a LatencyHistogram for the terminal summary.
+
+    Example:
+        tracer.configure('ring', window_s=30, chunk_s=5)
+        tracer.attach(context, nodeid)
+        ...
+        chunks = tracer.finish(failed=True)
+    """
+
+    def __init__(self):
+        self.mode = 'off'
+        self.window_s = 30.0
+        self.chunk_s = 5.0
+        self.traces: Dict[BrowserContext, ContextTrace] = {}
+        self.overhead = LatencyHistogram()
+        self.test_overhead_ns = 0
+        self.persisted_bytes = 0
+        self.discarded_tests = 0
+        self._buffer_dir: Optional[Path] = None
+        self._rotating = False
+
+    def configure(self, mode: str, window_s: float = 30.0, chunk_s: float = 5.0):
+        """
+        Args:
+            mode: 'off', 'full' (whole test kept on failure) or 'ring' (last window_s seconds)
+            window_s: Seconds of trace kept before a failure
+            chunk_s: Chunk length; smaller chunks bound the kept window more tightly but rotate more often
+        """
+        if mode not in TRACE_MODES:
+            raise ValueError(f"Unknown trace mode '{mode}', expected one of {TRACE_MODES}")
+        self.mode, self.window_s, self.chunk_s = mode, window_s, chunk_s
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != 'off'
+
+    @property
+    def buffer_dir(self) -> Path:
+        if self._buffer_dir is None:
+            self._buffer_dir = Path(tempfile.mkdtemp(prefix="trace-ring-", dir=_buffer_root()))
+        return self._buffer_dir
+
+    def attach(self, context: BrowserContext, label: str):
+        """Start tracing a context for the running test (once per context)"""
+        if not self.enabled or context in self.traces:
+            return
+        started = time.perf_counter_ns()
+        trace = ContextTrace(context, label, self.mode, self.window_s, self.chunk_s, self.buffer_dir)
+        trace.start()
+        self.traces[context] = trace
+        if self.mode == 'ring':
+            # Tests that drive the page directly never reach a page-object step boundary
+            context.on("requestfinished", self.maybe_rotate)
+            context.on("page", self._watch_page)
+            for page in context.pages:
+                self._watch_page(page)
+        self.test_overhead_ns += time.perf_counter_ns() - started
+
+    def _watch_page(self, page):
+        page.on("framenavigated", self.maybe_rotate)
+
+    def _unwatch(self, context: BrowserContext):
+        try:
+            context.remove_listener("requestfinished", self.maybe_rotate)
+            context.remove_listener("page", self._watch_page)
+            for page in context.pages:
+                page.remove_listener("framenavigated", self.maybe_rotate)
+        except (PlaywrightError, ValueError, KeyError) as e:
+            log.debug(f"Trace rotation listeners not removed: {e}")
+
+    def maybe_rotate(self, *_):
+        """Rotate chunks that are due (at page-object step boundaries, finished requests and navigations)"""
+        if self.mode != 'ring' or not self.traces or self._rotating:
+            return
+        started = time.perf_counter_ns()
+        now = time.monotonic()
+        # Events dispatched while a chunk is being stopped must not rotate it again
+        self._rotating = True
+        try:
+            for trace in list(self.traces.values()):
+                try:
+                    trace.maybe_rotate(now)
+                except PlaywrightError as e:
+                    log.debug(f"Trace chunk rotation failed: {e}")
+        finally:
+            self._rotating = False
+        self.test_overhead_ns += time.perf_counter_ns() - started
+
+    def finish(self, failed: bool) -> List[Path]:
+        """
+        End the test's traces
+
+        Returns:
+            Buffered trace chunks of a failed test, to be persisted by the caller
+        """
+        if not self.traces:
+            return []
+        started = time.perf_counter_ns()
+        traces, self.traces = self.traces, {}
+        kept = []
+        for context, trace in traces.items():
+            if self.mode == 'ring':
+                self._unwatch(context)
+            kept.extend(trace.finish(failed))
+        self.test_overhead_ns += time.perf_counter_ns() - started
+
+        self.overhead.record(self.test_overhead_ns // 1000)
+        self.test_overhead_ns = 0
+        if kept:
+            self.persisted_bytes += sum(p.stat().st_size for p in kept)
+        else:
+            self.discarded_tests += 1
+        return kept
+
+    def summary(self) -> Dict:
+        return {
+            'mode': self.mode,
+            'tests': self.overhead.count,
+            'discarded': self.discarded_tests,
+            'persisted_mb': round(self.persisted_bytes / 1024 / 1024, 2),
+            'overhead_ms': self.overhead.summary(percentiles=(50, 95)),
+        }
+
+    def to_dict(self) -> Dict:
+        return {
+            'overhead': self.overhead.to_dict(),
+            'persisted_bytes': self.persisted_bytes,
+            'discarded_tests': self.discarded_tests,
+        }
+
+    def merge_dict(self, data: Dict):
+        """Fold in the totals saved by another process (e.g. an xdist worker)"""
+        self.overhead.merge(LatencyHistogram.from_dict(data['overhead']))
+        self.persisted_bytes += data['persisted_bytes']
+        self.discarded_tests += data['discarded_tests']
+
+    def close(self):
+        if self._buffer_dir is not None:
+            shutil.rmtree(self._buffer_dir, ignore_errors=True)
+            self._buffer_dir = None
+
+
+# Process-wide tracer, configured by tests/conftest.py
+tracer = TraceRecorder()